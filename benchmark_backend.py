@@ -0,0 +1,96 @@
+"""
+File: benchmark_backend.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    Benchmark the frame time of the signal monitor with the qpainter and the opengl backends,
+    it runs headless on the offscreen platform.
+
+    Usage:
+        python benchmark_backend.py [--software]
+
+    The --software uses the Mesa's software rasterizer for the opengl backend.
+    The opengl backend falls back to the qpainter if it is not available,
+    the actually used backend is reported as the 'used' of the results.
+    The results are printed and saved into log/benchmark-backend.json.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import sys
+
+from util import logger, root_path, project_conf
+from util.benchmark_tools import use_offscreen_platform, run_curve_frames, summarize_frame_times, save_results
+
+use_offscreen_platform()
+
+# The software flag is required before the QApplication is created in the util.qt_widget
+software_opengl = '--software' in sys.argv
+project_conf['display']['backend']['software_opengl'] = software_opengl
+
+from util.qt_widget import SignalMonitorWidget, app  # noqa
+from util.gl_backend import backend_options  # noqa
+
+from rich import print
+
+window_length = project_conf['display']['window_length_seconds']
+frames = 300
+output_path = root_path.joinpath('log/benchmark-backend.json')
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+def benchmark(backend: str) -> dict:
+    """
+    Draw the curves frame by frame with the backend.
+
+    Args:
+        backend (str): The backend, one of ['qpainter', 'opengl'].
+
+    Returns:
+        dict: The summary of the frame times, and the used backend.
+    """
+    widget = SignalMonitorWidget(backend=backend)
+    widget.resize(1280, 720)
+    widget.show()
+
+    frame_times = run_curve_frames(widget, window_length, frames)
+
+    used = widget.backend
+    widget.close()
+    widget.deleteLater()
+    app.processEvents()
+
+    return dict(used=used, **summarize_frame_times(frame_times))
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+if __name__ == '__main__':
+    results = dict(software_opengl=software_opengl)
+    for backend in backend_options:
+        results[backend] = benchmark(backend)
+        logger.info(f'Benchmark {backend}: {results[backend]}')
+        print(backend, results[backend])
+
+    save_results(results, output_path)
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
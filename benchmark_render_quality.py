@@ -0,0 +1,96 @@
+"""
+File: benchmark_render_quality.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    Benchmark the frame time of the monitor curves at 20 s, 120 s and 600 s windows,
+    with the configured rendering-quality policy and the naive one
+    (no clipping, no downsampling, antialiased).
+
+    Usage:
+        python benchmark_render_quality.py
+
+    The results are printed and saved into log/benchmark-render-quality.json.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+from util import logger, root_path
+from util.benchmark_tools import use_offscreen_platform, run_curve_frames, summarize_frame_times, save_results
+
+use_offscreen_platform()
+
+from util.qt_widget import SignalMonitorWidget, app  # noqa
+from util.render_quality import RenderQualityPolicy  # noqa
+
+from rich import print
+
+window_lengths = [20, 120, 600]  # Seconds
+frames = 300
+output_path = root_path.joinpath('log/benchmark-render-quality.json')
+
+policies = dict(
+    configured=RenderQualityPolicy(),
+    naive=RenderQualityPolicy(
+        clip_to_view=False, auto_downsample=False, antialias=True),
+)
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+def benchmark(policy: RenderQualityPolicy, window_length: float) -> dict:
+    """
+    Draw the curve1 and curve2 frame by frame, the window slides with the new samples.
+
+    Args:
+        policy (RenderQualityPolicy): The rendering-quality policy;
+        window_length (float): The window length in seconds.
+
+    Returns:
+        dict: The summary of the frame times.
+    """
+    widget = SignalMonitorWidget(render_quality=policy)
+    widget.resize(1280, 720)
+    widget.show()
+
+    frame_times = run_curve_frames(widget, window_length, frames)
+
+    widget.close()
+    widget.deleteLater()
+    app.processEvents()
+
+    return summarize_frame_times(frame_times)
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+if __name__ == '__main__':
+    results = {}
+    for name, policy in policies.items():
+        for window_length in window_lengths:
+            key = f'{name}-{window_length}s'
+            results[key] = benchmark(policy, window_length)
+            logger.info(f'Benchmark {key}: {results[key]}')
+            print(key, results[key])
+
+    save_results(results, output_path)
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
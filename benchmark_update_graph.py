@@ -0,0 +1,137 @@
+"""
+File: benchmark_update_graph.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The headless benchmark harness of the UserInterfaceWidget.update_graph,
+    it runs on the offscreen platform without the device and the display.
+    The synthetic windows are fed into the update_graph for every display mode,
+    and the per-mode frame-time statistic is saved into json.
+
+    Usage:
+        python benchmark_update_graph.py [--frames 300] [--output log/benchmark-update-graph.json]
+
+    The frame time covers the update_graph and the grab (paint) of the signal monitor.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import time
+import argparse
+
+from util import logger, root_path, project_conf
+from util.benchmark_tools import use_offscreen_platform, synthetic_samples, synthetic_delay_samples, summarize_frame_times, save_results
+
+use_offscreen_platform()
+
+from util.qt_widget import UserInterfaceWidget, app, scenes  # noqa
+
+from rich import print
+
+fps = project_conf['display']['target_fps']
+sample_rate = project_conf['device']['sample_rate']
+delay_seconds = project_conf['display']['delay_seconds']
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+def benchmark(widget: UserInterfaceWidget, display_mode: str, frames: int) -> dict:
+    """
+    Feed the synthetic windows into the update_graph in the display mode.
+
+    Args:
+        widget (UserInterfaceWidget): The widget;
+        display_mode (str): The display mode, one of UserInterfaceWidget.display_modes;
+        frames (int): The frames count.
+
+    Returns:
+        dict: The summary of the frame times, and the count of the skipped widget state calls.
+    """
+    widget.display_inputs['display_mode'].setCurrentText(display_mode)
+    # The window starts full, so the animation starts updating at its end
+    widget.next_animation_update_seconds = widget.window_length_seconds + \
+        widget.animation_time_step_length
+    widget.signal_monitor_widget.clear_curves()
+    app.processEvents()
+
+    monitor = widget.signal_monitor_widget
+    skipped = monitor.retained.skipped
+
+    step = max(1, sample_rate // fps)
+    n_window = int(widget.window_length_seconds * sample_rate)
+    k = int(delay_seconds * sample_rate)
+
+    samples = synthetic_samples(
+        widget.window_length_seconds + frames * step / sample_rate)
+    samples_delay = synthetic_delay_samples(samples)
+
+    frame_times = []
+    for i in range(frames):
+        # The window is full and slides with the new samples
+        stop = n_window + i * step
+        pairs = samples[max(0, stop - n_window):stop]
+        stop_delay = max(0, stop - k + 1)
+        pairs_delay = samples_delay[max(0, stop_delay - n_window):stop_delay]
+
+        tic = time.perf_counter()
+        widget.update_graph(pairs, pairs_delay)
+        monitor.grab()
+        frame_times.append(time.perf_counter() - tic)
+
+        # The animations are loaded in the background threads
+        app.processEvents()
+
+    return dict(
+        skipped_state_calls=monitor.retained.skipped - skipped,
+        **summarize_frame_times(frame_times))
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Headless benchmark of the update_graph')
+    parser.add_argument('--frames', type=int, default=300,
+                        help='The frames count of every display mode')
+    parser.add_argument('--output', type=str,
+                        default=root_path.joinpath(
+                            'log/benchmark-update-graph.json').as_posix(),
+                        help='The output json file')
+    args = parser.parse_args()
+
+    widget = UserInterfaceWidget(app)
+    widget.resize(1600, 900)
+    widget.show()
+
+    # The scenes are created lazily, they are ready before the benchmark
+    scenes.wait()
+
+    results = {}
+    for display_mode in widget.display_modes:
+        results[display_mode] = benchmark(widget, display_mode, args.frames)
+        logger.info(f'Benchmark {display_mode}: {results[display_mode]}')
+        print(display_mode, results[display_mode])
+
+    save_results(results, args.output)
+
+    widget.close()
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
@@ -0,0 +1,44 @@
+"""
+File: conftest.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The util resolves the root_path from the sys.argv[0], like the app.py does,
+    so the tests run as the app.py in the project folder.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import sys
+from pathlib import Path
+
+project_path = Path(__file__).parent.parent
+
+sys.argv[0] = project_path.joinpath('app.py').as_posix()
+sys.path.insert(0, project_path.as_posix())
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
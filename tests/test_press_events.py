@@ -0,0 +1,139 @@
+"""
+File: test_press_events.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The offline press events of the saved data.json equal the live events,
+    the live detector receives the same samples split across batches.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import json
+
+import numpy as np
+import pytest
+
+from util.press_events import PressEventDetector, detect_press_events
+
+# The sampling interval of the saved data, it is re-aligned into 8 ms
+interval = 0.008
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+def mk_pressure(seed: int = 0) -> np.ndarray:
+    """
+    The pressure values of the presses.
+    The second press dips into the hysteresis band and goes on,
+    the noise makes the values wander around the thresholds.
+    """
+    rng = np.random.default_rng(seed)
+
+    def ramp(a, b, seconds):
+        return np.linspace(a, b, int(seconds / interval), endpoint=False)
+
+    def hold(v, seconds):
+        return np.full(int(seconds / interval), float(v))
+
+    values = np.concatenate([
+        hold(0, 0.5),
+        ramp(0, 200, 0.4), hold(200, 1.0), ramp(200, 0, 0.4),
+        hold(0, 0.5),
+        ramp(0, 150, 0.3), hold(150, 0.5), ramp(150, 40, 0.2),
+        hold(40, 0.3), ramp(40, 180, 0.2), hold(180, 0.6), ramp(180, 0, 0.3),
+        hold(0, 0.5),
+    ])
+    return values + rng.normal(0, 2, len(values))
+
+
+@pytest.fixture
+def saved_data(tmp_path) -> list:
+    """
+    The data.json as it is saved by the experiment,
+    the row is (pressure_value, digital_value, fake_pressure_value, fake_digital_value, timestamp).
+    """
+    values = mk_pressure()
+    ts = np.arange(len(values)) * interval
+    data = [[v, v * 10, v, v * 10, t] for v, t in zip(values, ts)]
+
+    file = tmp_path.joinpath('data.json')
+    json.dump(data, open(file, 'w'))
+    return json.load(open(file))
+
+
+def detect_live(data: list, bounds: list) -> list:
+    """
+    Detect the events as the samples arrive in batches.
+
+    Args:
+        data (list): The saved data;
+        bounds (list): The indexes splitting the data into the batches.
+
+    Returns:
+        list: The events.
+    """
+    detector = PressEventDetector()
+    edges = [0] + sorted(bounds) + [len(data)]
+    for a, b in zip(edges[:-1], edges[1:]):
+        batch = np.asarray(data[a:b], dtype=np.float64).reshape(-1, 5)
+        detector.detect(batch[:, 0], batch[:, -1])
+    return detector.events
+
+
+def band_bounds(data: list) -> list:
+    """The indexes of the samples inside the hysteresis band, every batch boundary is inside it."""
+    values = np.asarray(data)[:, 0]
+    inside = (values > PressEventDetector.release_threshold) & (
+        values < PressEventDetector.onset_threshold)
+    return list(np.flatnonzero(inside))
+
+
+def test_saved_data_has_events(saved_data):
+    names = [e['name'] for e in detect_press_events(saved_data)]
+    assert names.count('onset') == 2
+    assert names.count('release') == 2
+    assert 'plateau' in names
+
+
+@pytest.mark.parametrize('size', [1, 2, 7, 8, 9, 50, 1000])
+def test_live_equals_offline_fixed_batches(saved_data, size):
+    bounds = list(range(size, len(saved_data), size))
+    assert detect_live(saved_data, bounds) == detect_press_events(saved_data)
+
+
+def test_live_equals_offline_boundary_in_band(saved_data):
+    bounds = band_bounds(saved_data)
+    assert bounds
+
+    offline = detect_press_events(saved_data)
+
+    # Every boundary inside the band, one at a time
+    for bound in bounds:
+        assert detect_live(saved_data, [bound]) == offline
+
+    # All of them together
+    assert detect_live(saved_data, bounds) == offline
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
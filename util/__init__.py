@@ -50,7 +50,33 @@ setup = dict(
         min_value=-10,  # g
         ref_value=500,  # g
 
-        display_ref_flag=True
+        display_ref_flag=True,
+
+        target_fps=60,  # Hz, the render clock, one of [30, 60, 120]
+
+        render_quality=dict(
+            clip_to_view=True,  # Draw the samples inside the xRange only
+            auto_downsample=True,  # Downsample to the plot's pixel width
+            downsample_method='peak',  # One of ['peak', 'mean', 'subsample']
+            auto_downsample_factor=1.0,  # Points per pixel
+            antialias=dict(
+                curve1=False,  # The realtime curve, it is dense
+                curve2=False,  # The delayed curve, it is dense
+                curve3=True,  # The reference line, it has only two points
+            ),
+        ),
+
+        backend=dict(
+            name='qpainter',  # One of ['qpainter', 'opengl'], the opengl falls back to qpainter if it is not available
+            software_opengl=False,  # Use the Mesa's software rasterizer for the opengl
+        ),
+
+        latency_overlay=dict(
+            enabled=False,  # Show the frame-time and latency overlay
+            frames=240,  # The statistic covers the last frames
+            refresh_seconds=0.5,  # Seconds, the refresh interval of the overlay text
+            budget_ms=50,  # ms, the latency budget of the feedback
+        ),
     ),
     device=dict(
         sample_rate=125,  # Hz
@@ -67,6 +93,33 @@ setup = dict(
             Hide='H',  # Feedback is hided
             NA='--'  # Not available
         )
+    ),
+    metrics=dict(
+        zone_width=50,  # g, the target zone is ref_value +/- zone_width
+        percentiles=[5, 25, 50, 75, 95],  # %, estimated by streaming sketch
+    ),
+    events=dict(
+        onset_threshold=50,  # g, the press starts above it
+        release_threshold=30,  # g, the press stops below it
+        plateau_rate=100,  # g/s, the press is steady below it
+        rate_lag=8,  # points, the lag of the force rate
+    ),
+    animation=dict(
+        frame_cache_mb=256,  # MB, the budget of the rendered frames cache
+        warm_up_steps=[-10, 10],  # The score steps of the next updates, they are built in the background
+        loader_workers=4,  # The workers of the pool decoding the images at startup
+        render_workers=4,  # The workers of the pool rendering the frames of the updates
+        disk_cache=dict(
+            enabled=True,  # Whether the decoded frames are cached on the disk
+            folder='cache/frames',  # The folder of the cached .npy stacks, it is relative to the root
+        ),
+        # The scenes (display modes) created at startup, the others are created as they are selected,
+        # like ['Animation fit', 'Cat leaves submarine', 'Cat climbs tree']
+        preload_scenes=[],
+        resize_debounce_ms=300,  # ms, the animations are resized as the size is settled for it
+        # The filter resizing the assets from their mipmap pyramids,
+        # one of nearest, box, bilinear, hamming, bicubic and lanczos
+        resize_filter='bicubic',
     )
 )
 
@@ -0,0 +1,129 @@
+"""
+File: animation_scheduler.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The single long-lived scheduler of the animation jobs.
+    The jobs (the score updates and the frame making) are queued in the deque,
+    and they are run in order by the one worker thread,
+    so the animations are never updated by two threads at the same time,
+    and no thread is created per update.
+    The job with the key replaces the pending job with the same key,
+    it is used for the jobs that only the latest one matters, like the warming up.
+    The background jobs, like the warming up, run only if no other job is pending,
+    and the long one checks the yielding() to give way to the updates.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import threading
+import traceback
+
+from collections import deque
+
+from . import logger
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+class AnimationScheduler(object):
+    """
+    The single-worker scheduler of the animation jobs.
+
+    @submit(fn, *args, key=None, background=False) (method): Queue the job, the worker is started on the first job;
+    @pending() (method): The count of the pending jobs, the background jobs are not counted;
+    @yielding() (method): Whether the running background job should give way to the pending jobs;
+    @jobs (deque): The pending jobs, the element is [key, fn, args];
+    @background_jobs (deque): The pending background jobs, they run as the jobs are empty;
+    @done, replaced, failed (int): The counts.
+    """
+
+    def __init__(self, name: str = 'animation-scheduler'):
+        self.name = name
+        self.jobs = deque()
+        self.background_jobs = deque()
+        self._cond = threading.Condition()
+        self._worker = None
+        self.done = 0
+        self.replaced = 0
+        self.failed = 0
+        logger.debug(f'Initialized {self.__class__}')
+
+    def pending(self) -> int:
+        return len(self.jobs)
+
+    def yielding(self) -> bool:
+        return bool(self.jobs)
+
+    def submit(self, fn, *args, key=None, background=False):
+        """
+        Queue the job.
+
+        Args:
+            fn (callable): The job;
+            *args: The arguments of the job;
+            key (hashable, optional): The pending job with the same key is replaced. Defaults to None, never replace;
+            background (bool, optional): Whether the job runs only as no other job is pending. Defaults to False.
+        """
+        with self._cond:
+            jobs = self.background_jobs if background else self.jobs
+
+            if key is not None:
+                for job in jobs:
+                    if job[0] == key:
+                        job[1], job[2] = fn, args
+                        self.replaced += 1
+                        return
+
+            jobs.append([key, fn, args])
+
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._loop, name=self.name, daemon=True)
+                self._worker.start()
+
+            self._cond.notify()
+
+    def _loop(self):
+        logger.debug(f'Started {self.name}')
+        while True:
+            with self._cond:
+                while not self.jobs and not self.background_jobs:
+                    self._cond.wait()
+                jobs = self.jobs or self.background_jobs
+                _, fn, args = jobs.popleft()
+
+            try:
+                fn(*args)
+                self.done += 1
+            except Exception:
+                self.failed += 1
+                logger.error(
+                    f'Failed animation job {fn}: {traceback.format_exc()}')
+
+
+# The scheduler shared by the animations
+animation_scheduler = AnimationScheduler()
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
@@ -0,0 +1,116 @@
+"""
+File: asset_loader.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The loading of the image assets at startup.
+    - The JPEG is decoded with the draft() at the nearest DCT scale above the target size,
+      so the full-size image is never decoded;
+    - The images are decoded in the shared bounded thread pool;
+    - The load time of every asset is recorded into the load_times and logged.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import time
+import threading
+import contextlib
+
+from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+
+from . import logger, project_conf
+
+# The pool decoding the images, it is shared by the asset sets
+asset_pool = ThreadPoolExecutor(
+    max_workers=project_conf['animation']['loader_workers'],
+    thread_name_prefix='asset-loader')
+
+# The load times of the assets, in seconds
+load_times = {}
+_load_times_lock = threading.Lock()
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+@contextlib.contextmanager
+def timed(name: str):
+    """
+    Record the load time of the asset into the load_times.
+
+    Args:
+        name (str): The name of the asset.
+    """
+    tic = time.perf_counter()
+    try:
+        yield
+    finally:
+        cost = time.perf_counter() - tic
+        with _load_times_lock:
+            load_times[name] = cost
+        logger.info(f'Loaded {name} in {cost:.3f} seconds')
+
+
+def open_image(path, size: tuple = None, mode: str = 'RGB') -> Image:
+    """
+    Open and decode the image,
+    the JPEG is drafted to the nearest scale above the size, and resized into the size.
+
+    Args:
+        path (Path or str): The path;
+        size (tuple, optional): The (width, height). Defaults to None, the original size;
+        mode (str, optional): The mode. Defaults to 'RGB'.
+
+    Returns:
+        Image: The loaded image.
+    """
+    img = Image.open(path)
+
+    # Only the JPEG supports the draft, it is ignored for the others
+    if size is not None and img.format == 'JPEG':
+        img.draft(mode, size)
+
+    img = img.convert(mode)
+
+    if size is not None and img.size != tuple(size):
+        img = img.resize(size)
+
+    return img
+
+
+def load_images(paths: list, size: tuple = None, mode: str = 'RGB') -> list:
+    """
+    Load the images in the shared pool.
+
+    Args:
+        paths (list): The paths;
+        size (tuple, optional): The (width, height). Defaults to None;
+        mode (str, optional): The mode. Defaults to 'RGB'.
+
+    Returns:
+        list: The images, in the order of the paths.
+    """
+    return list(asset_pool.map(lambda p: open_image(p, size, mode), paths))
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
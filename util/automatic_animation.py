@@ -19,18 +19,36 @@ Functions:
 # %% ---- 2024-04-19 ------------------------
 # Requirements and constants
 import time
-import contextlib
+import threading
+import traceback
 import numpy as np
 
-from PIL import ImageFont, Image, ImageDraw
+from collections import deque
+from PIL import ImageFont, Image
 
 from . import root_path, logger
+from .frame_upload import flip_frame
 
 
 # %% ---- 2024-04-19 ------------------------
 # Function and class
 
 class AutomaticAnimation(object):
+    """
+    The animation plays the frames on the display's frame clock.
+
+    @play(frames) (method): Start playing the frames, it replaces the playing frames;
+    @play_stream(futures) (method): Start playing the frames as they are rendered, it replaces the playing frames;
+    @stop_playing() (method): Stop playing, the current frame is kept;
+    @advance(now) (method): Advance the playback to the elapsed time, it is called as the display draws;
+    @prepare_size(width, height) (method): Prepare the resources for the size and switch into it, it is run by the animation scheduler;
+    @tiny_window_curves(ref, data, block_name) (method): The curves of the tiny window, they are drawn above the image;
+    @frame (np.ndarray): The pre-flipped array of the current frame, it is uploaded into the display;
+    @frame_size (tuple): The (width, height) of the current frame;
+    @fifo_buffer (deque): The pre-flipped arrays of the frames to play;
+    @dropped (int): The count of the dropped frames, since they are late.
+    """
+
     width = 800
     height = 600
 
@@ -38,82 +56,155 @@ class AutomaticAnimation(object):
         root_path.joinpath('font/MSYHL.ttc').as_posix(),
         size=width//20)
 
-    interval = 50  # ms, 50 ms refers 20 frames per second
-    img = Image.new(mode='RGB', size=(width, height))
-    fifo_buffer = []
+    interval = 50  # ms, the duration of the frame, 50 ms refers 20 frames per second
+    frame = flip_frame(Image.new(mode='RGB', size=(width, height)))
+
+    def __init__(self):
+        self.fifo_buffer = deque()
+
+        # The start time and the count of the consumed frames of the playback
+        self.play_tic = 0.0
+        self.played = 0
+        self.dropped = 0
 
-    animating_flag = False
+        # The playback id and the futures of the streaming frames,
+        # the frames of the replaced playback are discarded
+        self._playback_id = 0
+        self._stream_futures = ()
 
-    @contextlib.contextmanager
-    def _safe_animating_flag(self):
-        try:
-            self.animating_flag = True
-            yield
-        finally:
-            self.animating_flag = False
+        # The frames are made by the scheduler and played by the display
+        # It is reentrant, since the cancelled future calls back in the cancelling thread
+        self._playback_lock = threading.RLock()
 
-    def animating_loop(self):
+    def play(self, frames: list):
         """
-        Perform animation by shifting the buffer.
-        It keeps going in its own path, regardless others.
+        Start playing the frames, it replaces the playing frames.
+        The i-th frame is due at i * interval after the start.
+        The frames are pre-flipped here, so the display only uploads them.
 
-        ! The process updates the self.img in its own pace,
-        ! so the UI only needs to fetch the self.img in UI's own pace.
+        Args:
+            frames (list): The frames.
+        """
+        buffer = deque(flip_frame(img) for img in frames)
+        with self._playback_lock:
+            self._replace_playback()
+            self.fifo_buffer = buffer
+            self.play_tic = time.perf_counter()
+            self.played = 0
+
+    def play_stream(self, futures: list):
+        """
+        Start playing the frames as they are rendered, it replaces the playing frames.
+        The frames stream into the fifo_buffer in order as soon as each is ready,
+        and the playback starts as the first frame is ready.
 
         Args:
-            self: The ScoreAnimation instance.
+            futures (list): The futures of the pre-flipped arrays, in the order of the frames.
+        """
+        pending = deque(futures)
+
+        with self._playback_lock:
+            playback_id = self._replace_playback()
+            self._stream_futures = tuple(futures)
+            self.fifo_buffer = deque()
+            self.played = 0
+
+        def _on_done(_):
+            with self._playback_lock:
+                if playback_id != self._playback_id:
+                    return
+
+                while pending and pending[0].done():
+                    future = pending.popleft()
+                    if future.cancelled():
+                        continue
+                    try:
+                        frame = future.result()
+                    except Exception:
+                        logger.error(
+                            f'Failed rendering frame: {traceback.format_exc()}')
+                        continue
+
+                    if self.played == 0 and not self.fifo_buffer:
+                        self.play_tic = time.perf_counter()
+                    self.fifo_buffer.append(frame)
+
+        for future in futures:
+            future.add_done_callback(_on_done)
+
+    def _replace_playback(self) -> int:
+        """
+        Replace the playback, the frames of the replaced playback are not rendered or played.
+        ! It is called with the _playback_lock.
 
         Returns:
-            None
-
-        Examples:
-            anim = ScoreAnimation()
-            anim._animating()
+            int: The id of the new playback.
         """
-
-        secs = self.interval / 1000
-
-        # Prevent repeated animation
-        if self.animating_flag:
-            logger.debug('Animating already on the loop')
-            return
-
-        with self._safe_animating_flag():
-            logger.debug('Start animating')
-            while self._shift() is not None:
-                time.sleep(secs)
-            logger.debug('Finished animating')
-
-    def _shift(self):
+        self._playback_id += 1
+        stale, self._stream_futures = self._stream_futures, ()
+        for future in stale:
+            future.cancel()
+        return self._playback_id
+
+    def stop_playing(self):
+        with self._playback_lock:
+            self._replace_playback()
+            self.fifo_buffer = deque()
+
+    @property
+    def frame_size(self) -> tuple:
+        """The (width, height) of the current frame."""
+        height, width = self.frame.shape[:2]
+        return width, height
+
+    def advance(self, now: float = None) -> np.ndarray:
         """
-        Shifts the score by popping an image from the stack and updating the current image.
+        Advance the playback to the elapsed time, it is called on the display's frame clock.
+        The frames before the due frame are dropped,
+        so the slow display never delays the end state.
 
         Args:
-            self: The ScoreAnimation instance.
+            now (float, optional): The perf_counter(). Defaults to None, use the current.
 
         Returns:
-            img: The popped image from the stack, or None if the stack is empty.
+            np.ndarray: The pre-flipped array of the current frame.
         """
+        with self._playback_lock:
+            if not self.fifo_buffer:
+                return self.frame
 
-        img = self._pop()
-        if img is not None:
-            self.img = img
-        return img
+            if now is None:
+                now = time.perf_counter()
 
-    def _pop(self):
-        """
-        Pops an image from the buffer.
+            # The count of the due frames, which are not consumed yet
+            due = int((now - self.play_tic) * 1000 / self.interval) + 1
+            n = min(due - self.played, len(self.fifo_buffer))
+            if n <= 0:
+                return self.frame
 
-        Args:
-            self: The ScoreAnimation instance.
+            for _ in range(n-1):
+                self.fifo_buffer.popleft()
+            self.frame = self.fifo_buffer.popleft()
+            self.played += n
+            self.dropped += n-1
 
-        Returns:
-            img: The popped image from the buffer, or None if the buffer is empty.
+            return self.frame
+
+    def prepare_size(self, width: int, height: int):
         """
+        Prepare the resources for the size and switch into it,
+        the sub-classes render their resources for the size before they call it,
+        so the old resources are used until the new ones are ready.
 
-        if len(self.fifo_buffer) > 0:
-            return self.fifo_buffer.pop(0)
-        return
+        ! It is run by the animation scheduler, so the frames are never made in the meanwhile.
+
+        Args:
+            width (int): The width;
+            height (int): The height.
+        """
+        self.width = width
+        self.height = height
+        logger.debug(f'Switched {self.__class__.__name__} into {(width, height)}')
 
     def _scale_x_ratio(self, x: float) -> int:
         return int(x * self.width)
@@ -129,7 +220,9 @@ class AutomaticAnimation(object):
         # The pos of the tiny window
         # By design, the data is plotted in the y-axis linearly.
         # The ref equals to the half_height
-        # The ratio values refer the ratios of the image
+        # The ratio values refer the ratios of the image,
+        # the current frame is used, since its size may differ from the size in switching
+        width, height = self.frame_size
         x_offset = 0.7
         y_offset = 0.5
         window_width = 0.2
@@ -140,76 +233,75 @@ class AutomaticAnimation(object):
         x_array = xy_array[:, 0]
         x_array *= window_width
         x_array += x_offset
-        x_array *= self.width
+        x_array *= width
 
         y_array = xy_array[:, 1]
         y_array -= ref
         y_array /= -200
         y_array *= height_of_200g
         y_array += y_offset
-        y_array *= self.height
+        y_array *= height
 
         return xy_array
 
-    def tiny_window(self, ref=0, data=None, block_name='Real'):
+    def _parse_tiny_window_data(self, ref=0, data=None):
         """
-        Creates a tiny-window widget by drawing reference and real-time curves on the given image.
-
-        Args:
-            self: The ScoreAnimation instance.
-            img: The image to draw the curves on.
-            ref (int, optional): The reference value. Defaults to 0.
-            pairs (list, optional): List of value pairs. Each pair represents a point on the real-time curve. Defaults to None.
+        Parse the data of the tiny window.
 
         Returns:
-            img: The image with the reference and real-time curves drawn.
-
-        Examples:
-            anim = ScoreAnimation()
-            img = Image.new('RGB', (800, 600))
-            img = anim.tiny_window(img, ref=10, pairs=[(5,), (8,), (12,)])
+            tuple: The x array in [0, 1], the avg. array and the latest std.
         """
-
-        # Parse the input pairs
-        # If pairs is None, only draw the ref
-        if data is None:
+        # If pairs is None or contain no data, only draw the ref
+        if data is None or len(data) == 0:
             data = [(ref, 0, 0), (ref, 0, 0)]
 
-        # If pairs contain no data, only draw the ref
-        if len(data) == 0:
-            data = [(ref, 0, 0), (ref, 0, 0)]
+        data = np.asarray(data)
 
         # If pairs contain only one point, make it two
         if len(data) == 1:
-            data.append(data[0])
-
-        data = np.array(data)
+            data = np.concatenate([data, data])
 
         n = len(data)
         x = np.linspace(0, 1, n)
-        avg_y = data[:, 0]
-        std_latest = data[-1, 1]
+        return x, data[:, 0], data[-1, 1]
 
-        # Where the tiny window is drawn
-        img = self.img.copy()
-        draw = ImageDraw.Draw(img, mode='RGB')
+    def tiny_window_curves(self, ref=0, data=None, block_name='Real') -> dict:
+        """
+        The curves of the tiny window in the coordinates of the displayed image,
+        the y-axis is upward, since the image is flipped as it is displayed.
+        They are drawn as the plot items above the image,
+        so the image is not redrawn for the tiny window.
+
+        Args:
+            ref (int, optional): The reference value. Defaults to 0.
+            data (list, optional): The (avg, std, ...) rows of the real-time curve. Defaults to None.
+            block_name (str, optional): The block name, the avg. and std. are hidden in the 'Hide' block. Defaults to 'Real'.
 
-        # Draw the reference line
-        draw.line(self._scale_value_to_tiny_window(
-            np.array([[0, ref], [1, ref]]), ref=ref), fill='green')
+        Returns:
+            dict: The (x, y) arrays of the 'ref', 'avg' and 'std' curves, the arrays of the hidden curves are empty.
+        """
+        def flip(xy):
+            return xy[:, 0], self.frame_size[1] - xy[:, 1]
+
+        empty = (np.zeros(0), np.zeros(0))
+        curves = dict(
+            ref=flip(self._scale_value_to_tiny_window(
+                np.array([[0, ref], [1, ref]]), ref=ref)),
+            avg=empty,
+            std=empty)
 
         if block_name != 'Hide':
-            # Draw the avg. curve
+            x, avg_y, std_latest = self._parse_tiny_window_data(ref, data)
+
             xy = np.concatenate(
                 [x[:, np.newaxis], avg_y[:, np.newaxis]], axis=1)
-            draw.line(self._scale_value_to_tiny_window(
-                xy, ref=ref), fill='red')
+            curves['avg'] = flip(
+                self._scale_value_to_tiny_window(xy, ref=ref))
 
-            # Draw the std. range
-            draw.line(self._scale_value_to_tiny_window(
-                np.array([[1, ref-std_latest], [1, ref+std_latest]]), ref=ref), fill='gray')
+            curves['std'] = flip(self._scale_value_to_tiny_window(
+                np.array([[1, ref-std_latest], [1, ref+std_latest]]), ref=ref))
 
-        return img
+        return curves
 
 
 # %% ---- 2024-04-19 ------------------------
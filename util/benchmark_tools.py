@@ -0,0 +1,193 @@
+"""
+File: benchmark_tools.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The shared tools of the benchmark scripts.
+    - The synthetic pressure samples, they are the reader's buffer rows;
+    - The summary of the measured frame times.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import os
+import json
+import time
+import numpy as np
+
+from pathlib import Path
+
+from . import logger, project_conf
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+def use_offscreen_platform():
+    """
+    Use the offscreen Qt platform unless the QT_QPA_PLATFORM is set,
+    it is required to be called before the QApplication is created.
+    """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+def synthetic_samples(seconds: float, ref_value: float = None, sample_rate: int = None, seed: int = 0) -> np.ndarray:
+    """
+    The synthetic samples of the presses around the ref_value.
+
+    Args:
+        seconds (float): The length of the samples;
+        ref_value (float, optional): The pressure of the press. Defaults to the configured ref_value;
+        sample_rate (int, optional): The sample rate. Defaults to the configured sample_rate;
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        np.ndarray: The samples, the shape is (n, 5),
+            the row is (pressure, digital, fake_pressure, fake_digital, timestamp) as the reader's buffer.
+    """
+    if ref_value is None:
+        ref_value = project_conf['display']['ref_value']
+    if sample_rate is None:
+        sample_rate = project_conf['device']['sample_rate']
+
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+
+    # The press lasts for 2 seconds in every 4 seconds
+    value = ref_value * np.clip(2 * np.sin(2 * np.pi * t / 4), 0, 1)
+    value += rng.normal(0, 5, len(t))
+    fake = value * 0.9
+
+    return np.stack([value, value, fake, fake, t], axis=1)
+
+
+def synthetic_delay_samples(samples: np.ndarray, delay_seconds: float = None, sample_rate: int = None) -> np.ndarray:
+    """
+    The synthetic buffer_delay of the samples,
+    it is the moving avg. and std. of the last delay_seconds, as the reader computes.
+
+    Args:
+        samples (np.ndarray): The samples of synthetic_samples();
+        delay_seconds (float, optional): The delay. Defaults to the configured delay_seconds;
+        sample_rate (int, optional): The sample rate. Defaults to the configured sample_rate.
+
+    Returns:
+        np.ndarray: The buffer_delay, the shape is (n, 5),
+            the row is (avg-pressure, fake-avg-pressure, std-pressure, fake-std-pressure, timestamp).
+    """
+    if delay_seconds is None:
+        delay_seconds = project_conf['display']['delay_seconds']
+    if sample_rate is None:
+        sample_rate = project_conf['device']['sample_rate']
+
+    k = int(delay_seconds * sample_rate)
+    values = samples[:, [0, 2]]
+    if len(values) < k:
+        return np.zeros((0, 5))
+
+    # The moving sums, the i-th row covers the values[i:i+k]
+    c1 = np.cumsum(np.vstack([np.zeros((1, 2)), values]), axis=0)
+    c2 = np.cumsum(np.vstack([np.zeros((1, 2)), values ** 2]), axis=0)
+    avg = (c1[k:] - c1[:-k]) / k
+    std = np.sqrt(np.maximum((c2[k:] - c2[:-k]) / k - avg ** 2, 0))
+    t = samples[k-1:, 4] - delay_seconds
+
+    return np.column_stack([avg, std, t])
+
+
+def summarize_frame_times(frame_times: list) -> dict:
+    """
+    The summary of the frame times.
+
+    Args:
+        frame_times (list): The frame times in seconds.
+
+    Returns:
+        dict: The summary in milliseconds, the keys are [frames, mean, p50, p95, max].
+    """
+    ms = np.asarray(frame_times, dtype=np.float64) * 1000
+    if len(ms) == 0:
+        return dict(frames=0, mean=0.0, p50=0.0, p95=0.0, max=0.0)
+    return dict(
+        frames=len(ms),
+        mean=float(np.mean(ms)),
+        p50=float(np.percentile(ms, 50)),
+        p95=float(np.percentile(ms, 95)),
+        max=float(np.max(ms)),
+    )
+
+
+def run_curve_frames(widget, window_length: float, frames: int = 300, fps: int = None, sample_rate: int = None) -> list:
+    """
+    Draw the curve1 and curve2 of the SignalMonitorWidget frame by frame,
+    the window slides with the new samples as the realtime display.
+
+    Args:
+        widget (SignalMonitorWidget): The widget, it is shown;
+        window_length (float): The window length in seconds;
+        frames (int, optional): The frames count. Defaults to 300;
+        fps (int, optional): The frame rate. Defaults to the configured target_fps;
+        sample_rate (int, optional): The sample rate. Defaults to the configured sample_rate.
+
+    Returns:
+        list: The frame times in seconds, the frame time covers the curve update and the widget.grab().
+    """
+    if fps is None:
+        fps = project_conf['display']['target_fps']
+    if sample_rate is None:
+        sample_rate = project_conf['device']['sample_rate']
+
+    step = max(1, sample_rate // fps)
+    n_window = int(window_length * sample_rate)
+    samples = synthetic_samples(
+        window_length + frames * step / sample_rate, sample_rate=sample_rate)
+
+    frame_times = []
+    for i in range(frames):
+        stop = n_window + i * step
+        pairs = samples[max(0, stop - n_window):stop]
+
+        tic = time.perf_counter()
+        widget.update_curve1(pairs)
+        widget.update_curve2(pairs)
+        widget.set_x_range(pairs[0, -1], pairs[-1, -1], padding=0)
+        widget.grab()
+        frame_times.append(time.perf_counter() - tic)
+
+    return frame_times
+
+
+def save_results(results: dict, path: Path):
+    """
+    Save the benchmark results into the json file.
+
+    Args:
+        results (dict): The results;
+        path (Path): The json file path.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    json.dump(results, open(path, 'w'), indent=2)
+    logger.info(f'Saved benchmark results: {path}')
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
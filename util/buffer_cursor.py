@@ -0,0 +1,78 @@
+"""
+File: buffer_cursor.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The cursor on the reader's buffer,
+    the consumers read only the samples appended since their last read.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+class BufferCursor(object):
+    """
+    The cursor on the growing buffer.
+
+    @read(buffer, stop) (method): Read the rows appended since the last read;
+    @position (int): The count of rows already read;
+    @restarted (bool): Whether the last read restarted from 0, since the buffer was replaced.
+
+    ! The reader replaces its buffer with a new list as it restarts,
+    ! the cursor restarts from 0 in that case.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._source = None
+        self.position = 0
+        self.restarted = False
+
+    def read(self, buffer: list, stop: int = None) -> list:
+        """
+        Read the new rows of the buffer.
+
+        Args:
+            buffer (list): The growing buffer;
+            stop (int, optional): Read the rows until the stop index. Defaults to None, read all the rows.
+
+        Returns:
+            list: The rows appended since the last read.
+        """
+        self.restarted = buffer is not self._source
+        if self.restarted:
+            self._source = buffer
+            self.position = 0
+
+        n = len(buffer) if stop is None else min(stop, len(buffer))
+        rows = buffer[self.position:n]
+        self.position = n
+        return rows
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
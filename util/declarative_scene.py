@@ -0,0 +1,391 @@
+"""
+File: declarative_scene.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The declarative scene of the feedback animation, it is described by the YAML or JSON file in the conf/scenes.
+    - The tracks are the frame sequences, the frame is chosen by the score;
+    - The images are the layers, the mask keys out their pixels;
+    - The backgrounds are the static layers, they are flattened once for the size;
+    - The states map the score into the background and the poses of the sprites.
+    The scene is rendered by the shared layer compositor in the render pool,
+    so only the dirty rectangles of the sprites are redrawn for every frame.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import numpy as np
+
+from PIL import Image
+from omegaconf import OmegaConf
+
+from . import logger, root_path
+from .automatic_animation import AutomaticAnimation
+from .layer_compositor import Layer, LayerCompositor, ResizedFrames, compose_image, rgb_array
+from .mipmap import MipmapPyramid
+from .asset_loader import asset_pool, load_images, open_image, timed
+from .disk_frame_cache import disk_frame_cache
+from .frame_renderer import render_frames
+
+# The folder of the scene descriptions
+scenes_folder = root_path.joinpath('conf/scenes')
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+def white_key_mask(img: Image) -> Image:
+    """
+    The L mode mask keying out the near-white pixels.
+
+    Args:
+        img (Image): The image.
+
+    Returns:
+        Image: The mask, the near-white pixels are 0, the others are 255.
+    """
+    mat = np.array(img.convert('L'))
+    return Image.fromarray(np.where(mat < 250, 255, 0).astype(np.uint8), mode='L')
+
+
+# The masks of the images, by their names in the description
+masks = dict(
+    white=white_key_mask,
+)
+
+
+def map_score(mapping: dict, score: float) -> float:
+    """
+    Map the score into the pose value.
+
+    Args:
+        mapping (dict): The map, it is None for 0, or the dict of the map, scale and ratio, the value is
+            - linear: ratio * score / scale;
+            - saturate: ratio * (1 - exp(-|score / scale|));
+        score (float): The score.
+
+    Returns:
+        float: The value.
+    """
+    if mapping is None:
+        return 0.0
+
+    x = score / mapping.get('scale', 1)
+    ratio = mapping.get('ratio', 1)
+    kind = mapping.get('map', 'linear')
+
+    if kind == 'linear':
+        return ratio * x
+
+    if kind == 'saturate':
+        return ratio * (1 - np.exp(-np.abs(x)))
+
+    raise ValueError(f'Unknown map: {kind}')
+
+
+def score_trajectory(score1: float, score2: float, n_frames: int) -> list:
+    """
+    The scores of the frames from the score1 to the score2.
+
+    Args:
+        score1 (float): The score before;
+        score2 (float): The score after;
+        n_frames (int): The steps between them.
+
+    Returns:
+        list: The scores, it is [score1] if they are equal.
+    """
+    diff = score2 - score1
+
+    # Handle the both conditions of diff == 0 and diff != 0
+    if diff == 0:
+        return [score1]
+    return list(np.arange(score1, score2+diff/n_frames/2, diff/n_frames))
+
+
+def check_description(description: dict):
+    """
+    Check the names and the maps of the description.
+
+    Args:
+        description (dict): The description.
+
+    Raises:
+        ValueError: The description is invalid.
+    """
+    for key in ['name', 'folder', 'images', 'states']:
+        if key not in description:
+            raise ValueError(f'Missing {key} in the scene description')
+
+    images = description['images']
+    tracks = description.get('tracks', {})
+    backgrounds = description.get('backgrounds', {})
+
+    for name, image in images.items():
+        if image.get('mask') is not None and image['mask'] not in masks:
+            raise ValueError(f'Unknown mask of the image {name}: {image["mask"]}')
+
+    for name, layer_names in backgrounds.items():
+        for layer_name in layer_names:
+            if layer_name not in images:
+                raise ValueError(f'Unknown image of the background {name}: {layer_name}')
+
+    for name, state in description['states'].items():
+        background = state.get('background')
+        if isinstance(background, dict):
+            if background.get('track') not in tracks:
+                raise ValueError(f'Unknown track of the state {name}: {background.get("track")}')
+            map_score(background.get('index'), 0)
+        elif background not in backgrounds:
+            raise ValueError(f'Unknown background of the state {name}: {background}')
+
+        for sprite in state.get('sprites', []):
+            if sprite.get('image') not in images:
+                raise ValueError(f'Unknown image of the sprite in the state {name}: {sprite.get("image")}')
+            map_score(sprite.get('dx'), 0)
+            map_score(sprite.get('dy'), 0)
+
+
+def load_scene_description(path) -> dict:
+    """
+    Load and check the scene description.
+
+    Args:
+        path (Path or str): The YAML or JSON file, the relative path is in the scenes_folder.
+
+    Returns:
+        dict: The description.
+    """
+    description = OmegaConf.to_container(
+        OmegaConf.load(scenes_folder.joinpath(path)), resolve=True)
+    check_description(description)
+    return description
+
+
+class DeclarativeScene(AutomaticAnimation):
+    """
+    The scene rendered from its description.
+
+    @load_scene(description) (method): Load the description and its tracks and images;
+    @mk_frames(state_before, state_after, block_name) (method): Make the frames of the update, they are played as they are rendered;
+    @prepare_size(width, height) (method): Build the backgrounds, the sprites and the track frames for the size, and switch into it;
+    @scene_file (str): The description file, in the scenes_folder;
+    @description (dict): The description;
+    @tracks (dict): The ResizedFrames of the tracks;
+    @images (dict): The MipmapPyramid of the RGBA images, their sources are in the original size;
+    @backgrounds (dict): The flattened static backgrounds for the layers_size;
+    @sprites (dict): The premultiplied layers of the sprites for the layers_size.
+    """
+
+    scene_file = None
+    n_frames = 10  # The steps of the update
+
+    # The backgrounds and the sprites are built for the size
+    layers_size = None
+
+    def load_scene(self, description: dict = None):
+        """
+        Load the description and its tracks and images.
+        They are mapped from the disk cache, or loaded in the shared pool.
+        The track frames are drafted and resized into the image size,
+        the images are kept in their original size, so their mipmap pyramids are built from the full resolution.
+
+        Args:
+            description (dict, optional): The description. Defaults to None, load the scene_file.
+        """
+        if description is None:
+            description = load_scene_description(self.scene_file)
+        else:
+            check_description(description)
+
+        self.description = description
+        self.n_frames = description.get('n_frames', self.n_frames)
+
+        name = description['name']
+        folder = root_path.joinpath(description['folder'])
+
+        # --------------------
+        # ! The relative small size of the image
+        # ! The aim is to minimize the working load of the imaging
+        image_size = (self.width, self.height)
+
+        # --------------------
+        # Load the tracks
+        tracks = {}
+        for track_name, track in description.get('tracks', {}).items():
+            start = track.get('start', 1)
+            paths = [folder.joinpath(track['files'].format(j+start))
+                     for j in range(track['count'])]
+            with timed(f'{name}/{track_name}'):
+                stack = disk_frame_cache.load_stack(
+                    f'{name}-{track_name}', paths, image_size,
+                    lambda: np.stack([np.asarray(e) for e in load_images(paths, image_size)]))
+            tracks[track_name] = ResizedFrames(stack)
+            logger.debug(f'Loaded {len(stack)} frames of {name}/{track_name}')
+
+        # --------------------
+        # Load the images in their original size
+        images = list(description['images'].values())
+        with timed(f'{name}/images'):
+            pyramids = list(asset_pool.map(
+                lambda i: self._load_image(folder, f'{name}-image{i}', images[i]), range(len(images))))
+        logger.debug(f'Loaded images of {name}')
+
+        # --------------------
+        # Update variables
+        self.image_size = image_size
+        self.tracks = tracks
+        # The images are resized from their mipmap pyramids as the size changes
+        self.images = dict(zip(description['images'], pyramids))
+        self.layers_size = None
+
+    def _load_image(self, folder, cache_name: str, image: dict) -> MipmapPyramid:
+        """
+        Load the image in its original size, its mask is its alpha.
+        The RGBA image is mapped from the disk cache, or built and cached,
+        it is the source level of the pyramid.
+
+        Args:
+            folder (Path): The folder of the scene;
+            cache_name (str): The name of the image in the disk cache;
+            image (dict): The description of the image.
+
+        Returns:
+            MipmapPyramid: The pyramid of the RGBA image.
+        """
+        path = folder.joinpath(image['file'])
+        mode = image.get('mode', 'RGB')
+        mask = image.get('mask')
+
+        def _build():
+            img = open_image(path, None, mode)
+            rgba = img.convert('RGBA')
+            if mask is not None:
+                rgba.putalpha(masks[mask](img))
+                logger.debug(f'Generated {mask} mask of {image["file"]}')
+            return np.asarray(rgba)[np.newaxis]
+
+        stack = disk_frame_cache.load_stack(
+            cache_name, [path], None, _build, variant=f'{mode}-{mask}')
+        return MipmapPyramid(stack[0])
+
+    def _build_layers(self, image_size: tuple):
+        """
+        Build the flattened backgrounds and the premultiplied sprites for the image size,
+        they are rebuilt only if the image size changes.
+
+        Args:
+            image_size (tuple): The (width, height).
+        """
+        if self.layers_size == image_size:
+            return
+
+        compositor = LayerCompositor(image_size)
+        backgrounds = {}
+        for name, (bottom, *layer_names) in self.description.get('backgrounds', {}).items():
+            backgrounds[name] = compositor.compose(
+                rgb_array(self.images[bottom], image_size),
+                [(Layer(self.images[k], image_size), 0, 0) for k in layer_names]).copy()
+
+        sprite_names = {sprite['image']
+                        for state in self.description['states'].values()
+                        for sprite in state.get('sprites', [])}
+        sprites = {k: Layer(self.images[k], image_size) for k in sprite_names}
+
+        # Swap them in together
+        (self.backgrounds, self.sprites,
+         self.layers_size) = (backgrounds, sprites, image_size)
+        logger.debug(f'Built layers for {image_size}')
+
+    def prepare_size(self, width: int, height: int):
+        """
+        Build the backgrounds, the sprites and the track frames for the size,
+        and switch into the size as they are ready.
+
+        ! It is run by the animation scheduler.
+
+        Args:
+            width (int): The width;
+            height (int): The height.
+        """
+        image_size = (width, height)
+        self._build_layers(image_size)
+        for track in self.tracks.values():
+            track.prepare(image_size)
+        super().prepare_size(width, height)
+
+    def mk_frames(self, state_before: dict, state_after: dict, block_name: str = 'Real'):
+        """
+        Make the frames of the update,
+        they are rendered in the render pool and played as they are ready.
+
+        Args:
+            state_before (dict): The state before the update, it has the 'state' and the scores;
+            state_after (dict): The state after the update;
+            block_name (str, optional): The block name, the 'Hide' state is drawn in the 'Hide' block. Defaults to 'Real'.
+        """
+        image_size = (self.width, self.height)
+        self._build_layers(image_size)
+        backgrounds, sprites, tracks = self.backgrounds, self.sprites, self.tracks
+        width, height = image_size
+
+        state = self.description['states'].get(
+            'Hide' if block_name == 'Hide' else state_after['state'])
+
+        if state is None:
+            self.play_stream([])
+            return
+
+        scores = [0]
+        if state.get('score') is not None:
+            score1 = state_before[state['score']]
+            score2 = state_after[state['score']]
+
+            # At least make the score2 of the same sign with the score1,
+            # it prevents the sprites up and down
+            if state.get('keep_sign') and score1 * score2 < 0:
+                score2 *= -1
+
+            scores = score_trajectory(score1, score2, self.n_frames)
+
+        background = state['background']
+
+        def render(score):
+            if isinstance(background, dict):
+                # The last frame of the track is never chosen, as the original scenes
+                track = tracks[background['track']]
+                n = len(track.images)
+                idx = int((n-2) * map_score(background.get('index'), score))
+                bg = track.get(min(max(idx, 0), n-1), image_size)
+            else:
+                bg = backgrounds[background]
+
+            return compose_image(bg, [
+                (sprites[sprite['image']],
+                 int(map_score(sprite.get('dx'), score) * width),
+                 int(map_score(sprite.get('dy'), score) * height))
+                for sprite in state.get('sprites', [])])
+
+        self.play_stream(render_frames(render, [(score,) for score in scores]))
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
@@ -0,0 +1,233 @@
+"""
+File: disk_frame_cache.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The persistent on-disk cache of the decoded and resized animation frames.
+    The frames are saved as the uint8 .npy stack, and they are memory-mapped at the warm start,
+    so the images are not decoded again.
+    The entry is keyed by the hash of the source files plus the target size,
+    so the entry is invalidated automatically as the files in the img/ are changed,
+    and the stale entries of the same name are removed as the new entry is saved.
+    The digests of the files are kept in the manifest with their sizes and mtimes,
+    so the file is read and hashed only as its size or mtime changes.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import os
+import json
+import hashlib
+import threading
+import numpy as np
+
+from pathlib import Path
+
+from . import logger, project_conf, root_path
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+def file_digest(path: Path) -> str:
+    """
+    The hash of the file, its content and name are hashed.
+
+    Args:
+        path (Path): The path.
+
+    Returns:
+        str: The hex digest.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(path.name.encode())
+    h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+class DiskFrameCache(object):
+    """
+    The on-disk cache of the frame stacks.
+
+    @load_stack(name, paths, size, build) (method): Map the cached stack, or build and save it;
+    @source_hash(paths) (method): The hash of the source files, the unchanged files are not read;
+    @folder (Path): The cache folder;
+    @enabled (bool): Whether the cache is enabled, the stack is always built if not.
+    """
+
+    folder = root_path.joinpath(project_conf['animation']['disk_cache']['folder'])
+    enabled = project_conf['animation']['disk_cache']['enabled']
+
+    def __init__(self, folder: Path = None, enabled: bool = None):
+        if folder is not None:
+            self.folder = Path(folder)
+        if enabled is not None:
+            self.enabled = enabled
+
+        # The manifest of the file digests, {path: [size, mtime_ns, digest]}, it is loaded as it is used
+        self._manifest = None
+        self._manifest_dirty = False
+        self._manifest_lock = threading.Lock()
+        logger.debug(f'Initialized {self.__class__} in {self.folder}')
+
+    def _load_manifest(self) -> dict:
+        if self._manifest is None:
+            try:
+                self._manifest = json.loads(
+                    self.folder.joinpath('manifest.json').read_text())
+            except Exception:
+                self._manifest = {}
+        return self._manifest
+
+    def _save_manifest(self):
+        try:
+            self.folder.mkdir(parents=True, exist_ok=True)
+            path = self.folder.joinpath('manifest.json')
+            tmp = path.with_suffix('.tmp')
+            tmp.write_text(json.dumps(self._manifest))
+            os.replace(tmp, path)
+        except Exception as err:
+            logger.warning(f'Failed saving the manifest of the cache: {err}')
+
+    def _file_digest(self, path: Path) -> str:
+        """
+        The digest of the file, it is hashed only if its size or mtime changes.
+
+        Args:
+            path (Path): The path.
+
+        Returns:
+            str: The hex digest.
+        """
+        key = str(path.resolve())
+        stat = path.stat()
+        meta = [stat.st_size, stat.st_mtime_ns]
+
+        with self._manifest_lock:
+            entry = self._load_manifest().get(key)
+            if entry is not None and entry[:2] == meta:
+                return entry[2]
+
+        digest = file_digest(path)
+
+        with self._manifest_lock:
+            self._manifest[key] = meta + [digest]
+            self._manifest_dirty = True
+
+        return digest
+
+    def source_hash(self, paths: list) -> str:
+        """
+        The hash of the source files, their contents and names are hashed.
+
+        Args:
+            paths (list): The paths.
+
+        Returns:
+            str: The hex digest.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        for path in paths:
+            h.update(self._file_digest(Path(path)).encode())
+
+        # The changed digests are saved once for the files
+        with self._manifest_lock:
+            if self._manifest_dirty:
+                self._save_manifest()
+                self._manifest_dirty = False
+
+        return h.hexdigest()
+
+    def path(self, name: str, paths: list, size: tuple, variant: str = None) -> Path:
+        """
+        The path of the entry.
+
+        Args:
+            name (str): The name of the stack;
+            paths (list): The source files;
+            size (tuple): The (width, height), or None for the original size;
+            variant (str, optional): How the stack is built from the files, it is hashed with them. Defaults to None.
+
+        Returns:
+            Path: The path.
+        """
+        size_text = 'original' if size is None else f'{size[0]}x{size[1]}'
+        digest = self.source_hash(paths)
+        if variant is not None:
+            digest = hashlib.blake2b(
+                f'{digest}-{variant}'.encode(), digest_size=16).hexdigest()
+        return self.folder.joinpath(f'{name}-{size_text}-{digest}.npy')
+
+    def load_stack(self, name: str, paths: list, size: tuple, build, variant: str = None) -> np.ndarray:
+        """
+        Map the cached stack, or build and save it if it is not cached.
+
+        Args:
+            name (str): The name of the stack;
+            paths (list): The source files, they key the entry;
+            size (tuple): The (width, height), or None for the original size;
+            build (callable): It builds the uint8 stack, the shape is (n, height, width, channels);
+            variant (str, optional): How the stack is built from the files, it keys the entry too. Defaults to None.
+
+        Returns:
+            np.ndarray: The stack, it is read-only memory-mapped if it is cached.
+        """
+        if not self.enabled:
+            return build()
+
+        path = self.path(name, paths, size, variant)
+
+        if path.is_file():
+            try:
+                stack = np.load(path, mmap_mode='r')
+                logger.debug(f'Mapped cached frames {path}')
+                return stack
+            except Exception as err:
+                logger.warning(f'Failed mapping cached frames {path}: {err}')
+
+        stack = np.ascontiguousarray(build(), dtype=np.uint8)
+
+        try:
+            self.folder.mkdir(parents=True, exist_ok=True)
+
+            # The stale entries of the name are removed
+            for stale in self.folder.glob(f'{name}-*.npy'):
+                if stale != path:
+                    stale.unlink()
+
+            # Save into the temporary file and replace, so the entry is never partial
+            tmp = path.with_suffix('.tmp')
+            with open(tmp, 'wb') as f:
+                np.save(f, stack)
+            os.replace(tmp, path)
+            logger.debug(f'Saved cached frames {path}')
+        except Exception as err:
+            logger.warning(f'Failed saving cached frames {path}: {err}')
+
+        return stack
+
+
+# The cache shared by the animations
+disk_frame_cache = DiskFrameCache()
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
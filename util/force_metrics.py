@@ -0,0 +1,350 @@
+"""
+File: force_metrics.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    Incremental derived-force metrics,
+    the force rate (dF/dt), impulse (integral of F dt), time-in-target-zone,
+    overshoot and coefficient of variation are updated in O(1) per sample.
+    The per-block summary statistics (n, mean, std, min, max and percentiles)
+    are computed online as well, the percentiles come from the P-square sketch.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import numpy as np
+
+from collections import deque
+
+from . import logger, project_conf
+from .buffer_cursor import BufferCursor
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+class P2Quantile(object):
+    """
+    The streaming quantile estimator with the P-square algorithm,
+    it keeps 5 markers, so it costs O(1) memory and time per sample.
+
+    Ref: Jain & Chlamtac, The P2 algorithm for dynamic calculation of quantiles and histograms without storing observations, 1985.
+
+    @update(x) (method): Update the estimator with the new sample;
+    @value() (method): The estimated quantile.
+    """
+
+    def __init__(self, p: float):
+        self.p = p
+        self._heap = []
+
+        # The heights and positions of the markers
+        self.q = None
+        self.n = [0, 1, 2, 3, 4]
+        # The desired positions of the markers and their increments
+        self.desired = [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+        self.increment = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def update(self, x: float):
+        # Collect the first 5 samples as the markers
+        if self.q is None:
+            self._heap.append(x)
+            if len(self._heap) == 5:
+                self.q = sorted(self._heap)
+            return
+
+        q = self.q
+        n = self.n
+
+        # Find the cell k that contains x, and extend the extreme markers
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increment[i]
+
+        # Adjust the heights of the middle markers
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                qp = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+                    (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if not q[i - 1] < qp < q[i + 1]:
+                    # The parabolic prediction is out of order, use the linear one
+                    qp = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = qp
+                n[i] += d
+
+    def value(self) -> float:
+        if self.q is not None:
+            return float(self.q[2])
+        if not self._heap:
+            return float('nan')
+        return float(np.percentile(self._heap, self.p * 100))
+
+
+class ForceMetrics(object):
+    """
+    The derived-force metrics of a single block.
+
+    @update(value, t) (method): Update the metrics with the new sample, it costs O(1);
+    @snapshot() (method): Read the metrics as a dict.
+
+    - The mean and std are updated with the Welford's method;
+    - The percentiles are estimated with the P2Quantile sketch;
+    - The impulse is the trapezoidal integral of the force;
+    - The time_in_zone counts the seconds of |value - ref_value| <= zone_width.
+    """
+
+    percentiles = project_conf['metrics']['percentiles']
+
+    def __init__(self, ref_value: float, zone_width: float):
+        self.ref_value = ref_value
+        self.zone_width = zone_width
+
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+        self.sketches = [P2Quantile(p / 100) for p in self.percentiles]
+
+        self.trough = np.inf
+        self.peak = -np.inf
+        self.rate = 0.0
+        self.peak_rate = 0.0
+        self.impulse = 0.0
+        self.duration = 0.0
+        self.time_in_zone = 0.0
+
+        self._last_value = None
+        self._last_t = None
+
+    def update(self, value: float, t: float):
+        """
+        Update the metrics with the new sample.
+
+        Args:
+            value (float): The pressure value;
+            t (float): The timestamp in seconds.
+        """
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (value - self.mean)
+
+        if value > self.peak:
+            self.peak = value
+        if value < self.trough:
+            self.trough = value
+
+        for sketch in self.sketches:
+            sketch.update(value)
+
+        if self._last_t is not None:
+            dt = t - self._last_t
+            if dt > 0:
+                self.rate = (value - self._last_value) / dt
+                self.peak_rate = max(self.peak_rate, abs(self.rate))
+                self.impulse += (value + self._last_value) * dt / 2
+                self.duration += dt
+                if abs(value - self.ref_value) <= self.zone_width:
+                    self.time_in_zone += dt
+
+        self._last_value = value
+        self._last_t = t
+
+    @property
+    def std(self) -> float:
+        if self.n < 2:
+            return 0.0
+        return float(np.sqrt(self._m2 / self.n))
+
+    @property
+    def cv(self) -> float:
+        if self.mean == 0:
+            return 0.0
+        return self.std / abs(self.mean)
+
+    @property
+    def overshoot(self) -> float:
+        if self.n == 0:
+            return 0.0
+        return max(0.0, self.peak - self.ref_value)
+
+    def snapshot(self) -> dict:
+        empty_flag = self.n == 0
+        return dict(
+            n=self.n,
+            mean=float(self.mean),
+            std=float(self.std),
+            min=None if empty_flag else float(self.trough),
+            max=None if empty_flag else float(self.peak),
+            **{f'p{p}': None if empty_flag else sketch.value()
+               for p, sketch in zip(self.percentiles, self.sketches)},
+            cv=float(self.cv),
+            rate=float(self.rate),
+            peak_rate=float(self.peak_rate),
+            impulse=float(self.impulse),
+            duration=float(self.duration),
+            time_in_zone=float(self.time_in_zone),
+            overshoot=float(self.overshoot),
+            ref_value=float(self.ref_value),
+        )
+
+
+class MetricsStage(object):
+    """
+    The metrics stage fed with the new samples of the reader.
+    The live metrics are frozen into the block as the samples pass its stop,
+    so the samples after the stop are always counted in the next block.
+
+    @start_blocks(blocks) (method): Start the blocks, the metrics are frozen into them in order;
+    @feed(buffer) (method): Consume the samples appended to the buffer since the last feed;
+    @update(rows) (method): Consume the new samples;
+    @freeze(block) (method): Freeze the live metrics into the block, and start a new one;
+    @finish() (method): Freeze the live metrics into the on-going block, and drop the remaining blocks;
+    @summary() (method): The frozen metrics of the blocks, it is saved with the session;
+    @live (dict): The metrics of the current block for every column, readable at any time;
+    @frozen (dict): The frozen metrics, keyed by the block idx.
+
+    - The buffer's row is
+        (pressure_value, digital_value, fake_pressure_value, fake_digital_value, timestamp)
+    - The metrics are computed separately for the real and fake columns
+    """
+
+    zone_width = project_conf['metrics']['zone_width']  # g
+    columns = dict(real=0, fake=2)
+
+    def __init__(self, ref_value: float = project_conf['display']['ref_value']):
+        self.ref_value = ref_value
+        self.cursor = BufferCursor()
+        self.reset()
+        logger.debug(f'Initialized {self.__class__}')
+
+    def reset(self):
+        self.frozen = {}
+        self.live = self._new_live()
+        self.blocks = deque()
+        self.cursor.reset()
+
+    def start_blocks(self, blocks: list):
+        """
+        Start the blocks, the previous metrics are discarded.
+
+        Args:
+            blocks (list): The blocks from BlockManager, in the order of their stops.
+        """
+        self.reset()
+        self.blocks = deque(blocks)
+
+    def _new_live(self) -> dict:
+        return {k: ForceMetrics(self.ref_value, self.zone_width) for k in self.columns}
+
+    def set_ref_value(self, ref_value: float):
+        self.ref_value = ref_value
+        for metrics in self.live.values():
+            metrics.ref_value = ref_value
+
+    def feed(self, buffer: list):
+        """
+        Consume the new samples of the buffer.
+
+        Args:
+            buffer (list): The reader's buffer.
+        """
+        self.update(self.cursor.read(buffer))
+
+    def update(self, rows: list):
+        """
+        Consume the new samples.
+
+        Args:
+            rows (list): The new samples, the row is the same as the reader's buffer.
+        """
+        i, n = 0, len(rows)
+        while i < n:
+            # Split the rows at the stop of the current block,
+            # the sample is after the block as its timestamp exceeds the stop, the same as BlockManager.consume
+            j = n
+            if self.blocks:
+                stop = self.blocks[0]['stop']
+                j = i
+                while j < n and not rows[j][-1] > stop:
+                    j += 1
+
+            live = [(metrics, self.columns[k])
+                    for k, metrics in self.live.items()]
+            for row in rows[i:j]:
+                for metrics, column in live:
+                    metrics.update(row[column], row[-1])
+
+            if j < n:
+                self.freeze(self.blocks.popleft())
+            i = j
+
+    def freeze(self, block: dict):
+        """
+        Freeze the live metrics into the block.
+
+        Args:
+            block (dict): The block from BlockManager.
+        """
+        self.frozen[block['idx']] = dict(
+            name=block['name'],
+            start=block['start'],
+            stop=block['stop'],
+            **{k: metrics.snapshot() for k, metrics in self.live.items()})
+        logger.debug(
+            f'Froze metrics of block {block["idx"]}: {self.frozen[block["idx"]]}')
+        self.live = self._new_live()
+
+    def finish(self):
+        """
+        Freeze the live metrics into the on-going block, and drop the remaining blocks.
+        """
+        if self.blocks:
+            self.freeze(self.blocks.popleft())
+        self.blocks.clear()
+
+    def summary(self) -> dict:
+        """
+        The per-block summary, keyed by the block idx.
+
+        Returns:
+            dict: {idx: {name, start, stop, real: {...}, fake: {...}}}
+        """
+        return {str(idx): block for idx, block in sorted(self.frozen.items())}
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
@@ -0,0 +1,136 @@
+"""
+File: frame_cache.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The byte-budgeted LRU cache of the rendered animation frames,
+    the least recently used frames are evicted when the bytes exceed the budget.
+    It is thread-safe, since the frames are built in the background threads.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import threading
+
+from collections import OrderedDict
+
+from . import logger
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+def image_nbytes(img) -> int:
+    """
+    The bytes of the image.
+
+    Args:
+        img (PIL.Image or np.ndarray): The image.
+
+    Returns:
+        int: The bytes.
+    """
+    if hasattr(img, 'nbytes'):
+        return int(img.nbytes)
+    return img.width * img.height * len(img.getbands())
+
+
+class FrameCache(object):
+    """
+    The byte-budgeted LRU cache.
+
+    @get(key) (method): Get the frame, None if it is not cached;
+    @put(key, frame) (method): Put the frame, and evict the least recently used frames if the budget is exceeded;
+    @get_or_make(key, make) (method): Get the frame, or make and put it if it is not cached;
+    @budget_bytes (int): The budget;
+    @nbytes (int): The bytes of the cached frames;
+    @hits, misses, evictions (int): The counts.
+    """
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        logger.debug(
+            f'Initialized {self.__class__} with budget {budget_bytes} bytes')
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def __contains__(self, key) -> bool:
+        return key in self._frames
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+            self.nbytes = 0
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._frames:
+                self.misses += 1
+                return None
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return self._frames[key][0]
+
+    def put(self, key, frame):
+        nbytes = image_nbytes(frame)
+        with self._lock:
+            if key in self._frames:
+                self.nbytes -= self._frames.pop(key)[1]
+            self._frames[key] = (frame, nbytes)
+            self.nbytes += nbytes
+
+            # Keep the latest frame even if it alone exceeds the budget
+            while self.nbytes > self.budget_bytes and len(self._frames) > 1:
+                _, (_, n) = self._frames.popitem(last=False)
+                self.nbytes -= n
+                self.evictions += 1
+
+    def get_or_make(self, key, make):
+        """
+        Get the frame, or make and put it if it is not cached.
+
+        Args:
+            key (hashable): The key;
+            make (callable): It makes the frame, it is called without the lock.
+
+        Returns:
+            The frame.
+        """
+        frame = self.get(key)
+        if frame is None:
+            frame = make()
+            self.put(key, frame)
+        return frame
+
+    def stats(self) -> dict:
+        return dict(frames=len(self._frames), nbytes=self.nbytes, hits=self.hits,
+                    misses=self.misses, evictions=self.evictions)
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
@@ -0,0 +1,73 @@
+"""
+File: frame_renderer.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The parallel rendering of the animation frames.
+    The frames of the update are rendered in the shared render pool,
+    the resizing, the compositing and the flipping are done by the Pillow and the numpy,
+    they release the GIL, so the frames are rendered across the cores.
+    The futures are in the order of the frames,
+    so the animation plays them in order as soon as each is ready.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import numpy as np
+
+from concurrent.futures import ThreadPoolExecutor
+
+from . import project_conf
+from .frame_upload import flip_frame
+
+# The pool rendering the frames, it is shared by the animations
+render_pool = ThreadPoolExecutor(
+    max_workers=project_conf['animation']['render_workers'],
+    thread_name_prefix='frame-renderer')
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+def _render(render, args: tuple) -> np.ndarray:
+    frame = render(*args)
+    # The array is pre-flipped by the render, the image is flipped here
+    if isinstance(frame, np.ndarray):
+        return frame
+    return flip_frame(frame)
+
+
+def render_frames(render, args_list: list) -> list:
+    """
+    Render the frames in the render pool, they are pre-flipped for the display.
+
+    Args:
+        render (callable): It renders the frame from the args, and returns the image or the pre-flipped array;
+        args_list (list): The args of the frames, in the order of the frames.
+
+    Returns:
+        list: The futures of the pre-flipped arrays, in the order of the frames.
+    """
+    return [render_pool.submit(_render, render, args) for args in args_list]
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
@@ -0,0 +1,165 @@
+"""
+File: frame_stats.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The frame-time and end-to-end latency statistic of the display.
+    - render: the update time of the frame plus its paint time;
+    - delay: the time from the render clock's tick to the paint;
+    - age: the time from the acquisition of the newest drawn sample to the paint.
+    The recording writes into the ring arrays,
+    and the percentiles are computed only as the overlay refreshes,
+    so the cost is kept far below 1% of the frame time, it is measured as the overhead.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import time
+import numpy as np
+
+from . import project_conf
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+class FrameStats(object):
+    """
+    The frame-time and latency statistic.
+
+    @begin_frame() (method): Called as the render clock ticks, before the update;
+    @end_update(sample_time) (method): Called after the update, with the wall time of the newest drawn sample;
+    @painted(paint_start) (method): Called after the paint, it records the pending frame;
+    @summary() (method): The p50/p95/max of the last frames, in milliseconds;
+    @text() (method): The summary text of the overlay, it is refreshed every refresh_seconds;
+    @frames (int): The count of the kept frames;
+    @budget_ms (float): The latency budget, the age over it is marked;
+    @overhead (float): The cost of the statistic as a fraction of the frame time.
+    """
+
+    frames = project_conf['display']['latency_overlay']['frames']
+    refresh_seconds = project_conf['display']['latency_overlay']['refresh_seconds']
+    budget_ms = project_conf['display']['latency_overlay']['budget_ms']
+
+    names = ['render', 'delay', 'age']
+
+    def __init__(self, frames: int = None):
+        if frames is not None:
+            self.frames = frames
+        self.reset()
+
+    def reset(self):
+        # The rows are the names, the columns are the frames, in seconds
+        self.data = np.zeros((len(self.names), self.frames))
+        self.n = 0
+        self.overhead = 0.0
+        self._cost = 0.0
+        self._elapsed = 0.0
+        self._pending = False
+        self._tick = 0.0
+        self._updated = 0.0
+        self._sample_time = 0.0
+        self._text = '--'
+        self._text_tic = 0.0
+
+    def begin_frame(self):
+        self._tick = time.perf_counter()
+
+    def end_update(self, sample_time: float):
+        """
+        The update of the frame is finished, the paint is pending.
+
+        Args:
+            sample_time (float): The wall time (time.time()) of the newest drawn sample.
+        """
+        self._updated = time.perf_counter()
+        self._sample_time = sample_time
+        self._pending = True
+
+    def painted(self, paint_start: float):
+        """
+        The paint is finished, record the pending frame.
+
+        Args:
+            paint_start (float): The perf_counter() as the paint starts.
+        """
+        if not self._pending:
+            return
+
+        now = time.perf_counter()
+        self._pending = False
+
+        i = self.n % self.frames
+        self.data[0, i] = (self._updated - self._tick) + (now - paint_start)
+        self.data[1, i] = paint_start - self._tick
+        self.data[2, i] = time.time() - self._sample_time
+        self.n += 1
+
+        self._elapsed += now - self._tick
+        self._cost += time.perf_counter() - now
+
+    def summary(self) -> dict:
+        """
+        The p50/p95/max of the last frames.
+
+        Returns:
+            dict: The keys are the names, the values are dict(p50, p95, max) in milliseconds.
+        """
+        data = self.data[:, :min(self.n, self.frames)] * 1000
+        if data.shape[1] == 0:
+            return {name: dict(p50=0.0, p95=0.0, max=0.0) for name in self.names}
+
+        p50, p95 = np.percentile(data, [50, 95], axis=1)
+        mx = np.max(data, axis=1)
+        return {name: dict(p50=p50[j], p95=p95[j], max=mx[j])
+                for j, name in enumerate(self.names)}
+
+    def text(self) -> str:
+        """
+        The summary text of the overlay, it is cached for refresh_seconds.
+
+        Returns:
+            str: The text.
+        """
+        tic = time.perf_counter()
+        if tic - self._text_tic < self.refresh_seconds:
+            return self._text
+
+        summary = self.summary()
+        lines = ['p50 / p95 / max'] + [
+            f"{name}: {s['p50']:.1f} / {s['p95']:.1f} / {s['max']:.1f} ms"
+            for name, s in summary.items()]
+
+        if self._elapsed > 0:
+            self.overhead = self._cost / self._elapsed
+
+        over = summary['age']['p95'] > self.budget_ms
+        lines.append(
+            f"{'OVER' if over else 'within'} {self.budget_ms} ms | cost {self.overhead*100:.2f}%")
+
+        self._text = '\n'.join(lines)
+        self._text_tic = time.perf_counter()
+        self._cost += self._text_tic - tic
+        return self._text
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
@@ -0,0 +1,106 @@
+"""
+File: frame_upload.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The upload path of the animation frames into the pyqtgraph's ImageItem.
+    - The ImageItem is row-major, so the frame is used as (height, width, 3) without the transpose;
+    - The frames are pre-flipped as they are queued for playing,
+      since the y-axis of the plot is upward;
+    - The levels are fixed to (0, 255), so the ImageItem never scans the frame for the levels.
+    The pre-flipped contiguous uint8 frame is set as it is,
+    the other frames are copied into the reused buffer, it costs one memcpy.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import numpy as np
+
+from PIL import Image
+
+from . import logger
+
+levels = (0, 255)
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+def flip_frame(img: Image) -> np.ndarray:
+    """
+    The pre-flipped frame of the image.
+
+    Args:
+        img (Image): The image.
+
+    Returns:
+        np.ndarray: The upside-down RGB uint8 array, it is contiguous, the shape is (height, width, 3).
+    """
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    return np.ascontiguousarray(np.asarray(img, dtype=np.uint8)[::-1])
+
+
+def is_uploadable(frame: np.ndarray) -> bool:
+    """Whether the frame is set as it is, without the copy."""
+    return (frame.dtype == np.uint8 and frame.ndim == 3 and frame.shape[2] == 3
+            and frame.flags['C_CONTIGUOUS'])
+
+
+class FrameUploader(object):
+    """
+    The uploader of the frames into the row-major ImageItems.
+
+    @upload(items, frame, flipped) (method): Upload the frame into the items;
+    @buffer (np.ndarray): The reused buffer of the frames which are not uploadable as they are;
+    @copied (int): The count of the frames copied into the buffer.
+    """
+
+    def __init__(self):
+        self.buffer = None
+        self.copied = 0
+        logger.debug(f'Initialized {self.__class__}')
+
+    def upload(self, items: list, frame: np.ndarray, flipped: bool = True):
+        """
+        Upload the frame into the items.
+
+        Args:
+            items (list): The row-major ImageItems;
+            frame (np.ndarray): The RGB frame, the shape is (height, width, 3);
+            flipped (bool, optional): Whether the frame is pre-flipped. Defaults to True.
+        """
+        if not flipped:
+            frame = frame[::-1]
+
+        if not is_uploadable(frame):
+            if self.buffer is None or self.buffer.shape != frame.shape:
+                self.buffer = np.empty(frame.shape, dtype=np.uint8)
+            np.copyto(self.buffer, frame, casting='unsafe')
+            frame = self.buffer
+            self.copied += 1
+
+        for item in items:
+            item.setImage(frame, autoLevels=False, levels=levels)
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
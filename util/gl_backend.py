@@ -0,0 +1,125 @@
+"""
+File: gl_backend.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The drawing backend of the signal monitor.
+    - The 'qpainter' backend is the raster QPainter of the pg.PlotWidget;
+    - The 'opengl' backend puts the pg.PlotWidget on the QOpenGLWidget viewport,
+      so the scene is painted by Qt's OpenGL paint engine.
+    The 'opengl' backend falls back to 'qpainter' if no OpenGL context can be created.
+    The software OpenGL uses the Mesa's llvmpipe rasterizer,
+    it is the opengl32sw.dll on Windows and the LIBGL_ALWAYS_SOFTWARE on Linux.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import os
+
+from PySide2 import QtCore, QtGui
+
+from . import logger, project_conf
+
+backend_options = ['qpainter', 'opengl']
+
+# The cached result of opengl_available()
+_opengl_available = None
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+def prepare_opengl(software: bool = None):
+    """
+    Prepare the OpenGL before the QApplication is created.
+
+    Args:
+        software (bool, optional): Whether to use the software OpenGL. Defaults to None, use the configured one.
+    """
+    if software is None:
+        software = project_conf['display']['backend']['software_opengl']
+
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_ShareOpenGLContexts)
+
+    if software:
+        QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_UseSoftwareOpenGL)
+        os.environ.setdefault('LIBGL_ALWAYS_SOFTWARE', '1')
+
+    logger.debug(f'Prepared OpenGL, software: {software}')
+
+
+def opengl_available() -> bool:
+    """
+    Check if the OpenGL context can be created and made current,
+    it is required to be called after the QApplication is created.
+
+    Returns:
+        bool: Whether the OpenGL is available.
+    """
+    global _opengl_available
+
+    if _opengl_available is not None:
+        return _opengl_available
+
+    context = QtGui.QOpenGLContext()
+    surface = QtGui.QOffscreenSurface()
+    surface.create()
+
+    _opengl_available = context.create() and context.makeCurrent(surface)
+
+    if _opengl_available:
+        fmt = context.format()
+        logger.info(
+            f'OpenGL is available: {fmt.majorVersion()}.{fmt.minorVersion()}, software: {QtCore.QCoreApplication.testAttribute(QtCore.Qt.AA_UseSoftwareOpenGL)}')
+        context.doneCurrent()
+    else:
+        logger.warning('OpenGL is not available')
+
+    return _opengl_available
+
+
+def select_backend(name: str = None) -> str:
+    """
+    Select the drawing backend.
+
+    Args:
+        name (str, optional): The backend name, one of backend_options. Defaults to None, use the configured one.
+
+    Returns:
+        str: The selected backend, it is 'qpainter' if the name is unknown or the 'opengl' is not available.
+    """
+    if name is None:
+        name = project_conf['display']['backend']['name']
+
+    if name not in backend_options:
+        logger.error(
+            f'Unknown backend: {name}, it should be one of {backend_options}, fall back to the qpainter backend')
+        return 'qpainter'
+
+    if name == 'opengl' and not opengl_available():
+        logger.warning('Fall back to the qpainter backend')
+        return 'qpainter'
+
+    return name
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
@@ -0,0 +1,300 @@
+"""
+File: layer_compositor.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The NumPy layer compositor of the animation frames.
+    - The layers are resized once, premultiplied and cropped to their opaque bounding box;
+    - The frame is the background copied into the reused output buffer,
+      and the layers are alpha blended onto it by the sliced blits;
+    - As the background is the same as the last frame's,
+      only the dirty rectangles of the last blits are restored from it.
+    The blending is out = src + dst * (255 - alpha) / 255,
+    the src is premultiplied, so it equals to the PIL's paste with the mask.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import threading
+import numpy as np
+
+from PIL import Image
+
+from .mipmap import MipmapPyramid, resize_image
+
+# The compositors of the threads, so the frames are composited in parallel
+_local = threading.local()
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+def _sized(img, size: tuple) -> Image:
+    """The image or the pyramid in the size."""
+    if isinstance(img, MipmapPyramid) or img.size != tuple(size):
+        return resize_image(img, size)
+    return img
+
+
+def rgb_array(img: Image, size: tuple) -> np.ndarray:
+    """
+    The RGB uint8 array of the image in the size.
+
+    Args:
+        img (Image, MipmapPyramid or np.ndarray): The image, the array in the size is used as it is;
+        size (tuple): The (width, height).
+
+    Returns:
+        np.ndarray: The array, the shape is (height, width, 3).
+    """
+    if isinstance(img, np.ndarray):
+        if img.shape == (size[1], size[0], 3):
+            return img
+        img = Image.fromarray(np.asarray(img))
+
+    img = _sized(img, size)
+    return np.ascontiguousarray(np.asarray(img.convert('RGB'), dtype=np.uint8))
+
+
+class Layer(object):
+    """
+    The premultiplied layer, it is cropped to the opaque bounding box.
+
+    @rgb (np.ndarray): The premultiplied color, the shape is (h, w, 3), uint8;
+    @inv_alpha (np.ndarray): The 255 - alpha, the shape is (h, w, 1), uint16;
+    @x, y (int): The position of the bounding box in the full image.
+    """
+
+    def __init__(self, img: Image, size: tuple, mask: Image = None):
+        """
+        Args:
+            img (Image or MipmapPyramid): The image, its alpha is used if the mask is None;
+            size (tuple): The (width, height), the image and the mask are resized into it;
+            mask (Image or MipmapPyramid, optional): The L mode mask. Defaults to None.
+        """
+        img = _sized(img, size)
+
+        if mask is None:
+            rgba = np.asarray(img.convert('RGBA'))
+            rgb, alpha = rgba[..., :3], rgba[..., 3]
+        else:
+            mask = _sized(mask, size)
+            rgb = np.asarray(img.convert('RGB'))
+            alpha = np.asarray(mask.convert('L'))
+
+        ys, xs = np.nonzero(alpha)
+        if len(ys) == 0:
+            ys, xs = np.array([0]), np.array([0])
+            alpha = np.zeros_like(alpha)
+
+        y0, y1 = ys.min(), ys.max() + 1
+        x0, x1 = xs.min(), xs.max() + 1
+
+        a = alpha[y0:y1, x0:x1, np.newaxis].astype(np.uint16)
+        rgb = rgb[y0:y1, x0:x1].astype(np.uint16)
+
+        self.rgb = ((rgb * a + 127) // 255).astype(np.uint8)
+        self.inv_alpha = 255 - a
+        self.x = int(x0)
+        self.y = int(y0)
+
+
+class LayerCompositor(object):
+    """
+    The compositor with the reused output buffer.
+    The backgrounds are never changed in place,
+    since the same background is only restored in the dirty rectangles.
+
+    @compose(background, blits) (method): Composite the frame;
+    @flipped() (method): The pre-flipped copy of the output buffer, it is uploaded into the display as it is;
+    @out (np.ndarray): The output buffer, the shape is (height, width, 3), uint8.
+    """
+
+    def __init__(self, size: tuple):
+        """
+        Args:
+            size (tuple): The (width, height).
+        """
+        self.size = tuple(size)
+        width, height = self.size
+        self.out = np.zeros((height, width, 3), dtype=np.uint8)
+        self._scratch = np.zeros((height, width, 3), dtype=np.uint16)
+
+        # The background of the output buffer, and the rectangles blended onto it
+        self._background = None
+        self._dirty = []
+
+    def compose(self, background: np.ndarray, blits: list = ()) -> np.ndarray:
+        """
+        Composite the frame.
+
+        Args:
+            background (np.ndarray): The background, the shape is (height, width, 3), uint8;
+            blits (list, optional): The (layer, dx, dy) list, the layers are blended in order. Defaults to ().
+
+        Returns:
+            np.ndarray: The output buffer, it is overwritten by the next compose.
+        """
+        if background is self._background:
+            for y0, y1, x0, x1 in self._dirty:
+                self.out[y0:y1, x0:x1] = background[y0:y1, x0:x1]
+        else:
+            np.copyto(self.out, background)
+            self._background = background
+
+        self._dirty = []
+        for layer, dx, dy in blits:
+            self.blit(layer, int(dx), int(dy))
+        return self.out
+
+    def blit(self, layer: Layer, dx: int = 0, dy: int = 0):
+        """
+        Blend the layer onto the output buffer, only the overlapped slice is touched.
+
+        Args:
+            layer (Layer): The layer;
+            dx (int, optional): The x offset. Defaults to 0.
+            dy (int, optional): The y offset. Defaults to 0.
+        """
+        height, width = self.out.shape[:2]
+        h, w = layer.inv_alpha.shape[:2]
+        x0, y0 = layer.x + dx, layer.y + dy
+
+        ox0, oy0 = max(x0, 0), max(y0, 0)
+        ox1, oy1 = min(x0 + w, width), min(y0 + h, height)
+        if ox0 >= ox1 or oy0 >= oy1:
+            return
+
+        self._dirty.append((oy0, oy1, ox0, ox1))
+
+        src = layer.rgb[oy0-y0:oy1-y0, ox0-x0:ox1-x0]
+        inv_alpha = layer.inv_alpha[oy0-y0:oy1-y0, ox0-x0:ox1-x0]
+        dst = self.out[oy0:oy1, ox0:ox1]
+        tmp = self._scratch[oy0:oy1, ox0:ox1]
+
+        np.multiply(dst, inv_alpha, out=tmp)
+        tmp += 127
+        np.floor_divide(tmp, 255, out=tmp)
+        tmp += src
+        np.copyto(dst, tmp, casting='unsafe')
+
+    def flipped(self) -> np.ndarray:
+        return np.ascontiguousarray(self.out[::-1])
+
+
+def compose_image(background: np.ndarray, blits: list = ()) -> np.ndarray:
+    """
+    Composite the frame by the compositor of the current thread,
+    so the frames are composited in the render pool in parallel.
+    The frame is copied out of the compositor once, in the pre-flipped order,
+    so it is uploaded into the display as it is.
+
+    Args:
+        background (np.ndarray): The background, the shape is (height, width, 3), uint8;
+        blits (list, optional): The (layer, dx, dy) list, the layers are blended in order. Defaults to ().
+
+    Returns:
+        np.ndarray: The pre-flipped frame, it is contiguous, the shape is (height, width, 3).
+    """
+    height, width = background.shape[:2]
+    compositor = getattr(_local, 'compositor', None)
+    if compositor is None or compositor.size != (width, height):
+        compositor = _local.compositor = LayerCompositor((width, height))
+
+    compositor.compose(background, blits)
+    return compositor.flipped()
+
+
+class ResizedFrames(object):
+    """
+    The frames resized into the size as they are used,
+    the resized frames are kept until the frames of the new size are prepared.
+    The frames of the other sizes, like the frames rendered for the old size in the meanwhile,
+    are resized without being kept, so they never replace the prepared frames.
+    The frames are the images or the (n, height, width, 3) stack,
+    the frames of the stack in the size are used as they are,
+    the others are resized from their mipmap pyramids, which are built as they are first resized.
+
+    @get(idx, size) (method): The RGB uint8 array of the idx-th frame in the size;
+    @prepare(size) (method): Resize all the frames into the size, and swap them in as they are ready.
+    """
+
+    def __init__(self, images: list):
+        self.images = images
+        # The size and its frames, they are swapped together
+        self._sized = (None, {})
+        self._sized_lock = threading.Lock()
+        self._pyramids = {}
+
+    @property
+    def size(self) -> tuple:
+        return self._sized[0]
+
+    def get(self, idx: int, size: tuple) -> np.ndarray:
+        size = tuple(size)
+
+        # The first size is kept as the frames are used
+        if self._sized[0] is None:
+            with self._sized_lock:
+                if self._sized[0] is None:
+                    self._sized = (size, {})
+
+        sized_size, frames = self._sized
+        if size != sized_size:
+            return self._resize(idx, size)
+
+        if idx not in frames:
+            frames[idx] = self._resize(idx, size)
+
+        return frames[idx]
+
+    def prepare(self, size: tuple):
+        """
+        Resize all the frames into the size,
+        the frames of the old size are used until they are swapped.
+
+        Args:
+            size (tuple): The (width, height).
+        """
+        size = tuple(size)
+        sized_size, frames = self._sized
+        if size == sized_size and len(frames) == len(self.images):
+            return
+
+        # The frames already resized into the size are reused
+        ready = frames if size == sized_size else {}
+        frames = {idx: ready[idx] if idx in ready else self._resize(idx, size)
+                  for idx in range(len(self.images))}
+        with self._sized_lock:
+            self._sized = (size, frames)
+
+    def _resize(self, idx: int, size: tuple) -> np.ndarray:
+        img = self.images[idx]
+        if isinstance(img, np.ndarray) and img.shape[:2] == (size[1], size[0]):
+            return rgb_array(img, size)
+
+        if idx not in self._pyramids:
+            self._pyramids[idx] = MipmapPyramid(img)
+        return rgb_array(self._pyramids[idx], size)
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
@@ -0,0 +1,142 @@
+"""
+File: mipmap.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The power-of-two mipmap pyramid of the animation assets.
+    The pyramid is built once per asset by the Image.reduce,
+    and the resize starts from the smallest level at least as large as the target,
+    with the configured quality filter.
+    So the resize into the small window never filters the full resolution source.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import numpy as np
+
+from PIL import Image
+
+from . import project_conf
+
+resize_filters = dict(
+    nearest=Image.NEAREST,
+    box=Image.BOX,
+    bilinear=Image.BILINEAR,
+    hamming=Image.HAMMING,
+    bicubic=Image.BICUBIC,
+    lanczos=Image.LANCZOS,
+)
+
+resize_filter = resize_filters[project_conf['animation']['resize_filter']]
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+class MipmapPyramid(object):
+    """
+    The power-of-two mipmap pyramid.
+
+    @resize(size, resample) (method): Resize into the size from the smallest level at least as large as it;
+    @level_for(size) (method): The index of the level to resize from;
+    @levels (list): The levels, the 0-th is the source, the i-th is reduced by 2**i;
+    @sizes (list): The (width, height) of the levels.
+    """
+
+    # The level smaller than it is not built
+    min_size = 16
+
+    def __init__(self, source):
+        """
+        Args:
+            source (Image or np.ndarray): The source, the array is kept as it is, like the memory-mapped frame.
+        """
+        img = self._image(source)
+
+        self.levels = [source]
+        self.sizes = [img.size]
+        while min(img.size) // 2 >= self.min_size:
+            img = img.reduce(2)
+            self.levels.append(img)
+            self.sizes.append(img.size)
+
+    @staticmethod
+    def _image(level) -> Image:
+        if isinstance(level, np.ndarray):
+            return Image.fromarray(np.asarray(level))
+        return level
+
+    def level_for(self, size: tuple) -> int:
+        """
+        The index of the smallest level at least as large as the size.
+
+        Args:
+            size (tuple): The (width, height).
+
+        Returns:
+            int: The index, it is 0 if the size is larger than the source.
+        """
+        width, height = size
+        for i in range(len(self.sizes) - 1, -1, -1):
+            w, h = self.sizes[i]
+            if w >= width and h >= height:
+                return i
+        return 0
+
+    def resize(self, size: tuple, resample: int = None) -> Image:
+        """
+        Resize into the size.
+
+        Args:
+            size (tuple): The (width, height);
+            resample (int, optional): The filter. Defaults to None, the configured resize_filter.
+
+        Returns:
+            Image: The new image, it is safe to draw on it.
+        """
+        size = tuple(size)
+        img = self._image(self.levels[self.level_for(size)])
+
+        if img.size == size:
+            return img.copy()
+
+        return img.resize(size, resize_filter if resample is None else resample)
+
+
+def resize_image(img, size: tuple, resample: int = None) -> Image:
+    """
+    Resize the image or the pyramid into the size.
+
+    Args:
+        img (Image or MipmapPyramid): The image or the pyramid;
+        size (tuple): The (width, height);
+        resample (int, optional): The filter. Defaults to None, the configured resize_filter.
+
+    Returns:
+        Image: The resized image.
+    """
+    if isinstance(img, MipmapPyramid):
+        return img.resize(size, resample)
+    return img.resize(size, resize_filter if resample is None else resample)
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
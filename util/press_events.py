@@ -0,0 +1,197 @@
+"""
+File: press_events.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    Streaming press onset, plateau and release event detector.
+    - The onset and release are the threshold crossings with hysteresis;
+    - The plateau is the first point of the press whose force rate (dF/dt) is small enough.
+    The detector is vectorized over every incoming batch,
+    and the offline detection runs the same code over the saved arrays.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import numpy as np
+
+from . import logger, project_conf
+from .buffer_cursor import BufferCursor
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+class PressEventDetector(object):
+    """
+    The streaming press event detector.
+
+    @detect(values, ts) (method): Detect the events inside the batch, the state is kept across batches;
+    @feed(buffer) (method): Detect the events of the samples appended to the reader's buffer;
+    @events (list): The event log, the element is dict(name, t, value),
+        the name is one of ['onset', 'plateau', 'release'].
+    """
+
+    onset_threshold = project_conf['events']['onset_threshold']  # g
+    release_threshold = project_conf['events']['release_threshold']  # g
+    plateau_rate = project_conf['events']['plateau_rate']  # g/s
+    rate_lag = project_conf['events']['rate_lag']  # points
+
+    def __init__(self):
+        self.cursor = BufferCursor()
+        self.reset()
+        logger.debug(f'Initialized {self.__class__}')
+
+    def reset(self):
+        self.events = []
+        self.pressed = False
+        self.plateau_flag = False
+        self._tail_values = np.zeros(0)
+        self._tail_ts = np.zeros(0)
+        self.cursor.reset()
+
+    def feed(self, buffer: list) -> list:
+        """
+        Detect the events of the new samples in the reader's buffer.
+
+        Args:
+            buffer (list): The reader's buffer, the row is (pressure_value, ..., timestamp).
+
+        Returns:
+            list: The new events.
+        """
+        rows = self.cursor.read(buffer)
+        if not rows:
+            return []
+        values = [e[0] for e in rows]
+        ts = [e[-1] for e in rows]
+        return self.detect(values, ts)
+
+    def _rate(self, values: np.ndarray, ts: np.ndarray) -> np.ndarray:
+        """
+        The force rate of the batch, it is the difference over rate_lag points,
+        the tail of the last batch is prepended so the rate is continuous across batches.
+        """
+        v = np.concatenate([self._tail_values, values])
+        t = np.concatenate([self._tail_ts, ts])
+        m = len(self._tail_values)
+
+        idx = np.arange(m, len(v))
+        ref = np.maximum(idx - self.rate_lag, 0)
+        dt = t[idx] - t[ref]
+        rate = np.divide(v[idx] - v[ref], dt,
+                         out=np.zeros(len(idx)), where=dt > 0)
+
+        self._tail_values = v[-self.rate_lag:]
+        self._tail_ts = t[-self.rate_lag:]
+
+        return rate
+
+    def detect(self, values, ts) -> list:
+        """
+        Detect the events inside the batch.
+
+        Args:
+            values (array): The pressure values;
+            ts (array): The timestamps.
+
+        Returns:
+            list: The new events, they are also appended to self.events.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        ts = np.asarray(ts, dtype=np.float64)
+        n = len(values)
+        if n == 0:
+            return []
+
+        rate = self._rate(values, ts)
+
+        # --------------------
+        # Hysteresis,
+        # the state is decided by the latest decisive sample, -1 refers undecided.
+        decision = np.where(values >= self.onset_threshold, 1,
+                            np.where(values <= self.release_threshold, 0, -1))
+        latest = np.where(decision >= 0, np.arange(n), -1)
+        np.maximum.accumulate(latest, out=latest)
+        state = np.where(latest >= 0, decision[latest], int(self.pressed))
+
+        change = np.diff(state, prepend=int(self.pressed))
+        onsets = np.flatnonzero(change == 1)
+        releases = np.flatnonzero(change == -1)
+
+        # --------------------
+        # Plateau, the first slow point of every press,
+        # the segment 0 is the press carried in from the last batch.
+        segment = np.cumsum(change == 1)
+        candidates = np.flatnonzero(
+            (state == 1) & (np.abs(rate) <= self.plateau_rate))
+        segment_ids, first = np.unique(
+            segment[candidates], return_index=True)
+        plateaus = candidates[first]
+
+        if self.plateau_flag:
+            plateaus = plateaus[segment_ids != 0]
+
+        # --------------------
+        # Carry the state to the next batch
+        self.pressed = bool(state[-1])
+        if self.pressed:
+            self.plateau_flag = segment[-1] in segment_ids or (
+                segment[-1] == 0 and self.plateau_flag)
+        else:
+            self.plateau_flag = False
+
+        # --------------------
+        # Make the events in order
+        order = dict(onset=0, plateau=1, release=2)
+        found = sorted(
+            [(i, 'onset') for i in onsets] +
+            [(i, 'plateau') for i in plateaus] +
+            [(i, 'release') for i in releases],
+            key=lambda e: (e[0], order[e[1]]))
+
+        events = [dict(name=name, t=float(ts[i]), value=float(values[i]))
+                  for i, name in found]
+
+        if events:
+            logger.debug(f'Detected press events: {events}')
+
+        self.events.extend(events)
+        return events
+
+
+def detect_press_events(data: list) -> list:
+    """
+    Detect the press events offline,
+    it runs the same detector over the saved data.
+
+    Args:
+        data (list): The saved data, the row is (pressure_value, ..., timestamp).
+
+    Returns:
+        list: The events.
+    """
+    data = np.asarray(data, dtype=np.float64)
+    detector = PressEventDetector()
+    return detector.detect(data[:, 0], data[:, -1])
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
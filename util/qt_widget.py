@@ -29,7 +29,6 @@ import numpy as np
 
 from pathlib import Path
 from datetime import datetime
-from threading import Thread
 
 # Import QApplication BEFORE anything # noqa
 from PySide2.QtWidgets import QApplication  # noqa
@@ -43,24 +42,43 @@ from PySide2.QtCore import QCoreApplication
 from . import logger, project_conf, root_path
 from .load_protocols import MyProtocol
 from .real_time_hid_reader import RealTimeHidReader
-from .score_animation import ScoreAnimation, pil2rgb
+from .score_animation import ScoreAnimation
+from .animation_scheduler import animation_scheduler
+from .automatic_animation import AutomaticAnimation
+from .scene_registry import SceneRegistry, make_placeholder
 from .realign import realign_into_8ms_sampling
+from .force_metrics import MetricsStage
+from .press_events import PressEventDetector
+from .render_clock import RenderClock
+from .retained_state import RetainedState
+from .render_quality import RenderQualityPolicy
+from .gl_backend import prepare_opengl, select_backend
+from .frame_stats import FrameStats
+from .frame_upload import FrameUploader, flip_frame, levels
+from .rolling_buffer import RollingBuffer
+from .sample_stream import SampleNotifier, SampleWindow
 from .two_steps_score_animation import TwoStepScore_Animation_CatLeavesSubmarine, TwoStepScore_Animation_CatClimbsTree
 
 from rich import print, inspect
 
 # ---------------
-sa = ScoreAnimation()
+# The animation scenes are created in the background as their display modes are selected,
+# the preloaded scenes are created as the widget starts, so importing the module loads nothing
+scenes = SceneRegistry()
+scenes.register('Animation fit', ScoreAnimation)
+scenes.register('Cat leaves submarine',
+                TwoStepScore_Animation_CatLeavesSubmarine)
+scenes.register('Cat climbs tree', TwoStepScore_Animation_CatClimbsTree)
+
+two_steps_scenes = ['Cat leaves submarine', 'Cat climbs tree']
 # sa.reset()
 # sa.mk_frames()
-
-# ---------------
-tssa_cls = TwoStepScore_Animation_CatLeavesSubmarine()
-tssa_cct = TwoStepScore_Animation_CatClimbsTree()
 # tssa_cls.update_score()
 
 # ---------------
-app = QtWidgets.QApplication([])  # noqa
+# The OpenGL attributes only take effect if they are set before the QApplication is created
+prepare_opengl()
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])  # noqa
 
 # %% ---- 2023-09-17 ------------------------
 # Function and class
@@ -88,16 +106,55 @@ class SignalMonitorWidget(pg.PlotWidget):
 
     pg.setConfigOption("background", "w")
     pg.setConfigOption("foreground", "k")
+    # The antialias applies to the ellipses and texts, the curves follow the render_quality policy
     pg.setConfigOption("antialias", True)
     title = ""  # "Main graph"
     max_value = project_conf["display"]["max_value"]
     min_value = project_conf["display"]["min_value"]
     ref_value = project_conf["display"]["ref_value"]
 
-    def __init__(self):
+    # The current_block_remainder_text flashes with the color as the press event occurs
+    remainder_text_color = "red"
+    event_flash_colors = dict(onset="blue", plateau="green", release="gray")
+    event_flash_msecs = 300
+
+    # The monitor of the subject window, the texts for the operator are never shown on it
+    subject_view = False
+
+    def __init__(self, render_quality: RenderQualityPolicy = None, backend: str = None):
+        """
+        Args:
+            render_quality (RenderQualityPolicy, optional): The rendering-quality policy of the curves. Defaults to None, use the configured one.
+            backend (str, optional): The drawing backend, one of ['qpainter', 'opengl']. Defaults to None, use the configured one.
+        """
         super().__init__()
+
+        # The opengl backend paints on the QOpenGLWidget viewport,
+        # it falls back to the qpainter if the OpenGL is not available.
+        self.backend = select_backend(backend)
+        if self.backend == 'opengl':
+            self.useOpenGL(True)
+
+        self.render_quality = RenderQualityPolicy(
+        ) if render_quality is None else render_quality
+
+        # The visibility, ranges and grid flags are applied only if they are changed,
+        # the ranges are forgotten as the user drags or zooms the view.
+        self.retained = RetainedState()
+        self.getViewBox().sigRangeChangedManually.connect(
+            lambda *_: self.retained.invalidate(self))
+
+        # The frame-time and latency statistic, it is shown on the latency_text
+        self.frame_stats = FrameStats()
+
         self.set_config()
         self.place_components()
+
+        # The (timestamp, value) buffers of the curve1 and curve2,
+        # they only take the newly arrived samples.
+        self.curve1_buffer = RollingBuffer(2)
+        self.curve2_buffer = RollingBuffer(2)
+
         logger.debug(f"Initialized {self.__class__}")
 
     def set_config(self):
@@ -119,16 +176,59 @@ class SignalMonitorWidget(pg.PlotWidget):
             None
         """
 
-        self.showGrid(x=x_grid, y=y_grid, alpha=0.5)
+        self.show_grid(x=x_grid, y=y_grid, alpha=0.5)
         if ref_value is None:
-            self.setYRange(self.min_value, self.max_value)
+            self.set_y_range(self.min_value, self.max_value)
         else:
-            self.setYRange(self.min_value, ref_value*2)
+            self.set_y_range(self.min_value, ref_value*2)
+
+    def animation_mode(self, width: int, height: int):
+        self.show_grid(x=False, y=False)
+        self.set_x_range(0, width, padding=0)
+        self.set_y_range(0, height, padding=0)
+
+    def set_visible(self, item, flag: bool):
+        """
+        Set the visibility of the item, it is applied only if it is changed.
 
-    def animation_mode(self):
-        self.showGrid(x=False, y=False)
-        self.setXRange(0, sa.width, padding=0)
-        self.setYRange(0, sa.height, padding=0)
+        Args:
+            item (pg.GraphicsObject): The item, like self.curve1;
+            flag (bool): Whether the item is visible.
+        """
+        self.retained.apply(item, 'setVisible', flag)
+
+    def set_animation_visible(self, flag: bool):
+        """
+        Set the visibility of the animation image and its tiny window.
+
+        Args:
+            flag (bool): Whether they are visible.
+        """
+        self.set_visible(self.animation_img, flag)
+        for curve in self.tiny_window_curves.values():
+            self.set_visible(curve, flag)
+
+    def update_tiny_window(self, curves: dict):
+        """
+        Update the curves of the tiny window.
+
+        Args:
+            curves (dict): The (x, y) arrays of the curves, the keys are the same as the self.tiny_window_curves.
+        """
+        for name, (x, y) in curves.items():
+            self.tiny_window_curves[name].setData(x, y)
+
+    def set_x_range(self, *args, **kwargs):
+        """The retained setXRange, the arguments are the same."""
+        self.retained.apply(self, 'setXRange', *args, **kwargs)
+
+    def set_y_range(self, *args, **kwargs):
+        """The retained setYRange, the arguments are the same."""
+        self.retained.apply(self, 'setYRange', *args, **kwargs)
+
+    def show_grid(self, **kwargs):
+        """The retained showGrid, the arguments are the same."""
+        self.retained.apply(self, 'showGrid', **kwargs)
 
     def ellipse4_size_changed(self, ref_value: float):
         """
@@ -226,15 +326,19 @@ class SignalMonitorWidget(pg.PlotWidget):
 
         # --------------------------------------------------------------------------------
         # The curves of the pressure values (curve1 and curve2(delay)),
-        # and the reference pressure value (curve3)
+        # and the reference pressure value (curve3),
+        # they are clipped, downsampled and antialiased by the render_quality policy.
         self.pen1 = pg.mkPen(color="blue")
-        self.curve1 = self.plot([], [], pen=self.pen1)
+        self.curve1 = self.plot(
+            [], [], pen=self.pen1, **self.render_quality.curve_options('curve1'))
 
         self.pen2 = pg.mkPen(color="red")
-        self.curve2 = self.plot([], [], pen=self.pen2)
+        self.curve2 = self.plot(
+            [], [], pen=self.pen2, **self.render_quality.curve_options('curve2'))
 
         self.pen3 = pg.mkPen(color="green")
-        self.curve3 = self.plot([], [], pen=self.pen3)
+        self.curve3 = self.plot(
+            [], [], pen=self.pen3, **self.render_quality.curve_options('curve3'))
 
         # --------------------------------------------------------------------------------
         # The ellipse of pressure value response,
@@ -262,10 +366,20 @@ class SignalMonitorWidget(pg.PlotWidget):
         # imv.setImage(pil2rgb(sa.buffer[0]).transpose([2, 1, 0]))
         # self.setBackground(imv)
 
-        self.animation_img = pg.ImageItem()
+        # The row-major image of the pre-flipped frames, the levels are fixed
+        self.animation_img = pg.ImageItem(axisOrder='row-major')
         self.addItem(self.animation_img)
-        mat = pil2rgb(sa.img)
-        self.animation_img.setImage(mat[::-1].transpose([1, 0, 2]))
+        self.animation_img.setImage(
+            AutomaticAnimation.frame, autoLevels=False, levels=levels)
+
+        # The tiny window of the pressure feedback, it is drawn above the animation image
+        self.tiny_window_curves = dict(
+            ref=pg.PlotCurveItem(pen=pg.mkPen(color='green')),
+            avg=pg.PlotCurveItem(pen=pg.mkPen(color='red')),
+            std=pg.PlotCurveItem(pen=pg.mkPen(color='gray')))
+        for curve in self.tiny_window_curves.values():
+            curve.setVisible(False)
+            self.addItem(curve)
 
         # --------------------------------------------------------------------------------
         # The block text on the left-top corner
@@ -294,6 +408,22 @@ class SignalMonitorWidget(pg.PlotWidget):
         self.status_text.setParentItem(legend)
         self.status_text.setVisible(False)
 
+        # --------------------------------------------------------------------------------
+        # The frame-time and latency overlay, it is below the status text,
+        # the rows are the p50 / p95 / max of the render time, timer-to-paint delay and sample age.
+        self.latency_text = pg.TextItem("--")
+        font = QFont()
+        font.setPixelSize(14)
+        self.latency_text.setFont(font)
+        self.latency_text.setAnchor((1, 0))
+        self.latency_text.setPos(self.width() - 80, 30)
+        self.latency_text.setFlag(
+            self.latency_text.GraphicsItemFlag.ItemIgnoresTransformations
+        )
+        self.latency_text.setParentItem(legend)
+        self.latency_text.setVisible(
+            project_conf['display']['latency_overlay']['enabled'])
+
         # --------------------------------------------------------------------------------
         # The current block remainder,
         # it is on the center of the graph
@@ -302,7 +432,7 @@ class SignalMonitorWidget(pg.PlotWidget):
         font.setPixelSize(40)
         self.current_block_remainder_text.setFont(font)
         self.current_block_remainder_text.setAnchor((0, 0))
-        self.current_block_remainder_text.setColor("red")
+        self.current_block_remainder_text.setColor(self.remainder_text_color)
         self.current_block_remainder_text.setPos(
             self.width() / 2, self.height() / 2)
         self.current_block_remainder_text.setFlag(
@@ -314,6 +444,8 @@ class SignalMonitorWidget(pg.PlotWidget):
         # Order the z-value of the components
         # vb.setZValue(-100)
         self.animation_img.setZValue(-100)
+        for curve in self.tiny_window_curves.values():
+            curve.setZValue(-90)
         legend.setZValue(-10)
         self.curve3.setZValue(1)
         self.curve1.setZValue(2)
@@ -336,9 +468,93 @@ class SignalMonitorWidget(pg.PlotWidget):
 
         self.block_text.setAnchor((0, 0))
         self.status_text.setPos(self.width() - 80, 0)
+        self.latency_text.setPos(self.width() - 80, 30)
         self.current_block_remainder_text.setPos(
             self.width() / 2, self.height() / 2)
 
+    def paintEvent(self, event):
+        """
+        Paint the widget, and record the frame into the frame_stats.
+        """
+        paint_start = time.perf_counter()
+        super().paintEvent(event)
+        self.frame_stats.painted(paint_start)
+
+    def update_latency_text(self):
+        """
+        Update the latency overlay if it is visible,
+        the text is refreshed in the frame_stats' refresh_seconds.
+        """
+        if self.latency_text.isVisible():
+            self.retained.apply(
+                self.latency_text, 'setText', self.frame_stats.text())
+
+    def flash_remainder_text(self, event_name: str):
+        """
+        Flash the current_block_remainder_text for the press event.
+
+        Args:
+            event_name (str): The event name, one of ['onset', 'plateau', 'release'].
+        """
+        color = self.event_flash_colors.get(event_name)
+        if color is None:
+            return
+
+        self.current_block_remainder_text.setColor(color)
+        QtCore.QTimer.singleShot(
+            self.event_flash_msecs,
+            lambda: self.current_block_remainder_text.setColor(self.remainder_text_color))
+
+    def clear_curves(self):
+        """
+        Clear the buffers of the curve1 and curve2,
+        it is required when the incoming data is not the continuation of the drawn data.
+        """
+        self.curve1_buffer.clear()
+        self.curve2_buffer.clear()
+        self.curve1.setData([], [])
+        self.curve2.setData([], [])
+
+    def _append_curve(self, curve, buffer: RollingBuffer, pairs):
+        """
+        Append the newly arrived samples of the window to the buffer,
+        drop the samples out of the window, and draw the curve with the buffer.
+
+        The samples are new if they are later than the latest sample in the buffer,
+        the buffer is cleared if the window goes back in time, it happens when the reader restarts.
+
+        Args:
+            curve (PlotDataItem): The curve;
+            buffer (RollingBuffer): The (timestamp, value) buffer of the curve;
+            pairs (list or np.ndarray): The window, the element is like (value,..., timestamp).
+        """
+        if len(pairs) == 0:
+            buffer.clear()
+            curve.setData([], [])
+            return
+
+        t_last = buffer.last(0)
+
+        if pairs[-1][-1] < t_last:
+            buffer.clear()
+            t_last = buffer.last(0)
+
+        if isinstance(pairs, np.ndarray):
+            k = np.searchsorted(pairs[:, -1], t_last, side='right')
+            buffer.append(pairs[k:, [-1, 0]])
+        else:
+            # Walk back from the tail, the cost is proportional to the new samples
+            k = len(pairs)
+            while k > 0 and pairs[k-1][-1] > t_last:
+                k -= 1
+            if k < len(pairs):
+                buffer.append(
+                    np.array([(e[-1], e[0]) for e in pairs[k:]], dtype=np.float64))
+
+        buffer.trim_before(pairs[0][-1])
+
+        curve.setData(buffer.column(0), buffer.column(1), skipFiniteCheck=True)
+
     def update_curve1(self, pairs):
         """
         Update the curve1 with the given pairs,
@@ -349,9 +565,7 @@ class SignalMonitorWidget(pg.PlotWidget):
                 The array of realtime pressure curve,
                 the element is like (value,..., timestamp)
         """
-        ys = [e[0] for e in pairs]
-        ts = [e[-1] for e in pairs]
-        self.curve1.setData(ts, ys)
+        self._append_curve(self.curve1, self.curve1_buffer, pairs)
 
     def update_curve2(self, pairs_delay):
         """
@@ -361,9 +575,7 @@ class SignalMonitorWidget(pg.PlotWidget):
         Args:
             pairs_delay (list): The array of delayed pressure curve, the element is like (value,..., timestamp)
         """
-        ys = [e[0] for e in pairs_delay]
-        ts = [e[-1] for e in pairs_delay]
-        self.curve2.setData(ts, ys)
+        self._append_curve(self.curve2, self.curve2_buffer, pairs_delay)
 
     def update_curve3(self, t0: float, t1: float, ref_value: float, flag: bool):
         """
@@ -485,6 +697,144 @@ class BlockManager(object):
         return self.design[0]
 
 
+class FakeBlockIntervals(object):
+    """
+    The sorted boundaries of the fake blocks,
+    @contains(ts) is the method determine whether the timestamps are inside the fake blocks.
+
+    ! The blocks are not overlapping, so the sorted starts and stops are paired.
+    """
+
+    def __init__(self, fake_blocks: list = []):
+        self.starts = np.array(sorted(e["start"] for e in fake_blocks), dtype=np.float64)
+        self.stops = np.array(sorted(e["stop"] for e in fake_blocks), dtype=np.float64)
+
+    def contains(self, ts: np.ndarray) -> np.ndarray:
+        """
+        Whether the timestamps are strictly inside the fake blocks,
+        the timestamp is inside if more blocks start before it than stop before (or at) it.
+
+        Args:
+            ts (np.ndarray): The timestamps.
+
+        Returns:
+            np.ndarray: The boolean mask.
+        """
+        if len(self.starts) == 0:
+            return np.zeros(len(ts), dtype=bool)
+
+        return np.searchsorted(self.starts, ts, side="left") > np.searchsorted(self.stops, ts, side="right")
+
+
+class FrameSnapshot(object):
+    """
+    The snapshot of the frame, it is computed once per frame and shared by the monitors.
+
+    @t0 (float): The start time of the window;
+    @t1 (float): The end time of the window;
+    @block_name (str): The current block name;
+    @pairs (np.ndarray): The feedback window, the row is (value, timestamp), the fake blocks are substituted;
+    @pairs_delay (np.ndarray): The feedback delayed window, the row is (avg, std, timestamp);
+    @raw_pairs (np.ndarray): The raw window, the row is (value, timestamp);
+    @raw_pairs_delay (np.ndarray): The raw delayed window, the row is (avg, std, timestamp).
+    """
+
+    def __init__(self, t0: float, t1: float, block_name: str, window: np.ndarray, window_delay: np.ndarray, fake_block_intervals: FakeBlockIntervals, delay_seconds: float):
+        """
+        Args:
+            t0 (float): The start time of the window;
+            t1 (float): The end time of the window;
+            block_name (str): The current block name;
+            window (np.ndarray): The window of the reader's buffer, the shape is (n, 5);
+            window_delay (np.ndarray): The window of the reader's buffer_delay, the shape is (n, 5);
+            fake_block_intervals (FakeBlockIntervals): The fake blocks;
+            delay_seconds (float): The delay of the buffer_delay.
+        """
+        self.t0 = t0
+        self.t1 = t1
+        self.block_name = block_name
+
+        # Make sure the points inside the fake blocks are correctly re-assigned
+        # The buffer's row is:
+        # (pressure_value, digital_value, fake_pressure_value, fake_digital_value, timestamp)
+        # The output pairs's row is (value, timestamp),
+        # the value is the fake pressure value if the time point is inside the fake blocks.
+        fake_mask = fake_block_intervals.contains(window[:, 4])
+        self.pairs = np.column_stack((
+            np.where(fake_mask, window[:, 2], window[:, 0]),
+            window[:, 4]))
+        self.raw_pairs = window[:, [0, 4]]
+
+        # ! The buffer_delay is not the delayed buffer, but its statistic, including avg. and std. values
+        # The buffer_delay's row is:
+        # (avg-pressure, fake-avg-pressure, std-pressure, fake-std-pressure, timestamp)
+        # This uses the columns for both avg. (0|1), std. (2|3) values, and timestamp (4)
+        # The output pairs_delay's row is (avg, std, timestamp)
+        fake_mask = fake_block_intervals.contains(
+            window_delay[:, 4] + delay_seconds)
+        self.pairs_delay = np.column_stack((
+            np.where(fake_mask, window_delay[:, 1], window_delay[:, 0]),
+            np.where(fake_mask, window_delay[:, 3], window_delay[:, 2]),
+            window_delay[:, 4]))
+        self.raw_pairs_delay = window_delay[:, [0, 2, 4]]
+
+
+class SubjectWindow(QtWidgets.QWidget):
+    """
+    The subject-facing window, it shows only the feedback,
+    it is full screen on the second screen if there is one.
+
+    @signal_monitor_widget (SignalMonitorWidget): The monitor of the feedback;
+    @show_on_screen() (method): Show the window on the last screen.
+    """
+
+    window_title = "Feedback"
+
+    # It is emitted as the window is resized
+    resized = QtCore.Signal()
+
+    def __init__(self):
+        super().__init__()
+
+        self.setWindowTitle(tr(self.window_title))
+
+        self.signal_monitor_widget = SignalMonitorWidget()
+
+        # The subject only sees the feedback, the texts for the operator are hidden,
+        # including the remainder text, since it tells the real, fake and hidden blocks
+        self.signal_monitor_widget.subject_view = True
+        self.signal_monitor_widget.block_text.setVisible(False)
+        self.signal_monitor_widget.status_text.setVisible(False)
+        self.signal_monitor_widget.latency_text.setVisible(False)
+        self.signal_monitor_widget.current_block_remainder_text.setVisible(False)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.signal_monitor_widget)
+
+        logger.debug(f"Initialized {self.__class__}")
+
+    def show_on_screen(self):
+        """
+        Show the window on the last screen,
+        it is full screen if there are more than one screens.
+        """
+        screens = QApplication.screens()
+        screen = screens[-1]
+        self.move(screen.geometry().topLeft())
+
+        if len(screens) > 1:
+            self.showFullScreen()
+        else:
+            self.show()
+
+        logger.debug(f"Show subject window on screen: {screen.name()}")
+
+    def resizeEvent(self, event):
+        self.signal_monitor_widget.on_resized()
+        self.resized.emit()
+
+
 class CustomDialog(QtWidgets.QDialog):
     def __init__(self, parent=None, title: str = 'Something wrong', messages: list = ['msg']):
         super().__init__(parent)
@@ -543,9 +893,20 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
     window_title = "Pressure feedback system by Dr. Zhang"
 
     device_reader = None
-    timer = None
+    render_clock = None
+    sample_window = None
+    # The animation frame shown by the animation_img, it is uploaded only if it is changed
+    animation_frame = None
+    frame_uploader = FrameUploader()
+    # The placeholder of the scene which is not ready, and its (name, width, height)
+    placeholder = None
+    placeholder_key = None
+    # The settled size of the animations
+    animation_size = None
+    samples_dirty = False
     block_manager = BlockManager()
     fake_blocks = []
+    fake_block_intervals = FakeBlockIntervals()
     my_protocol = MyProtocol()
     data_folder_path = root_path.joinpath("Data")
 
@@ -566,6 +927,26 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
 
         self.app = app
 
+        # --------------------------------------------------------------------------------
+        # The resize of the animations is debounced, it is applied as the size settles
+        self.resize_timer = QtCore.QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(
+            project_conf['animation']['resize_debounce_ms'])
+        self.resize_timer.timeout.connect(self._on_resize_settled)
+
+        # --------------------------------------------------------------------------------
+        # The derived-force metrics stage, it is fed with the new samples of the reader
+        self.metrics_stage = MetricsStage(self.ref_value)
+
+        # The press onset, plateau and release event detector
+        self.press_event_detector = PressEventDetector()
+
+        # The reader pushes the new samples notification
+        self.sample_notifier = SampleNotifier()
+        self.sample_notifier.samples_available.connect(
+            self._on_samples_available, QtCore.Qt.QueuedConnection)
+
         # --------------------------------------------------------------------------------
         # Start button, start the block design
         self.start_button = QtWidgets.QPushButton(tr("Start"))
@@ -589,8 +970,17 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         self.toggle_full_screen_display_button.clicked.connect(
             self.toggle_full_screen_display)
 
+        # --------------------------------------------------------------------------------
+        # Toggle the subject window, it shows the feedback on the second screen
+        self.toggle_subject_window_button = QtWidgets.QPushButton(
+            tr('Subject window'))
+        self.toggle_subject_window_button.clicked.connect(
+            self.toggle_subject_window)
+
         # --------------------------------------------------------------------------------
         self.signal_monitor_widget = SignalMonitorWidget()
+        self.subject_window = SubjectWindow()
+        self.subject_window.resized.connect(self.resize_timer.start)
 
         # --------------------------------------------------------------------------------
         self.widget_0 = QtWidgets.QWidget()
@@ -618,6 +1008,7 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         hbox.addWidget(self.terminate_button)
         hbox.addWidget(self.toggle_full_screen_display_button)
         hbox.addWidget(self.toggle_others_button)
+        hbox.addWidget(self.toggle_subject_window_button)
         layout.addWidget(widget)
         layout.addWidget(self.signal_monitor_widget)
 
@@ -637,34 +1028,11 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         # self.resizeEvent.connect(self.on_resized)
 
         # --------------------------------------------------------------------------------
-        # Pop-up if known errors are raised
-        messages = []
-
-        if not sa.resource_OK:
-            messages.extend(
-                (
-                    'Failed to load resource of building animation ',
-                    sa.resource_traceback,
-                )
-            )
-        if not tssa_cls.resource_OK:
-            messages.extend(
-                (
-                    'Failed to load resource of Cat leaves submarine animation',
-                    tssa_cls.resource_traceback,
-                )
-            )
-        if not tssa_cct.resource_OK:
-            messages.extend(
-                (
-                    'Failed to load resource of Cat climbs tree animation',
-                    tssa_cct.resource_traceback,
-                )
-            )
+        # The resource errors of the scenes are popped-up as the scenes are ready
+        self.checked_scenes = set()
 
-        if messages:
-            dlg = CustomDialog(messages=messages)
-            dlg.exec()
+        # Start creating the preloaded scenes in the background
+        scenes.preload(project_conf['animation']['preload_scenes'])
 
     def keyPressEvent(self, event):
         # F11 key code is 16777274
@@ -691,6 +1059,55 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
             e.setHidden(not e.isHidden())
             logger.debug(f'Set display of {e} to hidden: {e.isHidden()}')
 
+    def monitors(self) -> list:
+        """
+        The signal monitors to draw,
+        the subject window's monitor is included if it is shown.
+
+        Returns:
+            list: The monitors, the operator's monitor is the first.
+        """
+        if self.subject_window.isVisible():
+            return [self.signal_monitor_widget, self.subject_window.signal_monitor_widget]
+        return [self.signal_monitor_widget]
+
+    def toggle_subject_window(self):
+        """
+        Toggle the subject window,
+        as it is shown, the subject sees the feedback and the operator sees the raw curves.
+        """
+        if self.subject_window.isVisible():
+            self.subject_window.hide()
+        else:
+            self._mirror_pens()
+            self.subject_window.show_on_screen()
+
+        # The animation frame is uploaded again into the monitors,
+        # and the animations fit the subject's monitor
+        self.animation_frame = None
+        self.resize_timer.start()
+
+        # The curves are drawn from the other source, so they are re-drawn from scratch
+        self.signal_monitor_widget.clear_curves()
+        self.subject_window.signal_monitor_widget.clear_curves()
+
+        logger.debug(
+            f'Toggled subject window, visible: {self.subject_window.isVisible()}')
+
+    def _mirror_pens(self):
+        """
+        Mirror the operator's pens of the curves to the subject window.
+        """
+        o = self.signal_monitor_widget
+        s = self.subject_window.signal_monitor_widget
+        s.curve1.setPen(o.pen1)
+        s.curve2.setPen(o.pen2)
+        s.curve3.setPen(o.pen3)
+
+    def closeEvent(self, event):
+        self.subject_window.close()
+        super().closeEvent(event)
+
     def resizeEvent(self, event):
         """
         Handles the resize event of the main window.
@@ -704,9 +1121,49 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         """
 
         self.signal_monitor_widget.on_resized()
+        self.resize_timer.start()
 
         logger.debug(f"Main window resized to size {event}")
 
+    @QtCore.Slot(int)
+    def _on_samples_available(self, n: int):
+        """
+        Consume the new samples as the reader notifies,
+        the samples are pushed to the metrics stage and the event detector,
+        and the frame is marked as dirty for the render clock.
+
+        Args:
+            n (int): The index of the notification, the latest index is used instead.
+        """
+        n = self.sample_notifier.take()
+
+        if self.device_reader is None or self.sample_window is None:
+            return
+
+        rows = self.sample_window.pull(self.device_reader, n)
+
+        if not rows:
+            return
+
+        self.metrics_stage.update(rows)
+
+        batch = np.asarray(rows, dtype=np.float64)
+        events = self.press_event_detector.detect(batch[:, 0], batch[:, -1])
+        if events:
+            self.signal_monitor_widget.flash_remainder_text(events[-1]['name'])
+
+        self.samples_dirty = True
+
+    def _reset_sample_path(self):
+        """
+        Discard the samples and the states of the old session,
+        it is called as the reader is stopped, before it starts again.
+        """
+        self.sample_window = SampleWindow(self.window_length_seconds)
+        self.sample_notifier.reset()
+        self.metrics_stage.reset()
+        self.press_event_detector.reset()
+
     def restart_reader(self, reader: RealTimeHidReader):
         """
         Link to the hid device reader.
@@ -729,32 +1186,44 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
 
         self.device_reader = reader
 
+        # The reader restarts, so does the curves
+        self.signal_monitor_widget.clear_curves()
+
+        # The reader pushes the new samples into the window
+        self._reset_sample_path()
+        reader.on_samples = self.sample_notifier.notify
+
         reader.start()
 
         logger.debug(f"Linked with device reader: {reader}")
 
         self.setWindowTitle(tr(self.window_title))
 
-        if self.timer is not None:
-            self.timer.stop()
-            logger.warning(f"Stopped existing timer {self.timer}")
+        if self.render_clock is not None:
+            self.render_clock.stop()
+            logger.warning(
+                f"Stopped existing render clock {self.render_clock}")
+
+        frame_stats = self.signal_monitor_widget.frame_stats
+        frame_stats.reset()
 
         def core_update_function_for_reading_data():
-            pairs = reader.peek_by_seconds(self.window_length_seconds)
+            self.samples_dirty = False
+            frame_stats.begin_frame()
 
-            if pairs is not None:
-                if len(pairs) > 0:
-                    self.display_inputs['pressure_value_label'].display(
-                        int(pairs[-1][0]))
+            # The window is filled by the pushed samples
+            pairs = self.sample_window.pairs()
+
+            if len(pairs) > 0:
+                self.display_inputs['pressure_value_label'].display(
+                    int(pairs[-1][0]))
 
-                # ! The LCD label is kept as 8888 if device connection is crushed
-                if reader.device_crush_flag:
-                    self.display_inputs['pressure_value_label'].display(8888)
+            # ! The LCD label is kept as 8888 if device connection is crushed
+            if reader.device_crush_flag:
+                self.display_inputs['pressure_value_label'].display(8888)
 
             # ! The buffer_delay is not the delayed buffer, but its statistic, including avg. and std. values
-            pairs_delay = reader.peek_by_seconds(
-                self.window_length_seconds, peek_delay=True
-            )
+            pairs_delay = self.sample_window.pairs_delay()
 
             # not received any valid data,
             # something is wrong.
@@ -764,20 +1233,30 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
 
             self.update_graph(pairs, pairs_delay)
 
-        timer = QtCore.QTimer()
-        timer.timeout.connect(core_update_function_for_reading_data)
-        timer.start()
+            # The paint of the frame is pending, the sample's wall time is the reader's tic plus its timestamp
+            frame_stats.end_update(reader.tic + pairs[-1][-1])
+
+        # The frame is skipped if no new samples have arrived,
+        # except the device is crushed, the LCD label requires updating.
+        def has_new_samples():
+            return self.samples_dirty or reader.device_crush_flag
+
+        render_clock = RenderClock(
+            core_update_function_for_reading_data,
+            has_new_samples,
+            int(self.display_inputs['target_fps'].currentText()))
+        render_clock.start()
 
-        # Handle the timer, so I can stop it.
-        self.timer = timer
+        # Handle the render clock, so I can stop it.
+        self.render_clock = render_clock
 
     @QtCore.Slot()
     def terminate(self):
         """Terminate the current block design experiment."""
         self.block_manager = BlockManager()
 
-        self.fake_blocks = [
-            e for e in self.block_manager.design if e["name"] == "Fake"]
+        self._set_fake_blocks(
+            [e for e in self.block_manager.design if e["name"] == "Fake"])
         logger.warning(f"Found fake blocks remained: {self.fake_blocks}")
 
         self.save_data(status='User-terminate')
@@ -788,6 +1267,16 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
             "Terminated block designed experiment, and the start_button disable status is released."
         )
 
+    def _set_fake_blocks(self, fake_blocks: list):
+        """
+        Set the fake blocks and precompute their sorted boundaries.
+
+        Args:
+            fake_blocks (list): The fake blocks from the BlockManager.
+        """
+        self.fake_blocks = fake_blocks
+        self.fake_block_intervals = FakeBlockIntervals(fake_blocks)
+
     @QtCore.Slot()
     def start_block_design(self):
         """
@@ -797,15 +1286,15 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         """
 
         # Reset score animation
-        sa.reset()
+        self._reset_scene('Animation fit', request=False)
 
         self.start_button.setDisabled(True)
         self.terminate_button.setDisabled(False)
 
         self.block_manager = BlockManager(self.experiment_inputs["_buffer"])
 
-        self.fake_blocks = [
-            e for e in self.block_manager.design if e["name"] == "Fake"]
+        self._set_fake_blocks(
+            [e for e in self.block_manager.design if e["name"] == "Fake"])
         logger.debug(f"Found fake blocks {self.fake_blocks}")
 
         if len(self.block_manager.design) == 0:
@@ -824,6 +1313,9 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
 
         self.device_reader.stop()
         time.sleep(0.1)
+        self._reset_sample_path()
+        self.metrics_stage.start_blocks(
+            [dict(e) for e in self.block_manager.design])
         self.device_reader.start()
 
         # Reset the next_10s timer
@@ -832,6 +1324,9 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
     def save_data(self, status='Task-finished'):
         """
         Save the data and the snapshot setup for the block design experiment.
+        The per-block summary statistics are saved as summary.json,
+        they are computed online by the self.metrics_stage.
+        The press events are saved as events.json.
 
         It also restarts the self.device_reader.
         """
@@ -847,6 +1342,10 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
             date=str(datetime.now()),
             status=status
         )
+        # Freeze the metrics of the on-going block, if the experiment is terminated
+        self.metrics_stage.finish()
+        summary = self.metrics_stage.summary()
+        events = list(self.press_event_detector.events)
 
         # 4. Makeup how to save them
         _filename = datetime.strftime(datetime.now(), "%Y-%m-%d-%H-%M-%S")
@@ -859,6 +1358,8 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         json.dump(experiment_info, open(
             folder.joinpath("experiment.json"), "w"))
         json.dump(status_info, open(folder.joinpath('status.json'), 'w'))
+        json.dump(summary, open(folder.joinpath('summary.json'), 'w'))
+        json.dump(events, open(folder.joinpath('events.json'), 'w'))
 
         logger.debug(f"Saved data into {folder}")
 
@@ -889,6 +1390,10 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         inputs = dict(
             # Select display mode
             display_mode=QtWidgets.QComboBox(),
+            # Select the target FPS of the render clock
+            target_fps=QtWidgets.QComboBox(),
+            # Toggle the frame-time and latency overlay
+            latency_overlay=QtWidgets.QCheckBox(),
             # Real time curve
             line1_color=QtWidgets.QPushButton("    "),
             line1_width=QtWidgets.QSpinBox(),
@@ -952,8 +1457,9 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
                 _ref_value, _show_grid_flag, _show_grid_flag)
 
             a, b = data[0][-1], data[-1][-1]
-            self.signal_monitor_widget.setXRange(a, b)
-            self.signal_monitor_widget.setYRange(0, 2 * self.ref_value)
+            self.signal_monitor_widget.set_x_range(a, b)
+            self.signal_monitor_widget.set_y_range(0, 2 * self.ref_value)
+            self.signal_monitor_widget.clear_curves()
             self.signal_monitor_widget.update_curve1(data)
             self.signal_monitor_widget.update_curve3(
                 a, b, self.ref_value, True)
@@ -993,7 +1499,7 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
                     zone_playback.setChecked(False)
                     return
 
-                self.timer.stop()
+                self.render_clock.stop()
                 # _display_loaded_curve(self.device_reader.fake_pressure.buffer)
                 _display_loaded_curve(obj['data'], obj['folder'])
             else:
@@ -1006,6 +1512,23 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         inputs["display_mode"].addItems(self.display_modes)
         inputs["display_mode"].setCurrentText(self.display_mode)
 
+        # --------------------------------------------------------------------------------
+        inputs["target_fps"].addItems(
+            [f'{e}' for e in RenderClock.target_fps_options])
+        inputs["target_fps"].setCurrentText(f'{RenderClock.target_fps}')
+
+        def _change_target_fps(text):
+            if self.render_clock is not None:
+                self.render_clock.set_target_fps(int(text))
+
+        inputs["target_fps"].currentTextChanged.connect(_change_target_fps)
+
+        # --------------------------------------------------------------------------------
+        inputs["latency_overlay"].setChecked(
+            self.signal_monitor_widget.latency_text.isVisible())
+        inputs["latency_overlay"].toggled.connect(
+            self.signal_monitor_widget.latency_text.setVisible)
+
         # --------------------------------------------------------------------------------
         # zone1
         zone_realtime_setup = QtWidgets.QGroupBox(_tr("Curve (realtime)"))
@@ -1116,14 +1639,12 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         zone_two_steps_animation.setLayout(vbox_two_steps_animation)
 
         def _change_two_steps_animation_mean_threshold(value):
-            tssa_cls.mean_threshold = value
-            tssa_cct.mean_threshold = value
+            scenes.configure(two_steps_scenes, mean_threshold=value)
             logger.debug(
                 f'Changed two_steps_animation_mean_threshold to {value}')
 
         def _change_two_steps_animation_std_threshold(value):
-            tssa_cls.std_threshold = value
-            tssa_cct.std_threshold = value
+            scenes.configure(two_steps_scenes, std_threshold=value)
             logger.debug(
                 f'Changed two_steps_animation_std_threshold to {value}')
 
@@ -1133,7 +1654,7 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         obj = inputs['two_steps_animation_mean_threshold']
         obj.setMinimum(0)
         obj.setMaximum(200)
-        obj.setValue(tssa_cls.mean_threshold)
+        obj.setValue(TwoStepScore_Animation_CatLeavesSubmarine.mean_threshold)
         obj.valueChanged.connect(_change_two_steps_animation_mean_threshold)
         hbox.addWidget(obj)
 
@@ -1143,7 +1664,7 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         obj = inputs['two_steps_animation_std_threshold']
         obj.setMinimum(0)
         obj.setMaximum(200)
-        obj.setValue(tssa_cls.std_threshold)
+        obj.setValue(TwoStepScore_Animation_CatLeavesSubmarine.std_threshold)
         obj.valueChanged.connect(_change_two_steps_animation_std_threshold)
         hbox.addWidget(obj)
 
@@ -1191,22 +1712,26 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
 
         def _change_ref_value(v):
             self.ref_value = v
-            tssa_cls.ref_value = v
-            tssa_cct.ref_value = v
+            self.metrics_stage.set_ref_value(v)
+            scenes.configure(two_steps_scenes, ref_value=v)
             inputs['line3_ref_value_spin'].setValue(v)
             self.signal_monitor_widget.ellipse4_size_changed(v)
+            self.subject_window.signal_monitor_widget.ellipse4_size_changed(v)
 
         def _change_ref_value_spin(v):
             self.ref_value = v
-            tssa_cls.ref_value = v
-            tssa_cct.ref_value = v
+            self.metrics_stage.set_ref_value(v)
+            scenes.configure(two_steps_scenes, ref_value=v)
             inputs['line3_ref_value'].setValue(v)
             self.signal_monitor_widget.ellipse4_size_changed(v)
+            self.subject_window.signal_monitor_widget.ellipse4_size_changed(v)
 
         inputs["line3_ref_value"].valueChanged.connect(_change_ref_value)
         inputs["line3_ref_value_spin"].valueChanged.connect(
             _change_ref_value_spin)
         self.signal_monitor_widget.ellipse4_size_changed(self.ref_value)
+        self.subject_window.signal_monitor_widget.ellipse4_size_changed(
+            self.ref_value)
 
         def _check_zone3(b):
             self.display_ref_flag = b
@@ -1302,12 +1827,14 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
                 return
 
             self.signal_monitor_widget.pen1.setColor(qColor)
+            self._mirror_pens()
             _fit_color1()
 
             logger.debug(f"Set line1 color to: {qColor}")
 
         def _change_width1(width):
             self.signal_monitor_widget.pen1.setWidth(width)
+            self._mirror_pens()
 
         _fit_color1()
         _change_width1(2)
@@ -1332,12 +1859,14 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
                 return
 
             self.signal_monitor_widget.pen2.setColor(qColor)
+            self._mirror_pens()
             _fit_color2()
 
             logger.debug(f"Set line2 color to: {qColor}")
 
         def _change_width2(width):
             self.signal_monitor_widget.pen2.setWidth(width)
+            self._mirror_pens()
 
         _fit_color2()
         _change_width2(2)
@@ -1362,12 +1891,14 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
                 return
 
             self.signal_monitor_widget.pen3.setColor(qColor)
+            self._mirror_pens()
             _fit_color3()
 
             logger.debug(f"Set line3 color to: {qColor}")
 
         def _change_width3(width):
             self.signal_monitor_widget.pen3.setWidth(width)
+            self._mirror_pens()
 
         _fit_color3()
         _change_width3(2)
@@ -1378,6 +1909,8 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         # --------------------------------------------------------------------------------
         def _enter_into_display_mode(display_mode: str):
             self.display_mode = display_mode
+            monitors = [self.signal_monitor_widget,
+                        self.subject_window.signal_monitor_widget]
 
             if display_mode == "Realtime":
                 zone_realtime_setup.setVisible(True)
@@ -1387,8 +1920,9 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
                 zone_animation.setVisible(False)
                 zone_two_steps_animation.setVisible(False)
 
-                self.signal_monitor_widget.getPlotItem().showAxis('left')
-                self.signal_monitor_widget.getPlotItem().showAxis('bottom')
+                for monitor in monitors:
+                    monitor.getPlotItem().showAxis('left')
+                    monitor.getPlotItem().showAxis('bottom')
 
             if display_mode == "Delayed":
                 zone_realtime_setup.setVisible(True)
@@ -1398,8 +1932,9 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
                 zone_animation.setVisible(False)
                 zone_two_steps_animation.setVisible(False)
 
-                self.signal_monitor_widget.getPlotItem().showAxis('left')
-                self.signal_monitor_widget.getPlotItem().showAxis('bottom')
+                for monitor in monitors:
+                    monitor.getPlotItem().showAxis('left')
+                    monitor.getPlotItem().showAxis('bottom')
 
             if display_mode == "Animation fit":
                 zone_realtime_setup.setVisible(False)
@@ -1409,9 +1944,10 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
                 zone_animation.setVisible(True)
                 zone_two_steps_animation.setVisible(False)
 
-                self.signal_monitor_widget.getPlotItem().hideAxis('left')
-                self.signal_monitor_widget.getPlotItem().hideAxis('bottom')
-                sa.reset()
+                for monitor in monitors:
+                    monitor.getPlotItem().hideAxis('left')
+                    monitor.getPlotItem().hideAxis('bottom')
+                self._reset_scene(display_mode)
 
             if display_mode == 'Cat leaves submarine':
                 zone_realtime_setup.setVisible(False)
@@ -1421,9 +1957,10 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
                 zone_animation.setVisible(False)
                 zone_two_steps_animation.setVisible(True)
 
-                self.signal_monitor_widget.getPlotItem().hideAxis('left')
-                self.signal_monitor_widget.getPlotItem().hideAxis('bottom')
-                tssa_cls.reset()
+                for monitor in monitors:
+                    monitor.getPlotItem().hideAxis('left')
+                    monitor.getPlotItem().hideAxis('bottom')
+                self._reset_scene(display_mode)
 
             if display_mode == 'Cat climbs tree':
                 zone_realtime_setup.setVisible(False)
@@ -1433,9 +1970,10 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
                 zone_animation.setVisible(False)
                 zone_two_steps_animation.setVisible(True)
 
-                self.signal_monitor_widget.getPlotItem().hideAxis('left')
-                self.signal_monitor_widget.getPlotItem().hideAxis('bottom')
-                tssa_cct.reset()
+                for monitor in monitors:
+                    monitor.getPlotItem().hideAxis('left')
+                    monitor.getPlotItem().hideAxis('bottom')
+                self._reset_scene(display_mode)
 
         inputs["display_mode"].currentTextChanged.connect(
             _enter_into_display_mode)
@@ -1452,6 +1990,14 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         # zone_two_steps_animation: option for two steps animation
         # zone_playback: option for playback
         main_box_layout.addWidget(inputs["display_mode"])
+        hbox = QtWidgets.QHBoxLayout()
+        hbox.addWidget(QtWidgets.QLabel(_tr("Target FPS")))
+        hbox.addWidget(inputs["target_fps"])
+        main_box_layout.addLayout(hbox)
+        hbox = QtWidgets.QHBoxLayout()
+        hbox.addWidget(QtWidgets.QLabel(_tr("Latency overlay")))
+        hbox.addWidget(inputs["latency_overlay"])
+        main_box_layout.addLayout(hbox)
         main_box_layout.addWidget(zone_realtime_setup)
         main_box_layout.addWidget(zone_delayed_setup)
         main_box_layout.addWidget(zone_animation)
@@ -1779,7 +2325,7 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         if pairs is None:
             return
 
-        if not pairs:
+        if len(pairs) == 0:
             return
 
         t0 = pairs[0][-1]
@@ -1789,14 +2335,17 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         # and update the status_text component accordingly.
         n = len(pairs) - 1
         sample_rate = n / max(t1 - t0, 1e-4)
-        self.signal_monitor_widget.status_text.setText(f"{sample_rate:.2f} Hz")
+        fps = 0 if self.render_clock is None else self.render_clock.achieved_fps
+        self.signal_monitor_widget.status_text.setText(
+            f"{sample_rate:.2f} Hz | {fps:.0f} FPS")
+        self.signal_monitor_widget.update_latency_text()
 
         block = self.block_manager.consume(t1)
 
         if block == "Consumed all the blocks.":
             self.signal_monitor_widget.block_text.setText("Finished")
             logger.debug("Block design is completed.")
-            self.fake_blocks = []
+            self._set_fake_blocks([])
             self.save_data()
             return
 
@@ -1827,7 +2376,7 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         return t0, t1, block_name
 
     def update_curve13(
-        self, pairs: list, t0: float, t1: float, block_name: str, expand_t: float = 0
+        self, pairs: list, t0: float, t1: float, block_name: str, expand_t: float = 0, monitor: SignalMonitorWidget = None
     ):
         """
         Update the curve1 (the realtime curve) and curve3 (the reference line) in the signal displaying widget (the pyqtgraph figure)
@@ -1838,41 +2387,63 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
             t1 (float): The end time of the new data;
             block_name (str): The block_name, it controls how the curve1 and curve3 is drawn;
             expand_t (float, optional): How many seconds the end time is expanded to the xRange. Defaults to 0.
+            monitor (SignalMonitorWidget, optional): The monitor to draw. Defaults to None, the signal_monitor_widget.
         """
-        self.signal_monitor_widget.setXRange(
+        if monitor is None:
+            monitor = self.signal_monitor_widget
+
+        monitor.set_x_range(
             t0, max(t1, self.window_length_seconds) + expand_t, padding=0
         )
 
         if block_name == "Hide":
             # Hide the feedback curves if the block_name is "hide"
-            self.signal_monitor_widget.update_curve1([])
-            self.signal_monitor_widget.update_curve3(0, 0, 0, False)
+            monitor.update_curve1([])
+            monitor.update_curve3(0, 0, 0, False)
         else:
             # Otherwise, show the curves
-            self.signal_monitor_widget.update_curve1(pairs)
-            self.signal_monitor_widget.update_curve3(
+            monitor.update_curve1(pairs)
+            monitor.update_curve3(
                 t0,
                 max(t1, self.window_length_seconds) + expand_t,
                 self.ref_value,
                 self.display_ref_flag,
             )
 
-    def update_curve2(self, pairs_delay: list):
+    def update_curve2(self, pairs_delay: list, monitor: SignalMonitorWidget = None):
         """
         Update the curve2 (the delayed curve)
 
         Args:
             pairs_delay (list): The delayed mean value of the incoming new data.
+            monitor (SignalMonitorWidget, optional): The monitor to draw. Defaults to None, the signal_monitor_widget.
         """
         if pairs_delay is None:
             return
 
-        self.signal_monitor_widget.update_curve2(pairs_delay)
+        if monitor is None:
+            monitor = self.signal_monitor_widget
 
-    def _resize_animation_img(self):
-        o = self.signal_monitor_widget
-        width = int(o.width() - 2)
-        height = int(o.height() - 32)
+        monitor.update_curve2(pairs_delay)
+
+    def _animation_size(self) -> tuple:
+        """
+        The size of the animation,
+        it fits the subject's monitor, it is the last one.
+
+        Returns:
+            tuple: The (width, height).
+        """
+        o = self.monitors()[-1]
+        return int(o.width() - 2), int(o.height() - 32)
+
+    def _on_resize_settled(self):
+        """
+        Resize the animations as the size settles, it is debounced by the self.resize_timer.
+        The scenes render their resources for the size in the background,
+        and they keep the resources of the previous size until the new ones are ready.
+        """
+        width, height = self._animation_size()
 
         # --------------------
         # Check if the width and height are correct
@@ -1881,23 +2452,93 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         #     self.signal_monitor_widget.animation_img.pixelWidth(),
         #     self.signal_monitor_widget.animation_img.pixelHeight()))
 
-        # --------------------
-        sa.width = width
-        sa.height = height
-
-        # --------------------
-        tssa_cls.width = width
-        tssa_cls.height = height
+        if (width, height) == self.animation_size or width <= 0 or height <= 0:
+            return
 
         # --------------------
-        tssa_cct.width = width
-        tssa_cct.height = height
+        # The scenes created later are also resized
+        self.animation_size = (width, height)
+        scenes.resize(width, height)
 
         logger.debug(f'Resized animation image into {(width, height)}')
 
-        # print(w, pw, h, ph)
+    def _reset_scene(self, name: str, request: bool = True):
+        """
+        Reset the scene if it is ready.
 
-    def _compare_animation_feedback(self, values):
+        Args:
+            name (str): The name of the scene, it is the display mode;
+            request (bool, optional): Whether to request the scene if it is not created. Defaults to True.
+        """
+        scene = scenes.get(name) if request else scenes.loaded().get(name)
+        if scene is not None:
+            scene.reset()
+
+    def _get_scene(self, name: str):
+        """
+        Get the ready scene, or show the placeholder if it is not ready.
+        The resource errors of the scene are popped-up as it is first got.
+
+        Args:
+            name (str): The name of the scene, it is the display mode.
+
+        Returns:
+            The scene or None.
+        """
+        scene = scenes.get(name)
+
+        if scene is None:
+            self._show_placeholder(name)
+            return None
+
+        if name not in self.checked_scenes:
+            self.checked_scenes.add(name)
+            if not scene.resource_OK:
+                self._report_resource_errors([
+                    f'Failed to load resource of {name} animation',
+                    scene.resource_traceback])
+
+        return scene
+
+    def _show_placeholder(self, name: str):
+        """
+        Show the placeholder of the scene which is not ready.
+
+        Args:
+            name (str): The name of the scene.
+        """
+        width, height = self._animation_size()
+        for monitor in self.monitors():
+            monitor.animation_mode(width, height)
+
+        key = (name, width, height)
+        if self.placeholder_key != key:
+            self.placeholder_key = key
+            self.placeholder = make_placeholder(
+                f'Loading {name} ...', width, height)
+
+        if self.animation_frame is not self.placeholder:
+            self._set_animation_img(flip_frame(self.placeholder), flipped=True)
+            self.animation_frame = self.placeholder
+            for monitor in self.monitors():
+                monitor.update_tiny_window(
+                    {k: ([], []) for k in monitor.tiny_window_curves})
+
+    def _report_resource_errors(self, messages: list):
+        """
+        Pop-up the known errors.
+
+        Args:
+            messages (list): The messages.
+        """
+        logger.error(f'Failed to load resources: {messages}')
+
+        # The dialog blocks forever on the headless (offscreen) platform, so it only logs
+        if QApplication.platformName() != 'offscreen':
+            dlg = CustomDialog(messages=messages)
+            dlg.exec()
+
+    def _compare_animation_feedback(self, values, sa: ScoreAnimation):
         avg, std, _ = values
 
         step = 0
@@ -1928,57 +2569,85 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
 
         return score
 
+    def _set_animation_img(self, mat: np.ndarray, flipped: bool = False):
+        """
+        Set the animation image of the monitors,
+        the image is rendered once and shared by the monitors.
+
+        Args:
+            mat (np.ndarray): The image, the shape is (height, width, 3);
+            flipped (bool, optional): Whether the image is pre-flipped. Defaults to False.
+        """
+        self.frame_uploader.upload(
+            [monitor.animation_img for monitor in self.monitors()], mat, flipped)
+
+    def _show_animation(self, anim, pairs_delay=None, block_name='Real'):
+        """
+        Show the frame of the animation chosen by the elapsed time,
+        and draw the tiny window above it.
+        The frame is uploaded only if it is changed,
+        the tiny window is the plot curves, so it never redraws the frame.
+
+        Args:
+            anim (AutomaticAnimation): The animation;
+            pairs_delay (list, optional): The data of the tiny window. Defaults to None;
+            block_name (str, optional): The block name. Defaults to 'Real'.
+        """
+        frame = anim.advance()
+
+        # Enter into the animation mode,
+        # the range follows the frame, since the frames of the previous size may be playing
+        for monitor in self.monitors():
+            monitor.animation_mode(*anim.frame_size)
+
+        if frame is not self.animation_frame:
+            self._set_animation_img(frame, flipped=True)
+            self.animation_frame = frame
+
+        curves = anim.tiny_window_curves(
+            ref=self.ref_value, data=pairs_delay, block_name=block_name)
+        for monitor in self.monitors():
+            monitor.update_tiny_window(curves)
+
     def update_cat_climbs_tree_animation(self, need_update_flag: bool, pairs_delay=None, block_name='Real'):
-        # Enter into the animation mode
-        self.signal_monitor_widget.animation_mode()
+        tssa_cct = self._get_scene('Cat climbs tree')
+        if tssa_cct is None:
+            return
 
         # Update the score if-and-only-if the flag is set
         if need_update_flag:
-            self._resize_animation_img()
-
-            Thread(
-                target=tssa_cct.update_score,
-                args=(pairs_delay, block_name), daemon=True).start()
+            animation_scheduler.submit(
+                tssa_cct.update_score, pairs_delay, block_name)
 
         # Always update the tiny window
-        # Draw the tiny window for pressure feedback
-        mat = pil2rgb(tssa_cct.tiny_window(
-            ref=self.ref_value, data=pairs_delay, block_name=block_name))
-        self.signal_monitor_widget.animation_img.setImage(
-            mat[::-1].transpose([1, 0, 2])
-        )
+        # Draw the tiny window for pressure feedback,
+        # over the frame chosen by the elapsed time
+        self._show_animation(tssa_cct, pairs_delay, block_name)
 
     def update_cat_leaves_submarine_animation(self, need_update_flag: bool, pairs_delay=None, block_name='Real'):
-        # Enter into the animation mode
-        self.signal_monitor_widget.animation_mode()
+        tssa_cls = self._get_scene('Cat leaves submarine')
+        if tssa_cls is None:
+            return
 
         # Update the score if-and-only-if the flag is set
         if need_update_flag:
-            self._resize_animation_img()
-
-            Thread(
-                target=tssa_cls.update_score,
-                args=(pairs_delay, block_name), daemon=True).start()
+            animation_scheduler.submit(
+                tssa_cls.update_score, pairs_delay, block_name)
 
         # Always update the tiny window
-        # Draw the tiny window for pressure feedback
-        mat = pil2rgb(tssa_cls.tiny_window(
-            ref=self.ref_value, data=pairs_delay, block_name=block_name))
-
-        self.signal_monitor_widget.animation_img.setImage(
-            mat[::-1].transpose([1, 0, 2]), autoLevels=False
-        )
+        # Draw the tiny window for pressure feedback,
+        # over the frame chosen by the elapsed time
+        self._show_animation(tssa_cls, pairs_delay, block_name)
 
     def update_animation_img(self, need_update_flag: bool, pairs_delay=None):
-        # Enter into the animation mode
-        self.signal_monitor_widget.animation_mode()
+        sa = self._get_scene('Animation fit')
+        if sa is None:
+            return
 
         # Update the score if-and-only-if the flag is set
         if need_update_flag:
-            self._resize_animation_img()
-
-            if pairs_delay:
-                score = self._compare_animation_feedback(pairs_delay[-1])
+            if len(pairs_delay) > 0:
+                score = self._compare_animation_feedback(pairs_delay[-1], sa)
             else:
                 score = sa.score
 
@@ -1986,16 +2655,14 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
             # score = np.random.randint(1, 99)
 
             # sa.mk_frames(score)
-            Thread(target=sa.mk_frames, args=(score,), daemon=True).start()
+            animation_scheduler.submit(sa.mk_frames, score)
 
         # Always update the tiny window
-        # Draw the tiny window for pressure feedback
-        mat = pil2rgb(sa.tiny_window(ref=self.ref_value, data=pairs_delay))
-        self.signal_monitor_widget.animation_img.setImage(
-            mat[::-1].transpose([1, 0, 2])
-        )
+        # Draw the tiny window for pressure feedback,
+        # over the frame chosen by the elapsed time
+        self._show_animation(sa, pairs_delay)
 
-    def _setup_frame_display_modes_inside_monitor(self, display_mode: str = None):
+    def _setup_frame_display_modes_inside_monitor(self, display_mode: str = None, monitor: SignalMonitorWidget = None):
         """
         Setup visible value for the curves according to the current self.display_mode
 
@@ -2004,73 +2671,67 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         if display_mode is None:
             display_mode = self.display_mode
 
+        # The visibility is applied only if it is changed
+        o = self.signal_monitor_widget if monitor is None else monitor
+
         if display_mode == "Delayed":
-            self.signal_monitor_widget.curve1.setVisible(True)
-            self.signal_monitor_widget.curve2.setVisible(True)
-            self.signal_monitor_widget.curve3.setVisible(
-                self.display_inputs["zone3"].isChecked()
-            )
-            self.signal_monitor_widget.ellipse4.setVisible(False)
-            self.signal_monitor_widget.ellipse5.setVisible(False)
-            self.signal_monitor_widget.animation_img.setVisible(False)
-            self.signal_monitor_widget.current_block_remainder_text.setVisible(
-                True)
+            o.set_visible(o.curve1, True)
+            o.set_visible(o.curve2, True)
+            o.set_visible(o.curve3, self.display_inputs["zone3"].isChecked())
+            o.set_visible(o.ellipse4, False)
+            o.set_visible(o.ellipse5, False)
+            o.set_animation_visible(False)
+            o.set_visible(o.current_block_remainder_text, not o.subject_view)
 
         if display_mode == "Realtime":
-            self.signal_monitor_widget.curve1.setVisible(True)
-            self.signal_monitor_widget.curve2.setVisible(False)
-            self.signal_monitor_widget.curve3.setVisible(
-                self.display_inputs["zone3"].isChecked()
-            )
-            self.signal_monitor_widget.ellipse4.setVisible(False)
-            self.signal_monitor_widget.ellipse5.setVisible(False)
-            self.signal_monitor_widget.animation_img.setVisible(False)
-            self.signal_monitor_widget.current_block_remainder_text.setVisible(
-                True)
+            o.set_visible(o.curve1, True)
+            o.set_visible(o.curve2, False)
+            o.set_visible(o.curve3, self.display_inputs["zone3"].isChecked())
+            o.set_visible(o.ellipse4, False)
+            o.set_visible(o.ellipse5, False)
+            o.set_animation_visible(False)
+            o.set_visible(o.current_block_remainder_text, not o.subject_view)
 
         if display_mode == "Circle fit":
-            self.signal_monitor_widget.curve1.setVisible(False)
-            self.signal_monitor_widget.curve2.setVisible(False)
-            self.signal_monitor_widget.curve3.setVisible(False)
-            self.signal_monitor_widget.ellipse4.setVisible(True)
-            self.signal_monitor_widget.ellipse5.setVisible(True)
-            self.signal_monitor_widget.animation_img.setVisible(False)
-            self.signal_monitor_widget.current_block_remainder_text.setVisible(
-                True)
+            o.set_visible(o.curve1, False)
+            o.set_visible(o.curve2, False)
+            o.set_visible(o.curve3, False)
+            o.set_visible(o.ellipse4, True)
+            o.set_visible(o.ellipse5, True)
+            o.set_animation_visible(False)
+            o.set_visible(o.current_block_remainder_text, not o.subject_view)
 
         if display_mode == "Animation fit":
-            self.signal_monitor_widget.curve1.setVisible(False)
-            self.signal_monitor_widget.curve2.setVisible(False)
-            self.signal_monitor_widget.curve3.setVisible(False)
-            self.signal_monitor_widget.ellipse4.setVisible(False)
-            self.signal_monitor_widget.ellipse5.setVisible(False)
-            self.signal_monitor_widget.animation_img.setVisible(True)
-            self.signal_monitor_widget.current_block_remainder_text.setVisible(
-                False)
+            o.set_visible(o.curve1, False)
+            o.set_visible(o.curve2, False)
+            o.set_visible(o.curve3, False)
+            o.set_visible(o.ellipse4, False)
+            o.set_visible(o.ellipse5, False)
+            o.set_animation_visible(True)
+            o.set_visible(o.current_block_remainder_text, False)
 
         if display_mode == "Cat leaves submarine":
-            self.signal_monitor_widget.curve1.setVisible(False)
-            self.signal_monitor_widget.curve2.setVisible(False)
-            self.signal_monitor_widget.curve3.setVisible(False)
-            self.signal_monitor_widget.ellipse4.setVisible(False)
-            self.signal_monitor_widget.ellipse5.setVisible(False)
-            self.signal_monitor_widget.animation_img.setVisible(True)
-            self.signal_monitor_widget.current_block_remainder_text.setVisible(
-                False)
+            o.set_visible(o.curve1, False)
+            o.set_visible(o.curve2, False)
+            o.set_visible(o.curve3, False)
+            o.set_visible(o.ellipse4, False)
+            o.set_visible(o.ellipse5, False)
+            o.set_animation_visible(True)
+            o.set_visible(o.current_block_remainder_text, False)
 
         if display_mode == "Cat climbs tree":
-            self.signal_monitor_widget.curve1.setVisible(False)
-            self.signal_monitor_widget.curve2.setVisible(False)
-            self.signal_monitor_widget.curve3.setVisible(False)
-            self.signal_monitor_widget.ellipse4.setVisible(False)
-            self.signal_monitor_widget.ellipse5.setVisible(False)
-            self.signal_monitor_widget.animation_img.setVisible(True)
-            self.signal_monitor_widget.current_block_remainder_text.setVisible(
-                False)
+            o.set_visible(o.curve1, False)
+            o.set_visible(o.curve2, False)
+            o.set_visible(o.curve3, False)
+            o.set_visible(o.ellipse4, False)
+            o.set_visible(o.ellipse5, False)
+            o.set_animation_visible(True)
+            o.set_visible(o.current_block_remainder_text, False)
 
     def update_graph(self, pairs: list, pairs_delay: list):
         """
-        Update the graph as the very fast loop
+        Update the graph as the very fast loop,
+        the frame snapshot is computed once and shared by the monitors.
 
         Args:
             pairs (list): The incoming data from the hid device. Defaults to None.
@@ -2082,42 +2743,24 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
         if current_block is None:
             return
 
+        monitors = self.monitors()
+
         # Automatically toggle the display status of the graph components
-        self._setup_frame_display_modes_inside_monitor()
+        for monitor in monitors:
+            self._setup_frame_display_modes_inside_monitor(monitor=monitor)
 
         # The t0, t1 is the start, stop time of the incoming data
         # The block_name is one of ['Real', 'Fake', 'Hide']
         t0, t1, block_name = current_block
 
-        # Make sure the points inside the fake blocks are correctly re-assigned
-        # The re-assignment is cut off the 1st and 2nd elements of the array,
-        # it makes sure the fake pressure value is on the head of the array.
-        pairs = [
-            p[2:]
-            # Check if the current time point is inside the fake blocks
-            if any(
-                p[-1] > fb["start"] and p[-1] < fb["stop"] for fb in self.fake_blocks
-            )
-            else p
-            for p in pairs
-        ]
+        snapshot = FrameSnapshot(
+            t0, t1, block_name,
+            np.asarray(pairs, dtype=np.float64).reshape(-1, 5),
+            np.asarray(pairs_delay, dtype=np.float64).reshape(-1, 5),
+            self.fake_block_intervals,
+            self.delay_seconds)
 
-        # ! The buffer_delay is not the delayed buffer, but its statistic, including avg. and std. values
-        # The buffer_delay's row is:
-        # (avg-pressure, fake-avg-pressure, std-pressure, fake-std-pressure, timestamp)
-        # This uses the columns for both avg. (0|1), std. (2|3) values, and timestamp (4)
-        # The output pairs_delay's row is (avg, std, timestamp)
-        pairs_delay = [
-            (p[1], p[3], p[4])
-            # Check if the current time point is inside the fake blocks
-            if any(
-                p[-1] + self.delay_seconds > fb["start"]
-                and p[-1] + self.delay_seconds < fb["stop"]
-                for fb in self.fake_blocks
-            )
-            else (p[0], p[2], p[4])
-            for p in pairs_delay
-        ]
+        pairs_delay = snapshot.pairs_delay
 
         # Display the animation img
         if self.display_mode == "Animation fit":
@@ -2160,6 +2803,32 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
                 need_update_flag, pairs_delay, block_name)
             return
 
+        # The subject sees the feedback,
+        # and the operator sees the raw curves if the subject has the own window.
+        if len(monitors) > 1:
+            self.draw_curves(snapshot, monitors[0], raw=True)
+            self.draw_curves(snapshot, monitors[1])
+        else:
+            self.draw_curves(snapshot, monitors[0])
+
+        return
+
+    def draw_curves(self, snapshot: FrameSnapshot, monitor: SignalMonitorWidget, raw: bool = False):
+        """
+        Draw the curves of the snapshot on the monitor.
+
+        Args:
+            snapshot (FrameSnapshot): The frame snapshot;
+            monitor (SignalMonitorWidget): The monitor to draw;
+            raw (bool, optional): Draw the raw curves, the fake blocks are not substituted and the curves are not hidden. Defaults to False.
+        """
+        t0, t1 = snapshot.t0, snapshot.t1
+
+        if raw:
+            pairs, pairs_delay, block_name = snapshot.raw_pairs, snapshot.raw_pairs_delay, "Real"
+        else:
+            pairs, pairs_delay, block_name = snapshot.pairs, snapshot.pairs_delay, snapshot.block_name
+
         # Enter the curve mode for the monitor
         _ref_value = self.ref_value
         _show_grid_flag = self.display_inputs['grid_toggle'].isChecked()
@@ -2168,7 +2837,7 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
             _ref_value = None
             _show_grid_flag = False
 
-        self.signal_monitor_widget.enter_curve_mode(
+        monitor.enter_curve_mode(
             _ref_value, _show_grid_flag, _show_grid_flag)
 
         if self.display_mode == "Delayed":
@@ -2179,28 +2848,27 @@ class UserInterfaceWidget(QtWidgets.QMainWindow):
                 t1,
                 block_name,
                 expand_t=self.window_length_seconds - self.delay_seconds * 2,
+                monitor=monitor,
             )
 
             if block_name != "Empty":
-                self.update_curve2(pairs_delay)
+                self.update_curve2(pairs_delay, monitor=monitor)
 
         if self.display_mode == "Realtime":
             self.update_curve13(
-                pairs, t0, t1, block_name, expand_t=self.window_length_seconds
+                pairs, t0, t1, block_name, expand_t=self.window_length_seconds, monitor=monitor
             )
 
         if self.display_mode == "Circle fit":
-            self.signal_monitor_widget.setXRange(
-                self.signal_monitor_widget.min_value,
-                self.signal_monitor_widget.max_value,
+            monitor.set_x_range(
+                monitor.min_value,
+                monitor.max_value,
             )
             if pairs is not None:
                 if len(pairs) > 0:
-                    self.signal_monitor_widget.ellipse5_size_changed(
+                    monitor.ellipse5_size_changed(
                         pairs[-1][0], self.ref_value)
 
-        return
-
 
 # %% ---- 2023-09-17 ------------------------
 # Play ground
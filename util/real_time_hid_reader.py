@@ -182,6 +182,11 @@ class RealTimeHidReader(object):
         The getting loop function, it is a running-forever loop;
         The method updates the self.buffer in sample_rate frequency;
     @peek(n) (method): Peek the latest n-points data in the buffer;
+    @on_samples (callable):
+        It is called with the count of the buffer's points as new points are appended,
+        it is called inside the reading loop, so it MUST be very fast.
+    @tic (float): The wall time (time.time()) as the reading loop starts,
+        the timestamp plus it is the wall time of the sample.
 
     """
 
@@ -199,6 +204,14 @@ class RealTimeHidReader(object):
     pseudo_data = None
     fake_pressure = FakePressure()
 
+    # The buffers are replaced with new lists as the reading loop starts
+    buffer = []
+    buffer_delay = []
+
+    on_samples = None
+
+    tic = 0.0
+
     running = False
 
     def __init__(self, device: TargetDevice):
@@ -302,6 +315,7 @@ class RealTimeHidReader(object):
             logger.debug('Starts the reading loop')
 
             tic = time.time()
+            self.tic = tic
             while self.running:
                 t = time.time()
 
@@ -348,6 +362,10 @@ class RealTimeHidReader(object):
                     # self.buffer_delay.append((avg, std, timestamp))
                     self.buffer_delay.append(avg+std+(timestamp,))
 
+                # Notify the new samples are available
+                if self.on_samples is not None:
+                    self.on_samples(self.n)
+
             t = time.time()
             logger.debug(
                 f'Stopped the reading loop on {t}, lasting {t - tic} seconds.')
@@ -0,0 +1,119 @@
+"""
+File: render_clock.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The fixed-rate render clock,
+    it schedules the rendering on the Qt.PreciseTimer with the target FPS,
+    and skips the frames when no new samples have arrived.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import time
+
+from PySide2 import QtCore
+
+from . import logger, project_conf
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+class RenderClock(QtCore.QObject):
+    """
+    The fixed-rate render clock.
+
+    @start() (method): Start the clock;
+    @stop() (method): Stop the clock;
+    @set_target_fps(fps) (method): Change the target FPS;
+    @achieved_fps (float): The achieved FPS, it is measured every second;
+    @skipped (int): The count of the skipped frames, since no new samples had arrived.
+    """
+
+    target_fps_options = [30, 60, 120]
+    target_fps = project_conf['display']['target_fps']
+
+    def __init__(self, callback, has_new_samples=None, target_fps: int = None):
+        """
+        Args:
+            callback (callable): The render function;
+            has_new_samples (callable, optional): It returns whether new samples have arrived, the frame is skipped if not. Defaults to None, never skip.
+            target_fps (int, optional): The target FPS. Defaults to the configured target_fps.
+        """
+        super().__init__()
+
+        self.callback = callback
+        self.has_new_samples = has_new_samples
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.timer.timeout.connect(self._tick)
+
+        self.frames = 0
+        self.skipped = 0
+        self.achieved_fps = 0.0
+        self._measure_tic = time.perf_counter()
+        self._measure_frames = 0
+
+        self.set_target_fps(
+            self.target_fps if target_fps is None else target_fps)
+
+        logger.debug(f'Initialized {self.__class__}')
+
+    def set_target_fps(self, fps: int):
+        self.target_fps = int(fps)
+        self.timer.setInterval(int(round(1000 / self.target_fps)))
+        logger.debug(
+            f'Set render clock target FPS: {self.target_fps}, interval: {self.timer.interval()} ms')
+
+    def start(self):
+        self._measure_tic = time.perf_counter()
+        self._measure_frames = 0
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def _measure(self):
+        """Measure the achieved FPS every second."""
+        now = time.perf_counter()
+        if now - self._measure_tic >= 1.0:
+            self.achieved_fps = self._measure_frames / \
+                (now - self._measure_tic)
+            self._measure_tic = now
+            self._measure_frames = 0
+
+    def _tick(self):
+        self._measure()
+
+        if self.has_new_samples is not None and not self.has_new_samples():
+            self.skipped += 1
+            return
+
+        self.callback()
+
+        self.frames += 1
+        self._measure_frames += 1
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
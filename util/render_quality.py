@@ -0,0 +1,103 @@
+"""
+File: render_quality.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The rendering-quality policy of the monitor curves.
+    - The curves are clipped to the view, so the samples out of the xRange are not drawn;
+    - The curves are peak-mode downsampled to the plot's pixel width,
+      so the long windows cost about the same as the short ones;
+    - The antialiasing is decided per curve.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+from . import logger, project_conf
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+class RenderQualityPolicy(object):
+    """
+    The rendering-quality policy of the curves.
+
+    @clip_to_view (bool): Whether the curves are clipped to the view;
+    @auto_downsample (bool): Whether the curves are downsampled to the pixel width;
+    @downsample_method (str): The downsample method, one of ['peak', 'mean', 'subsample'];
+    @auto_downsample_factor (float): The kept points per pixel, before the peak-mode doubles it;
+    @antialias (dict): The antialias flag of the curves, the key is the curve name;
+    @curve_options(name) (method): The options of the curve, they are passed to the PlotDataItem.
+    """
+
+    clip_to_view = project_conf['display']['render_quality']['clip_to_view']
+    auto_downsample = project_conf['display']['render_quality']['auto_downsample']
+    downsample_method = project_conf['display']['render_quality']['downsample_method']
+    auto_downsample_factor = project_conf['display']['render_quality']['auto_downsample_factor']
+    antialias = dict(project_conf['display']['render_quality']['antialias'])
+
+    def __init__(self, **kwargs):
+        """
+        Args:
+            kwargs: Override the configured attributes, like clip_to_view=False.
+        """
+        for k, v in kwargs.items():
+            if not hasattr(self, k):
+                raise AttributeError(f'Unknown render quality option: {k}')
+            setattr(self, k, v)
+        logger.debug(f'Initialized {self.__class__}: {self.__dict__}')
+
+    def curve_antialias(self, name: str) -> bool:
+        """
+        The antialias flag of the curve.
+
+        Args:
+            name (str): The curve name, like 'curve1';
+                if the antialias is a bool, it is used for all the curves.
+
+        Returns:
+            bool: Whether the curve is antialiased.
+        """
+        if isinstance(self.antialias, bool):
+            return self.antialias
+        return bool(self.antialias.get(name, True))
+
+    def curve_options(self, name: str) -> dict:
+        """
+        The options of the curve.
+
+        Args:
+            name (str): The curve name, like 'curve1'.
+
+        Returns:
+            dict: The options, they are passed to the pg.PlotDataItem.
+        """
+        return dict(
+            antialias=self.curve_antialias(name),
+            clipToView=self.clip_to_view,
+            autoDownsample=self.auto_downsample,
+            downsampleMethod=self.downsample_method,
+            autoDownsampleFactor=self.auto_downsample_factor,
+        )
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
@@ -0,0 +1,90 @@
+"""
+File: retained_state.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The retained-state layer of the Qt calls,
+    it remembers the last applied values, like the visibility, ranges and grid flags,
+    and touches Qt only when the value actually changes.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+class RetainedState(object):
+    """
+    The retained-state layer.
+
+    @apply(target, method, *args, **kwargs) (method): Call the target's method if the args changed;
+    @invalidate(target) (method): Forget the values of the target, the next call is always applied;
+    @applied (int): The count of the applied calls;
+    @skipped (int): The count of the skipped calls, since the value is unchanged.
+    """
+
+    def __init__(self):
+        self._values = {}
+        self.applied = 0
+        self.skipped = 0
+
+    def apply(self, target, method: str, *args, **kwargs) -> bool:
+        """
+        Call the target's method if the args changed.
+
+        Args:
+            target (object): The Qt object;
+            method (str): The method name, like 'setVisible'.
+
+        Returns:
+            bool: Whether the call is applied.
+        """
+        key = (id(target), method)
+        value = (args, kwargs)
+
+        if self._values.get(key) == value:
+            self.skipped += 1
+            return False
+
+        getattr(target, method)(*args, **kwargs)
+        self._values[key] = value
+        self.applied += 1
+        return True
+
+    def invalidate(self, target=None):
+        """
+        Forget the values of the target.
+
+        Args:
+            target (object, optional): The Qt object. Defaults to None, forget all.
+        """
+        if target is None:
+            self._values = {}
+            return
+
+        for key in [k for k in self._values if k[0] == id(target)]:
+            self._values.pop(key)
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
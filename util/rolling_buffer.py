@@ -0,0 +1,115 @@
+"""
+File: rolling_buffer.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The preallocated append-only buffer of float arrays,
+    the latest rows are kept as contiguous column views,
+    so they are passed to pyqtgraph without conversion.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import numpy as np
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+class RollingBuffer(object):
+    """
+    The preallocated append-only buffer.
+
+    @append(rows) (method): Append the rows, the cost is proportional to the rows count;
+    @trim_before(value, column) (method): Drop the oldest rows whose value in the column is less than the value;
+    @column(i) (method): The contiguous view of the i-th column of the kept rows;
+    @rows() (method): The view of the kept rows;
+
+    - The data is stored in column-major order, the shape is (columns, size);
+    - The kept rows are moved to the head of the storage when the tail is full,
+      and the storage is doubled when the kept rows take more than half of it.
+    """
+
+    def __init__(self, columns: int, size: int = 1024):
+        self.columns = columns
+        self._data = np.zeros((columns, size), dtype=np.float64)
+        self.start = 0
+        self.stop = 0
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def clear(self):
+        self.start = 0
+        self.stop = 0
+
+    def _reserve(self, m: int):
+        size = self._data.shape[1]
+        if self.stop + m <= size:
+            return
+
+        n = len(self)
+        if n + m > size // 2:
+            data = np.zeros((self.columns, max(2 * size, 2 * (n + m))))
+            data[:, :n] = self._data[:, self.start:self.stop]
+            self._data = data
+        else:
+            self._data[:, :n] = self._data[:, self.start:self.stop]
+
+        self.start = 0
+        self.stop = n
+
+    def append(self, rows: np.ndarray):
+        """
+        Append the rows.
+
+        Args:
+            rows (np.ndarray): The rows, the shape is (m, columns).
+        """
+        m = len(rows)
+        if m == 0:
+            return
+        self._reserve(m)
+        self._data[:, self.stop:self.stop+m] = np.asarray(rows).T
+        self.stop += m
+
+    def trim_before(self, value: float, column: int = 0):
+        """
+        Drop the oldest rows whose value in the column is less than the value,
+        the column is required to be increasing, like the timestamp.
+        """
+        self.start += int(np.searchsorted(self.column(column), value))
+
+    def last(self, column: int = 0, default: float = -np.inf) -> float:
+        if self.stop == self.start:
+            return default
+        return self._data[column, self.stop - 1]
+
+    def column(self, i: int) -> np.ndarray:
+        return self._data[i, self.start:self.stop]
+
+    def rows(self) -> np.ndarray:
+        """The view of the kept rows, the shape is (n, columns)."""
+        return self._data[:, self.start:self.stop].T
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
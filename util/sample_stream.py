@@ -0,0 +1,137 @@
+"""
+File: sample_stream.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    Push the sample batches from the reader to the UI.
+    - The reader publishes "new samples available up to index N" through a queued Qt signal,
+      the notifications are coalesced so at most one is pending;
+    - The UI consumes only the new samples via the cursor, into the rolling window.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import threading
+import numpy as np
+
+from PySide2 import QtCore
+
+from . import logger
+from .buffer_cursor import BufferCursor
+from .rolling_buffer import RollingBuffer
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+class SampleNotifier(QtCore.QObject):
+    """
+    The coalesced notifier of the new samples.
+
+    @notify(n) (method): Called in the reader's thread, it emits the samples_available signal if no one is pending;
+    @take() (method): Called in the UI's thread, it gets the latest index and releases the pending;
+    @reset() (method): Discard the pending index of the old reader, it is called as the reader is stopped.
+    """
+
+    samples_available = QtCore.Signal(int)
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._pending = False
+        self._latest = 0
+
+    def notify(self, n: int):
+        with self._lock:
+            self._latest = n
+            if self._pending:
+                return
+            self._pending = True
+        self.samples_available.emit(n)
+
+    def take(self) -> int:
+        with self._lock:
+            self._pending = False
+            return self._latest
+
+    def reset(self):
+        # The signal already emitted by the old reader takes nothing
+        with self._lock:
+            self._pending = False
+            self._latest = 0
+
+
+class SampleWindow(object):
+    """
+    The rolling window of the reader's buffer and buffer_delay.
+
+    @pull(reader, stop) (method): Consume the new samples into the window;
+    @pairs() (method): The window of the buffer, the shape is (n, 5);
+    @pairs_delay() (method): The window of the buffer_delay, the shape is (n, 5).
+
+    - The window is cleared as the reader restarts.
+    """
+
+    def __init__(self, window_length_seconds: float):
+        self.window_length_seconds = window_length_seconds
+        self.samples = RollingBuffer(5)
+        self.samples_delay = RollingBuffer(5)
+        self.cursor = BufferCursor()
+        self.cursor_delay = BufferCursor()
+        logger.debug(f'Initialized {self.__class__}')
+
+    def _append(self, buffer: RollingBuffer, cursor: BufferCursor, rows: list):
+        if cursor.restarted:
+            buffer.clear()
+
+        if rows:
+            buffer.append(np.array(rows, dtype=np.float64))
+            buffer.trim_before(
+                buffer.last(4) - self.window_length_seconds, column=4)
+
+    def pull(self, reader, stop: int = None) -> list:
+        """
+        Consume the new samples into the window.
+
+        Args:
+            reader (RealTimeHidReader): The reader;
+            stop (int, optional): Consume the buffer until the stop index. Defaults to None, consume all.
+
+        Returns:
+            list: The new samples of the buffer.
+        """
+        rows = self.cursor.read(reader.buffer, stop)
+        self._append(self.samples, self.cursor, rows)
+
+        rows_delay = self.cursor_delay.read(reader.buffer_delay)
+        self._append(self.samples_delay, self.cursor_delay, rows_delay)
+
+        return rows
+
+    def pairs(self) -> np.ndarray:
+        return self.samples.rows()
+
+    def pairs_delay(self) -> np.ndarray:
+        return self.samples_delay.rows()
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
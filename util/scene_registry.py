@@ -0,0 +1,241 @@
+"""
+File: scene_registry.py
+Author: Chuncheng Zhang
+Date: 2026-10-18
+Copyright & Email: chuncheng.zhang@ia.ac.cn
+
+Purpose:
+    The registry of the lazily created animation scenes.
+    The scene is created in the background as it is first requested,
+    like its display mode is selected, or it is preloaded by the config.
+    The UI shows the placeholder until the scene is ready.
+    The attributes configured by the UI (the size, the ref. value and the thresholds)
+    are kept by the registry, so they are applied to the scenes created later.
+
+Functions:
+    1. Requirements and constants
+    2. Function and class
+    3. Play ground
+    4. Pending
+    5. Pending
+"""
+
+
+# %% ---- 2026-10-18 ------------------------
+# Requirements and constants
+import time
+import threading
+import traceback
+
+from PIL import Image, ImageDraw
+
+from . import logger
+from .asset_loader import timed
+from .automatic_animation import AutomaticAnimation
+from .animation_scheduler import animation_scheduler
+
+
+# %% ---- 2026-10-18 ------------------------
+# Function and class
+
+def make_placeholder(text: str, width: int, height: int) -> Image:
+    """
+    The placeholder image of the scene which is not ready.
+
+    Args:
+        text (str): The text;
+        width (int): The width;
+        height (int): The height.
+
+    Returns:
+        Image: The image.
+    """
+    img = Image.new(mode='RGB', size=(width, height))
+    draw = ImageDraw.Draw(img, mode='RGB')
+    draw.text((width//2, height//2), text,
+              font=AutomaticAnimation.font, anchor='mm', fill='gray')
+    return img
+
+
+class SceneRegistry(object):
+    """
+    The registry of the lazily created scenes.
+
+    @register(name, factory) (method): Register the factory of the scene;
+    @request(name) (method): Start creating the scene in the background, if it is not created or creating;
+    @preload(names) (method): Request the scenes;
+    @get(name) (method): The scene if it is ready, otherwise None and the scene is requested;
+    @configure(names, **attrs) (method): Set the attributes of the scenes, including the scenes created later;
+    @resize(width, height) (method): Prepare the ready scenes for the size in the background, the scenes created later use the size;
+    @ready(name) (method): Whether the scene is ready;
+    @loaded() (method): The ready scenes;
+    @wait(names, timeout) (method): Wait for the scenes to be ready or failed;
+    @failed (dict): The tracebacks of the scenes failed to be created, they are not requested again.
+    """
+
+    def __init__(self):
+        self.factories = {}
+        self.scenes = {}
+        self.attrs = {}
+        self.loading = set()
+        self.failed = {}
+        self._lock = threading.Lock()
+        logger.debug(f'Initialized {self.__class__}')
+
+    def register(self, name: str, factory):
+        """
+        Register the factory of the scene.
+
+        Args:
+            name (str): The name, it is the display mode of the scene;
+            factory (callable): It creates the scene, like the animation class.
+        """
+        self.factories[name] = factory
+        self.attrs.setdefault(name, {})
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.factories
+
+    def ready(self, name: str) -> bool:
+        return name in self.scenes
+
+    def loaded(self) -> dict:
+        with self._lock:
+            return dict(self.scenes)
+
+    def request(self, name: str):
+        """
+        Start creating the scene in the background, if it is not created or creating.
+
+        Args:
+            name (str): The name.
+        """
+        if name not in self.factories:
+            return
+
+        with self._lock:
+            if name in self.scenes or name in self.loading or name in self.failed:
+                return
+            self.loading.add(name)
+
+        threading.Thread(target=self._load, args=(name,),
+                         name=f'scene-{name}', daemon=True).start()
+        logger.debug(f'Requested scene {name}')
+
+    def preload(self, names: list):
+        for name in names:
+            if name not in self.factories:
+                logger.warning(f'Unknown scene to preload: {name}')
+                continue
+            self.request(name)
+
+    def get(self, name: str):
+        """
+        The scene if it is ready, otherwise None and the scene is requested.
+
+        Args:
+            name (str): The name.
+
+        Returns:
+            The scene or None.
+        """
+        scene = self.scenes.get(name)
+        if scene is None:
+            self.request(name)
+        return scene
+
+    def wait(self, names: list = None, timeout: float = None) -> bool:
+        """
+        Wait for the scenes to be ready or failed, they are requested if not.
+
+        Args:
+            names (list, optional): The names. Defaults to None, all the scenes;
+            timeout (float, optional): The timeout in seconds. Defaults to None, wait forever.
+
+        Returns:
+            bool: Whether the scenes are ready or failed before the timeout.
+        """
+        names = list(self.factories) if names is None else names
+        self.preload(names)
+
+        tic = time.perf_counter()
+        while not all(name in self.scenes or name in self.failed for name in names):
+            if timeout is not None and time.perf_counter() - tic > timeout:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def configure(self, names: list, **attrs):
+        """
+        Set the attributes of the scenes,
+        they are applied to the ready scenes and the scenes created later.
+
+        Args:
+            names (list): The names;
+            **attrs: The attributes.
+        """
+        with self._lock:
+            for name in names:
+                self.attrs[name].update(attrs)
+                scene = self.scenes.get(name)
+                if scene is not None:
+                    for k, v in attrs.items():
+                        setattr(scene, k, v)
+
+    def resize(self, width: int, height: int):
+        """
+        Prepare the ready scenes for the size by the animation scheduler,
+        they switch into the size as their resources are ready,
+        and the scenes created later use the size.
+
+        Args:
+            width (int): The width;
+            height (int): The height.
+        """
+        with self._lock:
+            for attrs in self.attrs.values():
+                attrs.update(width=width, height=height)
+            ready = list(self.scenes.values())
+
+        # Only the latest size matters
+        for scene in ready:
+            animation_scheduler.submit(
+                scene.prepare_size, width, height, key=(id(scene), 'prepare_size'))
+
+    def _load(self, name: str):
+        try:
+            with timed(f'scene {name}'):
+                scene = self.factories[name]()
+        except Exception:
+            logger.error(f'Failed creating scene {name}: {traceback.format_exc()}')
+            with self._lock:
+                self.failed[name] = traceback.format_exc()
+                self.loading.discard(name)
+            return
+
+        with self._lock:
+            attrs = dict(self.attrs[name])
+            for k, v in attrs.items():
+                setattr(scene, k, v)
+            self.scenes[name] = scene
+            self.loading.discard(name)
+
+        # The scene is prepared for the size it is resized into,
+        # so its first updates never resize the resources
+        if 'width' in attrs and 'height' in attrs:
+            animation_scheduler.submit(
+                scene.prepare_size, attrs['width'], attrs['height'], key=(id(scene), 'prepare_size'))
+
+        logger.info(f'Scene is ready: {name}')
+
+
+# %% ---- 2026-10-18 ------------------------
+# Play ground
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
+
+
+# %% ---- 2026-10-18 ------------------------
+# Pending
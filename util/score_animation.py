@@ -18,35 +18,40 @@ Functions:
 
 # %% ---- 2023-10-30 ------------------------
 # Requirements and constants
+import traceback
 import numpy as np
 
-from threading import Thread
 from PIL import Image, ImageDraw
 
 from tqdm.auto import tqdm
 
-from . import logger, root_path
+from . import logger, root_path, project_conf
 from .automatic_animation import AutomaticAnimation
+from .animation_scheduler import animation_scheduler
+from .frame_cache import FrameCache
+from .asset_loader import timed
+from .disk_frame_cache import disk_frame_cache
+from .frame_renderer import render_frames
+from .mipmap import MipmapPyramid
 
 
 # %% ---- 2023-10-30 ------------------------
 # Function and class
-def pil2rgb(img):
-    mat = np.array(img, dtype=np.uint8)
-    # mat = cv2.cvtColor(mat, cv2.COLOR_BGR2RGB)
-    return mat
-
-
 class ScoreAnimation(AutomaticAnimation):
     '''
     The pipeline of the animation is append the self.buffer using images.
     The self.gif_buffer store the animation images.
+
+    The rendered frames are cached with the key of (s, score, width, height),
+    the s is the score of the frame and the score is the target score in the text,
+    the frames of the next possible updates are built in the background,
+    so the update is only the cache lookups after warming up.
     '''
 
     # ? --------------------------------------------------------------------------------
-    # ? Potential problem:
-    # ? It causes image blinking as the resolution is changed,
-    # ? since the images had been created using the previous resolution.
+    # ? As the resolution is changed, the frames of the new resolution are built by the prepare_size,
+    # ? and the frames of the previous resolution are used until they are ready,
+    # ? so the image does not blink.
     # ? --------------------------------------------------------------------------------
 
     score_max = 100
@@ -56,12 +61,20 @@ class ScoreAnimation(AutomaticAnimation):
 
     resource_OK = False
 
-    gif = Image.open(root_path.joinpath('img/building.gif'))
-    # gif = Image.open(root_path.joinpath('img/giphy.gif'))
+    # The byte-budgeted LRU cache of the rendered frames
+    frame_cache = FrameCache(
+        int(project_conf['animation']['frame_cache_mb'] * 1024 * 1024))
+    # The score steps of the next updates, their frames are built in the background
+    warm_up_steps = list(project_conf['animation']['warm_up_steps'])
+
+    # The gif is opened as the scene is created
+    gif = None
 
     def __init__(self):
         super(ScoreAnimation, self).__init__()
         try:
+            self.gif = Image.open(root_path.joinpath('img/building.gif'))
+            # self.gif = Image.open(root_path.joinpath('img/giphy.gif'))
             self.gif_buffer = self.parse_gif()
             self.resource_OK = True
             logger.info('Loaded required resource')
@@ -72,14 +85,34 @@ class ScoreAnimation(AutomaticAnimation):
         self.reset()
 
     def parse_gif(self):
-        gif_buffer = []
-
+        """
+        Parse the gif into the gif_buffer.
+        The gif is decoded frame by frame in its order,
+        so it is not split into the pool, the repeated frames are converted once.
+        The converted frames are mapped from the disk cache if they are cached,
+        and every unique frame gets its mipmap pyramid to be resized from.
+        """
         n = self.gif.n_frames
 
-        for j in tqdm(range(100), 'Loading gif'):
-            self.gif.seek(int(j/2)+1)
-            # self.gif.seek(int(j/10))
-            gif_buffer.append(self.gif.convert('RGB'))
+        # One frame for every score in [0, score_max]
+        seeks = [int(j/2)+1 for j in range(self.score_max+1)]
+        # seeks = [int(j/10) for j in range(100)]
+        unique_seeks = sorted(set(seeks))
+
+        def _decode():
+            frames = []
+            for k in tqdm(unique_seeks, 'Loading gif'):
+                self.gif.seek(k)
+                frames.append(np.asarray(self.gif.convert('RGB')))
+            return np.stack(frames)
+
+        with timed('building.gif'):
+            stack = disk_frame_cache.load_stack(
+                'building-gif', [self.gif.filename], None, _decode,
+                variant=f'seeks-{unique_seeks}')
+            converted = {k: MipmapPyramid(stack[i])
+                         for i, k in enumerate(unique_seeks)}
+            gif_buffer = [converted[k] for k in seeks]
         logger.debug('Parsed gif into gif_buffer')
 
         return gif_buffer
@@ -102,15 +135,16 @@ class ScoreAnimation(AutomaticAnimation):
         """
 
         self.score = self.score_default if score is None else score
-        self.fifo_buffer = []
+        self.stop_playing()
 
         logger.debug(f'Score animation is reset, {self.score}, {score}')
 
         return self.score
 
     def pop_all(self):
-        frames = list(self.fifo_buffer)
-        self.fifo_buffer = []
+        with self._playback_lock:
+            frames = list(self.fifo_buffer)
+            self.fifo_buffer.clear()
         return frames
 
     def safe_update_score(self, step):
@@ -132,39 +166,129 @@ class ScoreAnimation(AutomaticAnimation):
         step = 1 if self.score < score else -1
 
         if self.fifo_buffer:
-            self.fifo_buffer = []
             logger.warning(
                 'The buffer is not empty, it means the animation is stopped by force')
 
-        for s in range(self.score, score + np.sign(step), step):
-            img = self.gif_buffer[s].copy()
-            img = img.resize((self.width, self.height))
+        # The size is fixed for the frames, since the UI may resize it in the meanwhile
+        width, height = self.width, self.height
 
-            # Make the drawer as draw
-            draw = ImageDraw.Draw(img, mode='RGB')
+        # The frames are rendered in the render pool and played as they are ready
+        frames = render_frames(self.get_frame, [
+            (s, score, width, height) for s in range(self.score, score + np.sign(step), step)])
 
-            # Draw the score text
-            draw.text(
-                self.scale((0.5, 0.1)),
-                f'-- 得分 {s} | {score} --',
-                font=self.font,
-                anchor='ms',
-                fill='red')
+        self.score = score
 
-            # Draw the score bar's background
-            draw.rectangle(
-                (self.scale((0.2, 0.9)), self.scale((0.8, 0.95))), outline='#331139')
+        self.play_stream(frames)
 
-            # Draw the score bar's foreground
-            draw.rectangle(
-                (self.scale((0.2, 0.9)), self.scale((0.2 + 0.6 * s / 100, 0.95))), fill='#331139')
+        # Only the warming up of the latest score matters,
+        # it runs in the background, so it never delays the next update
+        self._submit_warm_up(score, width, height)
 
-            # Append to the buffer
-            self.fifo_buffer.append(img)
+        logger.debug(f'Frame cache: {self.frame_cache.stats()}')
 
-        self.score = score
+    def get_frame(self, s: int, score: int, width: int, height: int) -> Image:
+        """
+        Get the frame from the cache, or render it if it is not cached.
+
+        Args:
+            s (int): The score of the frame;
+            score (int): The target score;
+            width (int): The width;
+            height (int): The height.
+
+        Returns:
+            Image: The frame, it is shared by the cache, DO NOT draw on it.
+        """
+        return self.frame_cache.get_or_make(
+            (s, score, width, height),
+            lambda: self.render_frame(s, score, width, height))
+
+    def render_frame(self, s: int, score: int, width: int, height: int) -> Image:
+        """
+        Render the frame.
+
+        Args:
+            s (int): The score of the frame;
+            score (int): The target score;
+            width (int): The width;
+            height (int): The height.
 
-        Thread(target=self.animating_loop, daemon=True).start()
+        Returns:
+            Image: The frame.
+        """
+        def scale(xy):
+            return (int(xy[0] * width), int(xy[1] * height))
+
+        # The pyramid resize makes the new image, so the gif_buffer is not touched
+        img = self.gif_buffer[s].resize((width, height))
+
+        # Make the drawer as draw
+        draw = ImageDraw.Draw(img, mode='RGB')
+
+        # Draw the score text
+        draw.text(
+            scale((0.5, 0.1)),
+            f'-- 得分 {s} | {score} --',
+            font=self.font,
+            anchor='ms',
+            fill='red')
+
+        # Draw the score bar's background
+        draw.rectangle(
+            (scale((0.2, 0.9)), scale((0.8, 0.95))), outline='#331139')
+
+        # Draw the score bar's foreground
+        draw.rectangle(
+            (scale((0.2, 0.9)), scale((0.2 + 0.6 * s / 100, 0.95))), fill='#331139')
+
+        return img
+
+    def _submit_warm_up(self, score: int, width: int, height: int):
+        animation_scheduler.submit(
+            self.warm_up, score, width, height, key=(id(self), 'warm_up'), background=True)
+
+    def warm_up(self, score: int, width: int, height: int):
+        """
+        Build the frames of the next possible updates into the cache.
+        It gives way to the pending jobs of the scheduler, and goes on as the background job after them,
+        the built frames are cached, so they are not built again.
+
+        Args:
+            score (int): The current score;
+            width (int): The width;
+            height (int): The height.
+        """
+        for step in self.warm_up_steps:
+            target = min(max(score + step, self.score_min), self.score_max)
+            if target == score:
+                continue
+            sign = 1 if score < target else -1
+            for s in range(score, target + sign, sign):
+                if animation_scheduler.yielding():
+                    self._submit_warm_up(score, width, height)
+                    return
+                self.get_frame(s, target, width, height)
+
+    def prepare_size(self, width: int, height: int):
+        """
+        Render the frames of the current and the next possible updates for the size,
+        and switch into the size as they are ready.
+        The warming up is the best effort, the size is switched even if it fails.
+
+        ! It is run by the animation scheduler.
+
+        Args:
+            width (int): The width;
+            height (int): The height.
+        """
+        if self.resource_OK:
+            try:
+                self.get_frame(self.score, self.score, width, height)
+                self.warm_up(self.score, width, height)
+            except Exception:
+                logger.error(
+                    f'Failed warming up for {(width, height)}: {traceback.format_exc()}')
+        super().prepare_size(width, height)
 
     def scale(self, xy: tuple) -> tuple:
         return self.scale_xy_ratio(xy)
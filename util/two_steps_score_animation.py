@@ -11,6 +11,7 @@ Purpose:
     - In the 2nd step, the standard value of the latest pressure values are calculated controlling the score;
         - If the standard value is lower than a threshold, increase the score;
         - If the standard value is higher than a threshold, decrease the score.
+    The scenes of the scorer are described in the conf/scenes, and rendered by the DeclarativeScene.
 
 Functions:
     1. Requirements and constants
@@ -23,17 +24,12 @@ Functions:
 
 # %% ---- 2024-04-17 ------------------------
 # Requirements and constants
-import contextlib
 import numpy as np
 
-from PIL import Image, ImageDraw
-from threading import Thread
-
 from typing import Any
-from tqdm.auto import tqdm
 
-from . import logger, project_conf, root_path
-from .automatic_animation import AutomaticAnimation
+from . import logger, project_conf
+from .declarative_scene import DeclarativeScene
 
 
 # %% ---- 2024-04-17 ------------------------
@@ -55,6 +51,7 @@ class TwoStepScorer(object):
     score_2nd_range = (0, 100)
 
     def __init__(self):
+        super(TwoStepScorer, self).__init__()
         self.reset_scores()
         logger.info("Initialized TwoStepScorer")
 
@@ -141,208 +138,22 @@ class TwoStepScorer(object):
 # --------------------------------------------------------------------------------
 
 
-class TwoStepScore_Animation_CatClimbsTree(TwoStepScorer, AutomaticAnimation):
-    images_2nd = []  # RGB PIL Images
-    update_score_locked = False
-    resource_OK = False
-
-    def __init__(self):
-        super(TwoStepScore_Animation_CatClimbsTree, self).__init__()
-        try:
-            self.load_cat_climbs_tree_resources()
-            self.resource_OK = True
-            logger.info('Loaded required resource')
-        except Exception as err:
-            self.resource_traceback = f'{err}'
-            logger.error('Failed loading required resources')
-
-    def reset(self):
-        self.fifo_buffer = []
-        self.reset_scores()
-
-    def load_cat_climbs_tree_resources(self):
-        name = 'cat-climbs-tree'
-        folder = root_path.joinpath(f'img/{name}')
-
-        # --------------------
-        # ! The relative small size of the image
-        # ! The aim is to minimize the working load of the imaging
-        image_size = (self.width, self.height)
-
-        # --------------------
-        # Load frames
-        n = 60
-        # n = 6
-        self.images_2nd = []
-        for j in tqdm(range(n), f'Loading frames: {name}'):
-            img = Image.open(folder.joinpath(f'frames/{j+1}.jpg'))
-            self.images_2nd.append(img)
-        logger.debug(f'Loaded {n} frames of {name}')
-
-        # --------------------
-        # Load the land image
-        land_image = Image.open(folder.joinpath('parts/land-only.jpg'))
-        logger.debug('Loaded land image')
-
-        # --------------------
-        # Load tree image and generate its mask
-        tree_image = Image.open(
-            folder.joinpath('parts/tree-only.jpg'))
-        logger.debug('Loaded tree image')
-
-        # Create mask for the submarine
-        mat = np.array(tree_image.convert('L'))
-        _mat = mat.copy()
-        mat[_mat < 250] = 255
-        mat[_mat >= 250] = 0
-        tree_mask = Image.fromarray(mat, mode='L')
-        logger.debug('Generated submarine image')
-
-        # --------------------
-        # Load blue and red circle
-        blue_circle_image = Image.open(folder.joinpath(
-            'parts/blue-circle.png')).convert('RGBA')
-        logger.debug('Loaded blue circle image')
-        red_circle_image = Image.open(folder.joinpath(
-            'parts/red-circle.png')).convert('RGBA')
-        logger.debug('Loaded red circle image')
-
-        # --------------------
-        # Mark the red colored circle in the land_image
-        land_image.paste(tree_image, (0, 0), tree_mask)
-        land_image.paste(red_circle_image, (0, 0), red_circle_image)
-
-        # --------------------
-        # Update variables
-        logger.debug('Resizing resources')
-
-        def _resize(i):
-            self.images_2nd[i] = self.images_2nd[i].resize(image_size)
-
-        ts = []
-
-        for i in range(len(self.images_2nd)):
-            t = Thread(target=_resize, args=(i,), daemon=True)
-            t.start()
-            ts.append(t)
-
-        for t in ts:
-            t.join()
-
-        # self.images_2nd = [e.resize(image_size) for e in tqdm(self.images_2nd)]
-        self.image_size = image_size
-        self.land_image = land_image.resize(image_size)
-        self.tree_image = tree_image.resize(image_size)
-        self.tree_mask = tree_mask.resize(image_size)
-        self.blue_circle_image = blue_circle_image.resize(image_size)
-        self.red_circle_image = red_circle_image.resize(image_size)
-        logger.debug('Resized resources')
-
-    @contextlib.contextmanager
-    def _lock_me(self):
-        try:
-            self.update_score_locked = True
-            yield
-        finally:
-            self.update_score_locked = False
-
-    def update_score(self, data: Any = None, block_name: str = 'Real'):
-        if self.update_score_locked:
-            logger.warning('Update score is locked')
-            return
-
-        with self._lock_me():
-            # Update score within this sub-class,
-            # incase it interfaces with the animation
-            state_before = self.get_current_state()
-
-            # If received no data, the state is unchanged,
-            # the state_after equals to state_before
-            state_after = state_before if data is None else self._update_score(
-                data)
-
-            logger.debug(f'Updated state from {state_before} to {state_after}')
-
-            self.mk_frames(state_before, state_after, block_name)
-
-    def mk_frames(self, state_before, state_after, block_name='Real'):
-
-        n_frames = 10
-
-        image_size = (self.width, self.height)
+class TwoStepScene(TwoStepScorer, DeclarativeScene):
+    """
+    The two-step scene, its frames are rendered from the scene description,
+    the '1st' and '2nd' states of the description are chosen by the scorer.
 
-        flag_hide_block = block_name == 'Hide'
+    @update_score(data, block_name) (method): Update the score and make the frames;
+    @resource_OK (bool): Whether the resources are loaded;
+    @resource_traceback (str): The error of loading the resources.
+    """
 
-        if flag_hide_block:
-            self.fifo_buffer.append(self.land_image.copy().resize(image_size))
-
-        # --------------------
-        # The 2nd state
-        # Only choose the frames to display
-        if not flag_hide_block and state_after['state'] == '2nd':
-            score1 = state_before['score_2nd']
-            score2 = state_after['score_2nd']
-            diff = score2 - score1
-
-            n = len(self.images_2nd)-1
-
-            # Handle the both conditions of diff == 0 and diff != 0
-            for score in [score1] if diff == 0 else np.arange(score1, score2+diff/n_frames/2, diff/n_frames):
-                idx = int((n-1) * score / self.score_2nd_range[1])
-                img = self.images_2nd[idx].copy()
-                img.paste(self.red_circle_image, (0, 0), self.red_circle_image)
-                img.paste(
-                    self.blue_circle_image, (0, 0), self.blue_circle_image)
-
-                self.fifo_buffer.append(img.resize(image_size))
-
-        # --------------------
-        # The 1st state
-        # Put the submarine on the correct position
-        if not flag_hide_block and state_after['state'] == '1st':
-            score1 = state_before['score_1st']
-            score2 = state_after['score_1st']
-
-            diff = score2 - score1
-
-            score_scale = 100  # g
-            _, height = self.tree_image.size
-            max_d_height = height * 0.2
-
-            # Handle the both conditions of diff == 0 and diff != 0
-            for score in [score1] if diff == 0 else np.arange(score1, score2+diff/n_frames/2, diff/n_frames):
-                img = self.land_image.copy()
-                # img.paste(self.tree_image, (0, 0), self.tree_mask)
-
-                # --------------------
-                # score -> infinity, dy -> 1
-                # score -> 0, dy -> 0
-                dy = -score / score_scale
-                # img.paste(self.red_circle_image, (0, 0), self.red_circle_image)
-                img.paste(
-                    self.blue_circle_image,
-                    (0, int(dy * max_d_height)),
-                    self.blue_circle_image)
-
-                img = img.resize(image_size)
-                self.fifo_buffer.append(img)
-
-        Thread(target=self.animating_loop, daemon=True).start()
-
-    def scale(self, xy: tuple) -> tuple:
-        return self.scale_xy_ratio(xy)
-# --------------------------------------------------------------------------------
-
-
-class TwoStepScore_Animation_CatLeavesSubmarine(TwoStepScorer, AutomaticAnimation):
-    images_2nd = []  # RBG PIL images
-    update_score_locked = False
     resource_OK = False
 
     def __init__(self):
-        super(TwoStepScore_Animation_CatLeavesSubmarine, self).__init__()
+        super(TwoStepScene, self).__init__()
         try:
-            self.load_cat_leaves_submarine_resources()
+            self.load_scene()
             self.resource_OK = True
             logger.info('Loaded required resource')
         except Exception as err:
@@ -350,162 +161,43 @@ class TwoStepScore_Animation_CatLeavesSubmarine(TwoStepScorer, AutomaticAnimatio
             logger.error('Failed loading required resources')
 
     def reset(self):
-        self.fifo_buffer = []
+        self.stop_playing()
         self.reset_scores()
 
-    def load_cat_leaves_submarine_resources(self):
-        name = 'cat-leaves-submarine'
-        folder = root_path.joinpath(f'img/{name}')
-
-        # --------------------
-        # ! The relative small size of the image
-        # ! The aim is to minimize the working load of the imaging
-        image_size = (self.width, self.height)
-
-        # --------------------
-        # Load frames
-        n = 60
-        # n = 6
-        self.images_2nd = []
-        for j in tqdm(range(n), f'Loading frames: {name}'):
-            img = Image.open(folder.joinpath(f'frames/{j+1}.jpg'))
-            self.images_2nd.append(img)
-        logger.debug(f'Loaded {n} frames of {name}')
-
-        # --------------------
-        # Load the ocean image
-        ocean_image = Image.open(folder.joinpath('parts/ocean-only.jpg'))
-        logger.debug('Loaded ocean image')
-
-        # --------------------
-        # Load submarine image and generate its mask
-        submarine_image = Image.open(
-            folder.joinpath('parts/submarine-only.jpg'))
-        logger.debug('Loaded submarine image')
-
-        # --------------------
-        # Create mask for the submarine
-        mat = np.array(submarine_image.convert('L'))
-        _mat = mat.copy()
-        mat[_mat < 250] = 255
-        mat[_mat >= 250] = 0
-        submarine_mask = Image.fromarray(mat, mode='L')
-        logger.debug('Generated submarine image')
-
-        # --------------------
-        # Update variables
-        logger.debug('Resizing resources')
-
-        def _resize(i):
-            self.images_2nd[i] = self.images_2nd[i].resize(image_size)
-
-        ts = []
-
-        for i in range(len(self.images_2nd)):
-            t = Thread(target=_resize, args=(i,), daemon=True)
-            t.start()
-            ts.append(t)
-
-        for t in ts:
-            t.join()
-
-        # self.images_2nd = [e.resize(image_size) for e in tqdm(self.images_2nd)]
-        self.image_size = image_size
-        self.ocean_image = ocean_image.resize(image_size)
-        self.submarine_image = submarine_image.resize(image_size)
-        self.submarine_mask = submarine_mask.resize(image_size)
-        logger.debug('Resized resources')
-
-    @contextlib.contextmanager
-    def _lock_me(self):
-        try:
-            self.update_score_locked = True
-            yield
-        finally:
-            self.update_score_locked = False
-
     def update_score(self, data: Any = None, block_name: str = 'Real'):
-        if self.update_score_locked:
-            logger.warning('Update score is locked')
-            return
+        """
+        Update the score and make the frames.
 
-        with self._lock_me():
-            # Update score within this sub-class,
-            # incase it interfaces with the animation
-            state_before = self.get_current_state()
+        ! It is run by the animation scheduler,
+        ! so the updates are in order and never overlapped.
+        """
+        # Update score within this sub-class,
+        # incase it interfaces with the animation
+        state_before = self.get_current_state()
 
-            # If received no data, the state is unchanged,
-            # the state_after equals to state_before
-            state_after = state_before if data is None else self._update_score(
-                data)
+        # If received no data, the state is unchanged,
+        # the state_after equals to state_before
+        state_after = state_before if data is None else self._update_score(
+            data)
 
-            logger.debug(f'Updated state from {state_before} to {state_after}')
-            self.mk_frames(state_before, state_after, block_name)
+        logger.debug(f'Updated state from {state_before} to {state_after}')
 
-    def mk_frames(self, state_before, state_after, block_name='Real'):
+        self.mk_frames(state_before, state_after, block_name)
 
-        n_frames = 10
-
-        image_size = (self.width, self.height)
-
-        flag_hide_block = block_name == 'Hide'
+    def scale(self, xy: tuple) -> tuple:
+        return self.scale_xy_ratio(xy)
 
-        if flag_hide_block:
-            self.fifo_buffer.append(self.ocean_image.copy().resize(image_size))
+# --------------------------------------------------------------------------------
 
-        # --------------------
-        # The 2nd state
-        # Only choose the frames to display
-        if not flag_hide_block and state_after['state'] == '2nd':
-            score1 = state_before['score_2nd']
-            score2 = state_after['score_2nd']
-            diff = score2 - score1
 
-            n = len(self.images_2nd)-1
+class TwoStepScore_Animation_CatClimbsTree(TwoStepScene):
+    scene_file = 'cat-climbs-tree.yaml'
 
-            # Handle the both conditions of diff == 0 and diff != 0
-            for score in [score1] if diff == 0 else np.arange(score1, score2+diff/n_frames/2, diff/n_frames):
-                idx = int((n-1) * score / self.score_2nd_range[1])
-                img = self.images_2nd[idx].resize(image_size)
-                self.fifo_buffer.append(img)
+# --------------------------------------------------------------------------------
 
-        # --------------------
-        # The 1st state
-        # Put the submarine on the correct position
-        if not flag_hide_block and state_after['state'] == '1st':
-            score1 = state_before['score_1st']
-            score2 = state_after['score_1st']
-
-            # At least make the score2 of the same sign with the score1,
-            # it prevents the submarine up and down
-            if score1 * score2 < 0:
-                score2 *= -1
-
-            diff = score2 - score1
-
-            score_scale = 100  # g
-            _, height = self.submarine_image.size
-            max_d_height = height * 0.2
-
-            # Handle the both conditions of diff == 0 and diff != 0
-            for score in [score1] if diff == 0 else np.arange(score1, score2+diff/n_frames/2, diff/n_frames):
-                img = self.ocean_image.copy()
-                # --------------------
-                # score -> infinity, dy -> 1
-                # score -> 0, dy -> 0
-                dy = (1 - np.exp(-np.abs(score / score_scale)))
-                img.paste(
-                    self.submarine_image,
-                    (0, int(dy * max_d_height)),
-                    self.submarine_mask)
-                img = img.resize(image_size)
-
-                self.fifo_buffer.append(img)
-
-        Thread(target=self.animating_loop, daemon=True).start()
 
-    def scale(self, xy: tuple) -> tuple:
-        return self.scale_xy_ratio(xy)
+class TwoStepScore_Animation_CatLeavesSubmarine(TwoStepScene):
+    scene_file = 'cat-leaves-submarine.yaml'
 
 
 # %% ---- 2024-04-17 ------------------------